@@ -203,86 +203,78 @@ function updateChipGroup(filterName, activeChip) {
 
 async function loadStats() {
     try {
-        // 활성 시장만 (end_date >= now)
-        const now = new Date().toISOString();
-
-        const [totalRes, translatedRes, hiddenRes] = await Promise.all([
-            supabaseClient.from('poly_events')
-                .select('id', { count: 'exact', head: true })
-                .gte('end_date', now)
-                .eq('closed', false),
-            supabaseClient.from('poly_events')
-                .select('id', { count: 'exact', head: true })
-                .gte('end_date', now)
-                .eq('closed', false)
-                .not('title_ko', 'is', null),
-            supabaseClient.from('poly_events')
-                .select('id', { count: 'exact', head: true })
-                .gte('end_date', now)
-                .eq('hidden', true),
-        ]);
-
-        const total = totalRes.count || 0;
-        const translated = translatedRes.count || 0;
-        const hidden = hiddenRes.count || 0;
-
-        document.getElementById('statTotal').textContent = total.toLocaleString();
-        document.getElementById('statTranslated').textContent = translated.toLocaleString();
-        document.getElementById('statUntranslated').textContent = (total - translated).toLocaleString();
-        document.getElementById('statHidden').textContent = hidden.toLocaleString();
+        // 활성 시장 통계 행 1개 (poly_events_stats) - 읽기만 함
+        // 집계는 ETL(service_role)이 실행마다 갱신 (hot 갱신 포함 약 10분 주기), 관리자 수정은 다음 갱신 때 반영
+        const { data, error } = await supabaseClient.from('poly_events_stats').select('*').eq('id', 1).maybeSingle();
+
+        if (error) throw error;
+        const stats = data || {};
+
+        document.getElementById('statTotal').textContent = (stats.total || 0).toLocaleString();
+        document.getElementById('statTranslated').textContent = (stats.translated || 0).toLocaleString();
+        document.getElementById('statUntranslated').textContent = (stats.untranslated || 0).toLocaleString();
+        document.getElementById('statHidden').textContent = (stats.hidden || 0).toLocaleString();
+        document.getElementById('adminStats').title = stats.refreshed_at
+            ? `집계 시각: ${new Date(stats.refreshed_at).toLocaleString('ko-KR')}`
+            : '';
     } catch (err) {
         console.error('Stats load error:', err);
     }
 }
 
-async function loadData() {
-    const loading = document.getElementById('loadingIndicator');
-    loading.style.display = 'block';
+function buildEventsQuery() {
+    const now = new Date().toISOString();
 
-    try {
-        const now = new Date().toISOString();
+    let query = supabaseClient
+        .from('poly_events')
+        .select('id, title, title_ko, slug, event_slug, category, volume, end_date, hidden, description, description_ko, tags', { count: 'exact' })
+        .gte('end_date', now)
+        .eq('closed', false);
 
-        let query = supabaseClient
-            .from('poly_events')
-            .select('id, title, title_ko, slug, event_slug, category, volume, end_date, hidden, description, description_ko, tags', { count: 'exact' })
-            .gte('end_date', now)
-            .eq('closed', false);
+    // 필터 적용 (제외된 카테고리)
+    if (excludedCategories.length > 0) {
+        query = query.not('category', 'in', `(${excludedCategories.join(',')})`);
+    }
+    if (translationFilter === 'translated') {
+        query = query.not('title_ko', 'is', null);
+    } else if (translationFilter === 'untranslated') {
+        query = query.is('title_ko', null);
+    }
+    if (hiddenFilter === 'visible') {
+        query = query.eq('hidden', false);
+    } else if (hiddenFilter === 'hidden') {
+        query = query.eq('hidden', true);
+    }
 
-        // 필터 적용 (제외된 카테고리)
-        if (excludedCategories.length > 0) {
-            query = query.not('category', 'in', `(${excludedCategories.join(',')})`);
-        }
-        if (translationFilter === 'translated') {
-            query = query.not('title_ko', 'is', null);
-        } else if (translationFilter === 'untranslated') {
-            query = query.is('title_ko', null);
-        }
-        if (hiddenFilter === 'visible') {
-            query = query.eq('hidden', false);
-        } else if (hiddenFilter === 'hidden') {
-            query = query.eq('hidden', true);
-        }
+    // 텍스트 검색: 제목/번역 부분 문자열 — 특수문자 이스케이프
+    // (pg_trgm GIN 인덱스로 조회, etl/migration.sql 8번 — 단어 중간/특수문자 검색어도 그대로 찾음)
+    if (searchQuery) {
+        const safeQ = searchQuery.replace(/[%_\\]/g, c => '\\' + c);
+        query = query.or(`title.ilike.%${safeQ}%,title_ko.ilike.%${safeQ}%`);
+    }
 
-        // 텍스트 검색 (ilike) — 특수문자 이스케이프
-        if (searchQuery) {
-            const safeQ = searchQuery.replace(/[%_\\]/g, c => '\\' + c);
-            query = query.or(`title.ilike.%${safeQ}%,title_ko.ilike.%${safeQ}%`);
-        }
+    // 정렬
+    if (sortField === 'volume') {
+        query = query.order('volume', { ascending: false });
+    } else if (sortField === 'end_date') {
+        query = query.order('end_date', { ascending: true });
+    } else if (sortField === 'title') {
+        query = query.order('title', { ascending: true });
+    }
 
-        // 정렬
-        if (sortField === 'volume') {
-            query = query.order('volume', { ascending: false });
-        } else if (sortField === 'end_date') {
-            query = query.order('end_date', { ascending: true });
-        } else if (sortField === 'title') {
-            query = query.order('title', { ascending: true });
-        }
+    // 페이지네이션
+    const from = (currentPage - 1) * PAGE_SIZE;
+    query = query.range(from, from + PAGE_SIZE - 1);
+
+    return query;
+}
 
-        // 페이지네이션
-        const from = (currentPage - 1) * PAGE_SIZE;
-        query = query.range(from, from + PAGE_SIZE - 1);
+async function loadData() {
+    const loading = document.getElementById('loadingIndicator');
+    loading.style.display = 'block';
 
-        const { data, error, count } = await query;
+    try {
+        const { data, error, count } = await buildEventsQuery();
         if (error) throw error;
 
         adminEvents = data || [];
@@ -417,7 +409,6 @@ async function toggleHidden(eventId, hidden) {
         invalidateCalendarCache();
 
         showToast(hidden ? '시장이 숨김 처리되었습니다' : '시장이 노출되었습니다', 'success');
-        loadStats();
     } catch (err) {
         showToast('오류: ' + err.message, 'error');
     }
@@ -469,6 +460,13 @@ async function saveEdit() {
             description_ko: document.getElementById('editDescriptionKo').value.trim() || null,
         };
 
+        // 수기 수정한 번역은 LLM 원본(title_ko_raw)과 달라지므로 재후처리 대상에서 제외
+        const original = adminEvents.find(e => e.id === editingEventId);
+        if (!original || original.title_ko !== updates.title_ko) {
+            updates.title_ko_raw = null;
+            updates.postprocess_version = null;
+        }
+
         const { error } = await supabaseClient
             .from('poly_events')
             .update(updates)
@@ -484,7 +482,6 @@ async function saveEdit() {
         invalidateCalendarCache();
         closeEditModal();
         showToast('저장 완료', 'success');
-        loadStats();
     } catch (err) {
         showToast('저장 실패: ' + err.message, 'error');
     } finally {
@@ -93,6 +93,17 @@ let tempFilters = { ...filters };
 // All available tags with counts
 let allTags = {};
 
+// 태그 차원 테이블 (poly_tags, etl/migration.sql 8번): 태그 이름 → { id, count(진행 중 시장 수) }
+// 필터 목록 정렬과 서버 검색의 tag_ids에 사용 (없으면 로드된 이벤트 기준으로만 동작)
+let tagIndex = {};
+
+// 서버 인덱스 검색 결과 (search_poly_events RPC, etl/migration.sql 8번)
+// 검색어의 부분 문자열 비교에 더해지는 결과(단어 순서 무관 접두사 일치) — key가 현재 검색어/태그/로드 기간과 같을 때만 사용
+let serverMatch = { key: null, ids: null };
+let serverMatchSeq = 0;
+let searchDebounceTimer = null;
+const SEARCH_DEBOUNCE_MS = 250;
+
 // All available categories with counts
 let allCategories = {};
 
@@ -141,6 +152,7 @@ document.addEventListener('DOMContentLoaded', async () => {
     initQuickFilters();
     initTooltip();
     setupEventListeners();
+    await loadTagIndex();
     await loadData();
     updateActiveFiltersDisplay(); // 기본 필터 UI 표시
     renderCalendar();
@@ -240,7 +252,13 @@ function setupEventListeners() {
 
     // Search
     document.getElementById('searchInput').addEventListener('input', (e) => {
-        renderCalendar(e.target.value);
+        clearTimeout(searchDebounceTimer);
+        const query = e.target.value;
+        if (!supabaseClient) {
+            renderCalendar(query);
+            return;
+        }
+        searchDebounceTimer = setTimeout(() => renderCalendarWithIndex(query), SEARCH_DEBOUNCE_MS);
     });
 
     // Filter row click -> open filter modal
@@ -578,6 +596,8 @@ function groupSimilarMarkets(events) {
             // 총 거래량 저장 (UI 표시용)
             best._totalVolume = totalVolume;
             best._groupSize = group.length;
+            // 그룹 시장 id (서버 검색 결과는 시장 단위라 그룹 중 하나라도 맞으면 표시)
+            best._groupIds = group.map(e => e.id);
 
             deduplicated.push(best);
         }
@@ -711,6 +731,28 @@ async function loadData() {
     }
 }
 
+async function loadTagIndex() {
+    if (!supabaseClient) return;
+
+    try {
+        const { data, error } = await supabaseClient
+            .from('poly_tags')
+            .select('id, name, market_count')
+            .gt('market_count', 0)
+            .order('market_count', { ascending: false })
+            .limit(1000);
+        if (error) throw error;
+
+        tagIndex = {};
+        (data || []).forEach(tag => {
+            tagIndex[tag.name] = { id: tag.id, count: tag.market_count };
+        });
+        console.log('🏷️ 태그 인덱스 로드:', Object.keys(tagIndex).length, '개');
+    } catch (error) {
+        console.warn('⚠️ 태그 인덱스 로드 실패, 로드된 이벤트 기준 태그 사용:', error);
+    }
+}
+
 function extractTags() {
     allTags = {};
     allEvents.forEach(event => {
@@ -723,9 +765,10 @@ function extractTags() {
         }
     });
 
-    // Sort by count
+    // Sort by count (태그 인덱스가 있으면 전체 진행 중 시장 수 순, 표시 숫자는 로드된 이벤트 수)
+    const globalCount = tag => tagIndex[tag]?.count ?? 0;
     const sortedTags = Object.entries(allTags)
-        .sort((a, b) => b[1] - a[1])
+        .sort((a, b) => globalCount(b[0]) - globalCount(a[0]) || b[1] - a[1])
         .reduce((obj, [key, value]) => {
             obj[key] = value;
             return obj;
@@ -947,7 +990,7 @@ function applyFilters() {
     closeFilterModal();
     updateQuickFilterChips();
     updateActiveFiltersDisplay();
-    renderCalendar();
+    renderCalendarWithIndex();
 }
 
 function resetFilters() {
@@ -1054,11 +1097,68 @@ function updateActiveFiltersDisplay() {
             }
 
             updateActiveFiltersDisplay();
-            renderCalendar();
+            renderCalendarWithIndex();
         });
     });
 }
 
+// 로드된 이벤트의 가장 늦은 마감 시각 (loadMoreData로 늘어난 기간 포함)
+function loadedRangeEnd() {
+    let maxEnd = 0;
+    allEvents.forEach(e => {
+        const end = new Date(e.end_date).getTime();
+        if (end > maxEnd) maxEnd = end;
+    });
+    return maxEnd ? new Date(maxEnd).toISOString() : null;
+}
+
+// 선택한 태그의 poly_tags id (인덱스에 없는 태그가 하나라도 있으면 null → 서버는 태그로 거르지 않음)
+function selectedTagIds() {
+    if (filters.tags.length === 0) return null;
+    const ids = filters.tags.map(tag => tagIndex[tag]?.id);
+    return ids.every(id => id !== undefined) ? ids.sort((a, b) => a - b) : null;
+}
+
+function serverMatchKey(searchQuery = '') {
+    return JSON.stringify([searchQuery.trim().toLowerCase(), selectedTagIds(), loadedRangeEnd()]);
+}
+
+// 검색어에 맞는 시장 id를 서버 인덱스(tsvector + tags GIN)에서 조회
+// 태그 필터는 로드된 이벤트의 tags로 정확히 비교하므로, tag_ids는 돌려받는 id 수를 줄이는 용도
+async function refreshServerMatch(searchQuery = '') {
+    const key = serverMatchKey(searchQuery);
+    if (!supabaseClient || !searchQuery.trim() || serverMatch.key === key) {
+        return;
+    }
+
+    const seq = ++serverMatchSeq;
+
+    try {
+        const { data, error } = await supabaseClient.rpc('search_poly_events', {
+            q: searchQuery.trim(),
+            tag_ids: selectedTagIds(),
+            max_end: loadedRangeEnd()
+        });
+        if (error) throw error;
+        if (seq === serverMatchSeq) {
+            serverMatch = { key, ids: new Set(data || []) };
+        }
+    } catch (error) {
+        console.warn('⚠️ 서버 검색 실패, 클라이언트 필터 사용:', error);
+    }
+}
+
+function getServerMatchIds(searchQuery = '') {
+    return serverMatch.key === serverMatchKey(searchQuery) ? serverMatch.ids : null;
+}
+
+async function renderCalendarWithIndex(searchQuery = '') {
+    const seq = serverMatchSeq;
+    await refreshServerMatch(searchQuery);
+    if (serverMatchSeq > seq + 1) return; // 그 사이 더 새로운 검색이 시작됨
+    renderCalendar(searchQuery);
+}
+
 function getFilteredEvents(searchQuery = '') {
     let filtered = [...allEvents];
     const now = new Date();
@@ -1104,13 +1204,16 @@ function getFilteredEvents(searchQuery = '') {
         filtered = filtered.filter(e => parseFloat(e.volume) * 0.1 >= filters.minLiquidity);
     }
 
-    // Apply search
+    // Apply search: 부분 문자열 일치 + 서버 인덱스 일치 (그룹 시장은 하나라도 맞으면 표시)
+    // 서버 결과가 없거나(데모 데이터, 조회 실패, 조회 전) 일부만 맞아도 부분 문자열 비교는 항상 적용
     if (searchQuery) {
         const query = searchQuery.toLowerCase();
+        const matchedIds = getServerMatchIds(searchQuery);
         filtered = filtered.filter(e =>
             e.title?.toLowerCase().includes(query) ||
             e.title_ko?.toLowerCase().includes(query) ||
-            e.category?.toLowerCase().includes(query)
+            e.category?.toLowerCase().includes(query) ||
+            (matchedIds && (e._groupIds || [e.id]).some(id => matchedIds.has(id)))
         );
     }
 
@@ -2052,24 +2155,16 @@ async function v2HandleSignOut() {
 
 async function v2LoadStats() {
     try {
-        const now = new Date().toISOString();
-        const [totalRes, translatedRes, hiddenRes] = await Promise.all([
-            supabaseClient.from('poly_events')
-                .select('id', { count: 'exact', head: true })
-                .gte('end_date', now).eq('closed', false),
-            supabaseClient.from('poly_events')
-                .select('id', { count: 'exact', head: true })
-                .gte('end_date', now).eq('closed', false)
-                .not('title_ko', 'is', null),
-            supabaseClient.from('poly_events')
-                .select('id', { count: 'exact', head: true })
-                .gte('end_date', now).eq('hidden', true),
-        ]);
-        const total = totalRes.count || 0;
-        const translated = translatedRes.count || 0;
-        const hidden = hiddenRes.count || 0;
+        // 통계 행 1개 (poly_events_stats) 읽기만 - 집계는 ETL이 실행마다 갱신, 관리자 수정은 다음 갱신 때 반영
+        const { data, error } = await supabaseClient.from('poly_events_stats').select('*').eq('id', 1).maybeSingle();
+        if (error) throw error;
+        const stats = data || {};
+        const total = stats.total || 0;
+        const translated = stats.translated || 0;
+        const untranslated = stats.untranslated || 0;
+        const hidden = stats.hidden || 0;
         document.getElementById('v2StatInfo').textContent =
-            `전체 ${total.toLocaleString()} | 번역 ${translated.toLocaleString()} | 미번역 ${(total - translated).toLocaleString()} | 숨김 ${hidden.toLocaleString()}`;
+            `전체 ${total.toLocaleString()} | 번역 ${translated.toLocaleString()} | 미번역 ${untranslated.toLocaleString()} | 숨김 ${hidden.toLocaleString()}`;
     } catch (e) {
         console.error('Admin stats error:', e);
     }
@@ -2164,6 +2259,13 @@ async function v2SaveEdit() {
             description_ko: document.getElementById('v2EditDescriptionKo').value.trim() || null,
         };
 
+        // 수기 수정한 번역은 LLM 원본(title_ko_raw)과 달라지므로 재후처리 대상에서 제외
+        const original = allEvents.find(e => e.id === v2EditingEventId);
+        if (!original || original.title_ko !== updates.title_ko) {
+            updates.title_ko_raw = null;
+            updates.postprocess_version = null;
+        }
+
         const { error } = await supabaseClient
             .from('poly_events')
             .update(updates)
@@ -2178,7 +2280,6 @@ async function v2SaveEdit() {
         renderCalendar();
         v2CloseEditModal();
         v2ShowToast('저장 완료', 'success');
-        v2LoadStats();
 
         // 캐시 무효화 (로컬 + 서버)
         localStorage.removeItem('polymarket_events_cache');
@@ -2208,7 +2309,6 @@ async function v2ToggleHidden(eventId) {
         event.hidden = newHidden;
         renderCalendar();
         v2ShowToast(newHidden ? '숨김 처리됨' : '노출됨', 'success');
-        v2LoadStats();
 
         // 캐시 무효화 (로컬 + 서버)
         localStorage.removeItem('polymarket_events_cache');
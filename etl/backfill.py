@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Polymarket 기존 데이터 백필 (Backfill)
+
+카테고리 키워드나 번역 후처리 규칙을 바꾼 뒤, 이미 저장된 전체 행에 다시 적용한다.
+  - poly_events를 id 순서로 페이지 단위 스트리밍 (전체를 메모리에 올리지 않음)
+  - CPU 작업(카테고리 추론, 후처리)은 프로세스 풀에서 청크 단위 병렬 처리
+  - 계산 결과가 달라진 행만 DB에 다시 저장
+
+사용법:
+    # 카테고리 재추론 (Uncategorized 행만 다시 추론)
+    python backfill.py --recategorize
+
+    # 저장된 카테고리를 무시하고 제목 + 태그로 전체 재추론
+    # 주의: API가 준 카테고리로 저장된 행도 키워드 추론 값으로 덮어씀
+    #       (DB에는 API 원본 카테고리를 따로 저장하지 않아 추론 값과 구분할 수 없음,
+    #        진행 중 시장은 다음 전체 ETL에서 API 카테고리로 다시 덮어써짐)
+    python backfill.py --recategorize --force-infer
+
+    # 번역 후처리 재적용 (용어집/문화 맥락 사전 변경 후)
+    # 이전 규칙 버전으로 처리된 행만 LLM 원본(title_ko_raw)에서 다시 후처리 (API 호출 없음)
+    # 원본이 없는 행(관리자 수기 수정 등)은 건드리지 않음
+    python backfill.py --postprocess
+
+    # 8프로세스, 변경 건수만 확인 (DB 미반영)
+    python backfill.py --recategorize --postprocess --processes 8 --dry-run
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import argparse
+from typing import List, Dict, Iterator, Callable, TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from main import load_env, infer_category_from_title
+from postprocess import postprocess_translation, RULES_VERSION
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+# 설정값
+PAGE_SIZE = 1000      # 스트리밍 페이지 크기 = 프로세스 풀 청크 크기
+WRITE_BATCH_SIZE = 500
+MAX_RETRIES = 3
+
+
+def stream_rows(client: Client, columns: str, page_size: int = PAGE_SIZE,
+                filters: Callable = None) -> Iterator[List[Dict]]:
+    """poly_events를 id 기준 keyset 페이지네이션으로 스트리밍 (offset 스캔 없음)"""
+    last_id = None
+    while True:
+        query = client.table('poly_events').select(columns)
+        if filters:
+            query = filters(query)
+        if last_id is not None:
+            query = query.gt('id', last_id)
+        response = query.order('id').limit(page_size).execute()
+
+        if not response.data:
+            break
+
+        yield response.data
+        last_id = response.data[-1]['id']
+
+        if len(response.data) < page_size:
+            break
+
+
+def compute_changes(rows: List[Dict], recategorize: bool, force_infer: bool,
+                    postprocess: bool) -> List[Dict]:
+    """
+    청크 하나의 재계산 (프로세스 풀 워커)
+
+    Returns:
+        값이 달라진 행의 upsert payload (키 구성은 모든 행이 동일)
+    """
+    changes = []
+    for row in rows:
+        payload = {'id': row['id'], 'title': row['title']}
+        changed = False
+
+        if recategorize:
+            current = row.get('category')
+            category = infer_category_from_title(
+                row['title'],
+                None if force_infer else current,
+                row.get('tags') or [],
+            )
+            payload['category'] = category
+            changed |= category != current
+
+        if postprocess:
+            current = row.get('title_ko')
+            raw = row.get('title_ko_raw')
+            version = row.get('postprocess_version')
+            title_ko = current
+            # 원본이 없는 행(수기 수정, 원본 저장 이전 번역)은 그대로 둠
+            if raw and version != RULES_VERSION:
+                # LLM 원본에서 현재 규칙으로 다시 후처리 + 버전 기록
+                title_ko = postprocess_translation(row['title'], raw)
+                version = RULES_VERSION
+            payload['title_ko'] = title_ko
+            payload['postprocess_version'] = version
+            changed |= title_ko != current or version != row.get('postprocess_version')
+
+        if changed:
+            changes.append(payload)
+
+    return changes
+
+
+def write_changes(client: Client, changes: List[Dict]) -> int:
+    """변경된 행만 배치 upsert (재시도 포함)"""
+    success = 0
+    for i in range(0, len(changes), WRITE_BATCH_SIZE):
+        batch = changes[i:i + WRITE_BATCH_SIZE]
+        for attempt in range(MAX_RETRIES):
+            try:
+                client.table('poly_events').upsert(batch, on_conflict='id').execute()
+                success += len(batch)
+                break
+            except Exception as e:
+                if attempt < MAX_RETRIES - 1:
+                    time.sleep(0.5 * (attempt + 1))
+                else:
+                    print(f"  ❌ 저장 실패 ({len(batch)}건): {e}")
+    return success
+
+
+def run_backfill(client: Client, recategorize: bool, force_infer: bool, postprocess: bool,
+                 processes: int, dry_run: bool) -> Dict:
+    """스트리밍 → 프로세스 풀 재계산 → 변경분 저장"""
+    columns = ['id', 'title']
+    if recategorize:
+        columns += ['category', 'tags']
+    if postprocess:
+        columns += ['title_ko', 'title_ko_raw', 'postprocess_version']
+
+    filters = None
+    if postprocess and not recategorize:
+        # 후처리만 할 때는 원본이 있고 아직 현재 규칙 버전이 아닌 행만 DB에서 조회
+        def filters(query):
+            return query.not_.is_('title_ko_raw', 'null') \
+                .or_(f'postprocess_version.is.null,postprocess_version.neq.{RULES_VERSION}')
+
+    stats = {'scanned': 0, 'changed': 0, 'written': 0}
+    max_in_flight = processes * 2  # 스트리밍 중 메모리 상한
+
+    def collect(done):
+        for future in done:
+            changes = future.result()
+            stats['changed'] += len(changes)
+            if changes and not dry_run:
+                stats['written'] += write_changes(client, changes)
+        print(f"  ... 스캔 {stats['scanned']:,}건 | 변경 {stats['changed']:,}건", flush=True)
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = set()
+        for rows in stream_rows(client, ', '.join(columns), filters=filters):
+            stats['scanned'] += len(rows)
+            pending.add(executor.submit(compute_changes, rows, recategorize, force_infer, postprocess))
+
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        if pending:
+            done, _ = wait(pending)
+            collect(done)
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Polymarket 기존 데이터 백필 (카테고리 재추론 / 번역 후처리 재적용)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python backfill.py --recategorize                  # Uncategorized만 재추론
+  python backfill.py --recategorize --force-infer    # 전체 재추론 (API 카테고리도 덮어씀)
+  python backfill.py --postprocess                   # 번역 후처리 재적용
+  python backfill.py --postprocess --dry-run         # 변경 건수만 확인
+        """)
+
+    parser.add_argument('--recategorize', action='store_true',
+                        help='infer_category_from_title로 카테고리 재추론')
+    parser.add_argument('--force-infer', action='store_true',
+                        help='저장된 카테고리를 무시하고 제목 + 태그로만 추론 '
+                             '(API가 준 카테고리로 저장된 행도 추론 값으로 덮어씀)')
+    parser.add_argument('--postprocess', action='store_true',
+                        help='이전 규칙 버전 행의 title_ko를 postprocess_translation으로 재계산')
+    parser.add_argument('-p', '--processes', type=int, default=os.cpu_count() or 2,
+                        help='프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='DB에 저장하지 않고 변경 건수만 출력')
+
+    args = parser.parse_args()
+
+    if not (args.recategorize or args.postprocess):
+        parser.error('--recategorize 또는 --postprocess 중 하나 이상 지정하세요')
+
+    try:
+        supabase_url, supabase_key = load_env()
+    except ValueError as e:
+        print(f"❌ 환경 변수 오류: {e}")
+        return
+
+    from supabase import create_client
+    client = create_client(supabase_url, supabase_key)
+
+    print(f"\n{'='*55}")
+    print(f"  Polymarket 백필")
+    print(f"{'='*55}")
+    print(f"  작업       : {', '.join(n for n, on in [('카테고리', args.recategorize), ('후처리', args.postprocess)] if on)}")
+    if args.recategorize and args.force_infer:
+        print(f"  ⚠️  --force-infer: API 카테고리로 저장된 행도 추론 값으로 덮어씁니다")
+    print(f"  프로세스   : {args.processes}개")
+    print(f"  모드       : {'dry-run (저장 안 함)' if args.dry_run else '변경분 저장'}")
+    print(f"{'='*55}\n")
+
+    start_time = time.time()
+    stats = run_backfill(
+        client,
+        recategorize=args.recategorize,
+        force_infer=args.force_infer,
+        postprocess=args.postprocess,
+        processes=args.processes,
+        dry_run=args.dry_run,
+    )
+    elapsed = time.time() - start_time
+
+    print(f"\n{'='*55}")
+    print(f"  백필 완료!")
+    print(f"  스캔 : {stats['scanned']:,}건")
+    print(f"  변경 : {stats['changed']:,}건")
+    print(f"  저장 : {stats['written']:,}건")
+    print(f"  시간 : {elapsed/60:.1f}분")
+    print(f"{'='*55}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+전체 실행 메모리 벤치마크 (peak RSS)
+
+기록한 API 페이지 아카이브(replay.py 형식)를 재생해 fetch → transform → upsert 전체 경로의
+최대 메모리(peak RSS)를 두 방식으로 비교한다. 각 방식은 새 프로세스에서 측정하고, 저장은 NullSink로 버린다.
+  - dict   : 이전 방식 (이 파일의 reference_* 함수, MarketRecord 도입 전 main.py 그대로).
+             전체 원본 목록을 모은 뒤 한 번에 dict 레코드로 변환하고, dict 목록을 잘라 upsert한다.
+  - record : 현재 방식 (main.run_full_etl). 페이지 단위로 MarketRecord(__slots__ + intern)로 변환하고
+             원본을 해제, upsert payload는 배치 단위로만 만든다.
+--archive를 주지 않으면 시드 고정 합성 응답(기본 5만 건, 500건 페이지)을 임시 아카이브로 기록해 쓴다.
+네트워크/DB 없이 실행된다.
+
+사용법:
+    python bench_memory.py                             # 합성 5만 건
+    python bench_memory.py --markets 100000
+    python bench_memory.py --archive pages.jsonl.gz    # main.py --record로 기록한 실제 응답
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import resource
+import tempfile
+import subprocess
+from typing import Iterator, List, Dict
+from pathlib import Path
+
+# 설정값
+MARKETS = 50000
+PAGE_SIZE = 500          # main.BATCH_SIZE와 동일
+SEED = 42
+MARKETS_PER_EVENT = 8    # 그룹 이벤트 평균 시장 수
+
+NAMES = ['Donald Trump', 'Gavin Newsom', 'JD Vance', 'Kamala Harris', 'Bitcoin', 'Ethereum',
+         'Lakers', 'Celtics', 'Real Madrid', 'Arsenal', 'Fed', 'OpenAI', 'Tesla', 'Apple']
+TAG_POOL = ['Politics', 'Elections', 'Crypto', 'Sports', 'NBA', 'Soccer', 'Economy', 'Tech', 'AI']
+
+ETL_DIR = Path(__file__).parent
+
+
+def synthetic_market(i: int, rng: random.Random) -> Dict:
+    """Gamma API /markets 응답 1건과 비슷한 모양의 시장 (주요 필드 + 대표적인 부가 필드)"""
+    event = i // MARKETS_PER_EVENT
+    name = rng.choice(NAMES)
+    price = rng.random()
+    return {
+        'id': str(500000 + i),
+        'conditionId': '0x%064x' % rng.getrandbits(256),
+        'question': f"Will {name} win event #{event} by December 31, 2026?",
+        'slug': f"will-{name.lower().replace(' ', '-')}-win-event-{event}-{i}",
+        'events': [{'id': str(event), 'slug': f"event-{event}", 'title': f"Event #{event}"}],
+        'endDate': f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00Z",
+        'createdAt': '2026-01-15T09:30:00.000000Z',
+        'updatedAt': '2026-02-01T00:00:00.000000Z',
+        'volume': f"{rng.uniform(0, 1e6):.6f}",
+        'volume24hr': rng.uniform(0, 1e5),
+        'liquidity': f"{rng.uniform(0, 1e5):.4f}",
+        'outcomePrices': json.dumps([f"{price:.4f}", f"{1 - price:.4f}"]),
+        'outcomes': '["Yes", "No"]',
+        'clobTokenIds': json.dumps([str(rng.getrandbits(250)), str(rng.getrandbits(250))]),
+        'category': None,
+        'tags': rng.sample(TAG_POOL, 2),
+        'image': f"https://polymarket-upload.s3.us-east-2.amazonaws.com/event-{event}.png",
+        'icon': f"https://polymarket-upload.s3.us-east-2.amazonaws.com/event-{event}.png",
+        'description': (
+            f"This market will resolve to \"Yes\" if {name} wins event #{event} by December 31, 2026, "
+            "11:59 PM ET. Otherwise, this market will resolve to \"No\". "
+            "The primary resolution source will be official information, "
+            "however a consensus of credible reporting may also be used."
+        ),
+        'marketMakerAddress': '',
+        'active': True,
+        'closed': False,
+        'archived': False,
+        'new': False,
+        'featured': False,
+        'restricted': True,
+        'enableOrderBook': True,
+        'orderPriceMinTickSize': 0.001,
+        'orderMinSize': 5,
+        'bestBid': round(price - 0.01, 3),
+        'bestAsk': round(price + 0.01, 3),
+        'lastTradePrice': round(price, 3),
+        'spread': 0.02,
+    }
+
+
+def synthetic_pages(markets: int, page_size: int = PAGE_SIZE) -> Iterator[List[Dict]]:
+    """API 페이지네이션처럼 한 페이지씩 생성"""
+    rng = random.Random(SEED)
+    for start in range(0, markets, page_size):
+        yield [synthetic_market(i, rng) for i in range(start, min(start + page_size, markets))]
+
+
+def write_archive(path: str, markets: int):
+    """합성 페이지를 replay.py 아카이브로 기록"""
+    from replay import record_pages
+
+    for _ in record_pages(synthetic_pages(markets), path):
+        pass
+
+
+# =============================================================================
+# 이전 방식 (MarketRecord 도입 전 main.py의 fetch/transform/upsert, 비교 기준으로만 유지)
+# =============================================================================
+
+def reference_fetch(pages: Iterator[List[Dict]]) -> List[Dict]:
+    """fetch_polymarket_data: 모든 페이지를 하나의 원본 목록으로 모음"""
+    all_data = []
+    for page in pages:
+        all_data.extend(page)
+    return all_data
+
+
+def reference_transform_data(raw_data: List[Dict]) -> List[Dict]:
+    """transform_data: 시장마다 15키 dict 레코드"""
+    from main import safe_json_parse, safe_float, infer_category_from_title
+
+    transformed = []
+    for item in raw_data:
+        outcome_prices = safe_json_parse(item.get("outcomePrices"))
+        outcomes = safe_json_parse(item.get("outcomes"))
+
+        tags = item.get("tags")
+        if tags is None:
+            tags = []
+        elif isinstance(tags, str):
+            tags = safe_json_parse(tags) or []
+
+        inferred_cat = infer_category_from_title(item.get("question", ""), item.get("category"), tags)
+
+        events = item.get("events")
+        event_slug = None
+        if events and isinstance(events, list) and len(events) > 0:
+            event_slug = events[0].get("slug")
+
+        record = {
+            "id": item.get("conditionId"),
+            "title": item.get("question"),
+            "slug": item.get("slug"),
+            "event_slug": event_slug,
+            "end_date": item.get("endDate"),
+            "api_created_at": item.get("createdAt"),
+            "volume": safe_float(item.get("volume")),
+            "volume_24hr": safe_float(item.get("volume24hr")),
+            "probs": outcome_prices,
+            "outcomes": outcomes,
+            "category": inferred_cat,
+            "tags": tags,
+            "image_url": item.get("image"),
+            "closed": item.get("closed", False),
+            "description": item.get("description"),
+        }
+        if record["id"]:
+            transformed.append(record)
+    return transformed
+
+
+def reference_upsert(client, data: List[Dict], batch_size: int = 500) -> int:
+    """upsert_to_supabase: dict 목록을 잘라 그대로 payload로 사용"""
+    total_success = 0
+    for i in range(0, len(data), batch_size):
+        result = client.table("poly_events").upsert(data[i:i + batch_size], on_conflict="id").execute()
+        total_success += len(result.data)
+    return total_success
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스 peak RSS (MB, Linux는 KB / macOS는 byte 단위)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_child(mode: str, archive: str):
+    """측정 프로세스: 아카이브 재생 → 변환 → NullSink 저장 후 peak RSS를 JSON으로 출력 (레코드는 끝까지 유지)"""
+    from main import run_full_etl
+    from replay import iter_recorded_pages, NullSink
+
+    sink = NullSink()
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+
+    if mode == 'dict':
+        raw_data = reference_fetch(iter_recorded_pages(archive))
+        records = reference_transform_data(raw_data)
+        reference_upsert(sink, records)
+    else:
+        records = run_full_etl(sink, history=False, pages=iter_recorded_pages(archive))["records"]
+
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        'records': len(records),
+        'written': sink.written.get('poly_events', 0),
+        'baseline_mb': baseline,
+        'peak_mb': peak_rss_mb(),
+        'elapsed_sec': elapsed,
+    }))
+
+
+def measure(mode: str, archive: str) -> Dict:
+    proc = subprocess.run(
+        [sys.executable, __file__, '--child', mode, '--archive', archive],
+        cwd=ETL_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='전체 실행 메모리 벤치마크 (peak RSS)')
+    parser.add_argument('--markets', type=int, default=MARKETS,
+                        help=f'합성 시장 수 (기본: {MARKETS})')
+    parser.add_argument('--archive', default=None,
+                        help='재생할 페이지 아카이브 (main.py --record 결과, 미지정 시 합성 데이터)')
+    parser.add_argument('--child', choices=['dict', 'record'], default=None,
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.archive)
+        return
+
+    archive = args.archive
+    temp_dir = None
+    if archive is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        archive = os.path.join(temp_dir.name, 'pages.jsonl.gz')
+        write_archive(archive, args.markets)
+
+    print(f"\n{'='*55}")
+    print(f"  전체 실행 메모리 벤치마크 ({args.archive or f'합성 {args.markets:,}건'})")
+    print(f"{'='*55}\n")
+
+    results = {}
+    try:
+        for mode, label in [('dict', '이전 (원본 목록 + dict 레코드)'),
+                            ('record', '현재 (페이지 변환 + MarketRecord)')]:
+            try:
+                result = measure(mode, archive)
+            except RuntimeError as e:
+                print(f"  ❌ {label}: {e}")
+                sys.exit(1)
+            results[mode] = result
+            print(f"  {label}")
+            print(f"     레코드      : {result['records']:,}건 (저장 {result['written']:,}건)")
+            print(f"     peak RSS    : {result['peak_mb']:.1f}MB "
+                  f"(시작 {result['baseline_mb']:.1f}MB, 증가 {result['peak_mb'] - result['baseline_mb']:.1f}MB)")
+            print(f"     실행 시간   : {result['elapsed_sec']:.2f}초")
+            print()
+    finally:
+        if temp_dir:
+            temp_dir.cleanup()
+
+    before = results['dict']['peak_mb'] - results['dict']['baseline_mb']
+    after = results['record']['peak_mb'] - results['record']['baseline_mb']
+    print(f"{'='*55}")
+    print(f"  fetch → transform → upsert 메모리: {before:.1f}MB → {after:.1f}MB "
+          f"({(1 - after / before) * 100 if before else 0:.0f}% 감소)")
+    print(f"{'='*55}\n")
+
+
+if __name__ == '__main__':
+    main()
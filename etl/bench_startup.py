@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+ETL 진입점 콜드 스타트 벤치마크
+
+main.py(4시간/10분 주기)와 translate.py는 짧게 도는 스케줄 작업이라
+인터프리터 시작 + import 시간이 실행 시간의 큰 부분을 차지한다.
+각 진입점을 `python -X importtime <script> --help`로 새 프로세스에서 여러 번 실행해
+  - 실행 시간(중앙값)이 예산 안인지
+  - supabase/openai/dotenv 같은 무거운 모듈을 --help 단계에서 import하지 않는지
+확인하고, import 비용이 큰 모듈을 보여준다.
+
+사용법:
+    python bench_startup.py                    # 기본 (5회, 예산 300ms)
+    python bench_startup.py --runs 10 --budget-ms 200
+    python bench_startup.py --top 15           # import 비용 상위 15개 모듈 출력
+
+종료 코드: 모든 진입점이 예산 안이고 지연 import 모듈을 불러오지 않으면 0, 아니면 1
+"""
+
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from typing import List, Dict, Tuple
+from pathlib import Path
+
+# 설정값
+RUNS = 5
+STARTUP_BUDGET_MS = 300
+TOP_IMPORTS = 8
+
+ETL_DIR = Path(__file__).parent
+
+# 측정할 진입점 (스크립트, 인자)
+ENTRY_POINTS = [
+    ('main.py', ['--help']),
+    ('translate.py', ['--help']),
+    ('daemon.py', ['--help']),
+    ('backfill.py', ['--help']),
+    ('history.py', ['--help']),
+]
+
+# 실제로 쓰는 시점에만 import해야 하는 모듈
+LAZY_MODULES = ('supabase', 'openai', 'dotenv')
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    -X importtime 출력 파싱
+
+    Returns:
+        [(모듈명, self us, cumulative us), ...] (최상위 import만)
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue
+        # 들여쓰기가 없는 행 = 최상위 import (하위 import 비용은 cumulative에 포함)
+        if name.startswith(' ') and not name.startswith('  '):
+            imports.append((name.strip(), self_us, cumulative_us))
+    return imports
+
+
+def imported_modules(stderr: str) -> List[str]:
+    """-X importtime 출력에서 import된 전체 모듈명"""
+    modules = []
+    for line in stderr.splitlines():
+        if line.startswith('import time:') and 'imported package' not in line:
+            modules.append(line.rsplit('|', 1)[-1].strip())
+    return modules
+
+
+def measure(script: str, args: List[str], runs: int) -> Dict:
+    """진입점 하나를 runs번 새 프로세스로 실행해 실행 시간/import 정보 수집"""
+    durations = []
+    stderr = ''
+    returncode = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', script, *args],
+            cwd=ETL_DIR, capture_output=True, text=True,
+        )
+        durations.append((time.perf_counter() - start) * 1000)
+        stderr, returncode = proc.stderr, proc.returncode
+
+    modules = imported_modules(stderr)
+    lazy_loaded = sorted({
+        m.split('.')[0] for m in modules if m.split('.')[0] in LAZY_MODULES
+    })
+    return {
+        'median_ms': statistics.median(durations),
+        'min_ms': min(durations),
+        'imports': parse_importtime(stderr),
+        'lazy_loaded': lazy_loaded,
+        'returncode': returncode,
+        'error': stderr.strip().splitlines()[-1] if returncode else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ETL 진입점 콜드 스타트 벤치마크')
+    parser.add_argument('--runs', type=int, default=RUNS,
+                        help=f'진입점별 실행 횟수 (기본: {RUNS})')
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                        help=f'진입점별 실행 시간 예산 (중앙값, ms, 기본: {STARTUP_BUDGET_MS})')
+    parser.add_argument('--top', type=int, default=TOP_IMPORTS,
+                        help=f'import 비용 상위 N개 모듈 출력 (기본: {TOP_IMPORTS})')
+    args = parser.parse_args()
+
+    print(f"\n{'='*55}")
+    print(f"  ETL 콜드 스타트 (예산 {args.budget_ms:g}ms, {args.runs}회 중앙값)")
+    print(f"{'='*55}\n")
+
+    failed = 0
+    for script, script_args in ENTRY_POINTS:
+        result = measure(script, script_args, args.runs)
+        over_budget = result['median_ms'] > args.budget_ms
+        ok = result['returncode'] == 0 and not over_budget and not result['lazy_loaded']
+        failed += not ok
+
+        print(f"  {'✅' if ok else '❌'} {script} {' '.join(script_args)}")
+        print(f"     실행 시간   : {result['median_ms']:.0f}ms (최소 {result['min_ms']:.0f}ms)")
+        if result['returncode']:
+            print(f"     실행 실패   : {result['error']}")
+        if result['lazy_loaded']:
+            print(f"     지연 import 위반: {', '.join(result['lazy_loaded'])}")
+
+        top = sorted(result['imports'], key=lambda i: i[2], reverse=True)[:args.top]
+        if top:
+            total_ms = sum(i[2] for i in result['imports']) / 1000
+            print(f"     import 합계 : {total_ms:.0f}ms")
+            for name, _, cumulative_us in top:
+                print(f"       {cumulative_us / 1000:7.1f}ms  {name}")
+        print()
+
+    print(f"{'='*55}")
+    if failed:
+        print(f"  ❌ {failed}개 진입점이 예산 초과 또는 지연 import 위반")
+    else:
+        print(f"  ✅ 모든 진입점이 예산 안에서 시작")
+    print(f"{'='*55}\n")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
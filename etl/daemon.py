@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Polymarket ETL 데몬 (상주 프로세스)
+
+스케줄 실행마다 인터프리터 시작, supabase/openai import, .env 로드, 클라이언트 생성,
+translation_prompt.md 파싱을 반복하지 않도록 프로세스 하나를 계속 띄워 두고 작업을 돌린다.
+  - 클라이언트: Supabase/OpenAI 클라이언트를 한 번 만들어 재사용
+  - 메모리 캐시: 번역 캐시(제목), 카테고리 매처, 직전 실행 레코드 지문/스냅샷/이력 기준
+    (전체 ETL마다 이번에 본 시장만 남기고 정리 → 마감/삭제 시장이 쌓이지 않음)
+  - 스케줄러: 전체 ETL / hot 갱신 / 번역을 각자 주기로 실행 (한 번에 하나씩, 겹치지 않음)
+  - 번역 큐: 수집 중 새로 들어왔거나 제목이 바뀐 시장을 바로 번역 (주기 번역은 누락분 안전망,
+    전체 ETL이 넣은 항목이 모두 처리된 뒤에 누락분을 조회해 같은 시장을 두 번 번역하지 않음)
+  - 상태 확인: 로컬 HTTP /health, /metrics
+
+사용법:
+    python daemon.py
+    python daemon.py --full-interval 240 --hot-interval 5 --translate-interval 120
+    python daemon.py --translate-interval 0       # 주기 번역만 끄기 (번역 큐는 유지)
+    python daemon.py --no-translate               # 번역 전체 끄기
+
+    curl localhost:8787/health
+    curl localhost:8787/metrics
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import threading
+from typing import Callable, Dict, Optional
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from main import (
+    load_env, run_full_etl, run_hot_refresh, get_category_matchers,
+    HOT_TOP_N, HOT_ENDS_WITHIN_HOURS,
+)
+from history import PROB_EPSILON, VOLUME_EPSILON
+from records import MarketRecord
+from stats import refresh_event_stats, refresh_tag_index
+
+# 설정값 (분)
+FULL_INTERVAL = 240
+HOT_INTERVAL = 10
+TRANSLATE_INTERVAL = 120  # 새 시장은 번역 큐가 처리하므로 누락분 안전망 주기
+HEALTH_HOST = '127.0.0.1'
+HEALTH_PORT = 8787
+MAX_CONSECUTIVE_FAILURES = 3  # 같은 작업이 연속 N번 실패하면 /health가 503
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class Job:
+    """주기 작업 하나의 스케줄 + 실행 통계"""
+
+    def __init__(self, name: str, interval_minutes: float, func: Callable[[], dict],
+                 first_run: float):
+        self.name = name
+        self.interval = interval_minutes * 60
+        self.func = func
+        self.next_run = first_run
+
+        self.runs = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_started: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_summary: Optional[dict] = None
+
+    def metrics(self) -> dict:
+        return {
+            'interval_minutes': self.interval / 60,
+            'runs': self.runs,
+            'failures': self.failures,
+            'consecutive_failures': self.consecutive_failures,
+            'last_started': _isoformat(self.last_started),
+            'last_duration_sec': round(self.last_duration, 2) if self.last_duration is not None else None,
+            'last_error': self.last_error,
+            'last_summary': self.last_summary,
+            'next_run': _isoformat(self.next_run),
+        }
+
+
+class ETLDaemon:
+    def __init__(self, args):
+        self.args = args
+
+        # 클라이언트 (프로세스 수명 동안 재사용)
+        from supabase import create_client
+
+        supabase_url, supabase_key = load_env()
+        self.client = create_client(supabase_url, supabase_key)
+
+        # 번역: 모든 번역은 번역 큐 스레드 하나에서 실행 (수집 직후 + 주기 안전망)
+        self.translator = None
+        self.translation_queue = None
+        if not args.no_translate:
+            if os.getenv('OPENAI_API_KEY'):
+                from translate import Translator, TranslationQueue
+                self.translator = Translator(
+                    workers=args.translate_workers,
+                    overwrite=False,
+                    exclude_sports=args.exclude_sports,
+                    start_date='',
+                    end_date='',
+                )
+                self.translation_queue = TranslationQueue(self.translator)
+            else:
+                print("⚠ OPENAI_API_KEY가 없어 번역 작업을 끕니다")
+
+        # 카테고리 매처 워밍업 (첫 전체 ETL에서 컴파일하지 않도록)
+        get_category_matchers()
+
+        # 메모리 상태
+        self.snapshot: Dict[str, MarketRecord] = {}  # id → 최신 레코드 (전체 ETL + hot 갱신 반영)
+        self.fingerprints: Dict[str, bytes] = {}     # id → 직전 전체 ETL에서 저장한 레코드 지문
+        self.history_baseline: Optional[Dict] = None  # id → 마지막 이력 값 (첫 전체 ETL에서 DB 조회 후 유지)
+
+        now = time.time()
+        self.jobs = [Job('full_etl', args.full_interval, self.full_etl, first_run=now)]
+        if self.translator and args.translate_interval > 0:
+            self.jobs.append(Job('translate', args.translate_interval, self.translate, first_run=now))
+        if args.hot_interval > 0:
+            self.jobs.append(Job('hot_refresh', args.hot_interval, self.hot_refresh,
+                                 first_run=now + args.hot_interval * 60))
+
+        self.started_at = now
+        self.running_job: Optional[str] = None
+        self.stop_event = threading.Event()
+
+    # ─── 작업 ───
+
+    def enqueue_ingested(self, events: list):
+        """수집 중 감지한 새 시장/제목 변경 시장 → 번역 큐"""
+        if self.args.exclude_sports:
+            events = [e for e in events if e.get('category') != 'Sports']
+        self.translation_queue.put(events)
+
+    @property
+    def on_ingest(self) -> Optional[Callable[[list], None]]:
+        return self.enqueue_ingested if self.translation_queue else None
+
+    def full_etl(self) -> dict:
+        result = run_full_etl(
+            self.client,
+            prob_epsilon=self.args.prob_epsilon,
+            volume_epsilon=self.args.volume_epsilon,
+            history=not self.args.no_history,
+            previous_state=self.snapshot or None,
+            fingerprints=self.fingerprints,
+            on_ingest=self.on_ingest,
+            history_baseline=self.history_baseline,
+        )
+        if result is None:
+            raise RuntimeError("Polymarket API 요청 실패")
+
+        self.snapshot = {r.id: r for r in result['records']}
+        self.history_baseline = result['history_baseline']
+        self.prune_caches(result['records'])
+        refresh_event_stats(self.client)
+        refresh_tag_index(self.client)
+        return {'markets': len(self.snapshot), 'upserted': result['success'], 'errors': len(result['errors']),
+                'ingested': len(result.get('ingested', []))}
+
+    def prune_caches(self, records: list):
+        """이번 전체 ETL에 없는 시장(마감/삭제)을 메모리 캐시에서 제거 (데몬 수명 동안 계속 커지지 않도록)"""
+        ids = {r.id for r in records}
+        for cache in (self.fingerprints, self.history_baseline or {}):
+            for market_id in [k for k in cache if k not in ids]:
+                del cache[market_id]
+        if self.translator:
+            self.translator.prune_memory_cache({r.title for r in records})
+
+    def hot_refresh(self) -> dict:
+        result = run_hot_refresh(
+            self.client,
+            top_n=self.args.top_n,
+            ends_within_hours=self.args.ends_within_hours,
+            snapshot=list(self.snapshot.values()) if self.snapshot else None,
+            prob_epsilon=self.args.prob_epsilon,
+            volume_epsilon=self.args.volume_epsilon,
+            history=not self.args.no_history,
+            on_ingest=self.on_ingest,
+            history_baseline=self.history_baseline,
+        )
+        if result is None:
+            raise RuntimeError("Polymarket API 요청 실패")
+
+        for record in result['records']:
+            self.snapshot[record.id] = record
+            # DB 값이 전체 ETL 때와 달라졌으므로 다음 전체 ETL에서 다시 저장되도록 지문 제거
+            self.fingerprints.pop(record.id, None)
+        # 마감 시각이 지난 시장이 통계에 남지 않도록 hot 주기마다 통계 재집계 (태그는 전체 ETL만)
+        refresh_event_stats(self.client)
+        return {'markets': len(result['records']), 'upserted': result['success'], 'errors': len(result['errors'])}
+
+    def translate(self) -> dict:
+        """안전망: 번역 큐가 놓친 미번역 시장(큐 실패, 데몬 재시작 전 수집분 등)을 큐로 보냄"""
+        from translate import calculate_date_range
+
+        queue = self.translation_queue
+        # 전체 ETL이 넣은 수집분 번역이 끝난 뒤 조회 (아직 큐에 있는 시장을 누락분으로 다시 넣지 않음)
+        queue.drain()
+
+        self.translator.start_date, self.translator.end_date = calculate_date_range(self.args.months)
+        targets = self.translator.fetch_all_target_ids()
+
+        translated_before = queue.total_translated
+        queue.put(targets)
+        queue.drain()
+        return {
+            'targets': len(targets),
+            'translated': queue.total_translated - translated_before,
+        }
+
+    # ─── 스케줄러 ───
+
+    def run_job(self, job: Job):
+        """작업 하나 실행 (예외는 기록만 하고 데몬은 계속)"""
+        self.running_job = job.name
+        job.last_started = time.time()
+        print(f"\n[{_isoformat(job.last_started)}] ▶ {job.name}", flush=True)
+        try:
+            job.last_summary = job.func()
+            job.last_error = None
+            job.consecutive_failures = 0
+        except Exception as e:
+            job.failures += 1
+            job.consecutive_failures += 1
+            job.last_error = str(e)
+            print(f"✗ {job.name} 실패: {e}", flush=True)
+        finally:
+            job.runs += 1
+            job.last_duration = time.time() - job.last_started
+            # 다음 실행은 이번 시작 시각 기준 (밀린 실행을 몰아서 돌리지 않음)
+            job.next_run = job.last_started + job.interval
+            self.running_job = None
+            print(f"■ {job.name} ({job.last_duration:.1f}초)", flush=True)
+
+    def run_forever(self):
+        """가장 먼저 예정된 작업부터 하나씩 실행 (작업끼리 겹치지 않음)"""
+        while not self.stop_event.is_set():
+            job = min(self.jobs, key=lambda j: j.next_run)
+            wait = job.next_run - time.time()
+            if wait > 0:
+                self.stop_event.wait(wait)
+                continue
+            self.run_job(job)
+
+    def stop(self, *_):
+        print("\n데몬 종료 요청 (실행 중인 작업이 끝나면 종료)", flush=True)
+        self.stop_event.set()
+
+    # ─── 상태 확인 ───
+
+    def health(self) -> dict:
+        failing = [j.name for j in self.jobs if j.consecutive_failures >= MAX_CONSECUTIVE_FAILURES]
+        return {
+            'status': 'degraded' if failing else 'ok',
+            'failing_jobs': failing,
+            'running_job': self.running_job,
+            'uptime_sec': round(time.time() - self.started_at),
+        }
+
+    def metrics(self) -> dict:
+        caches = {
+            'snapshot_markets': len(self.snapshot),
+            'fingerprints': len(self.fingerprints),
+            'history_baseline': len(self.history_baseline or {}),
+        }
+        metrics = {
+            **self.health(),
+            'started_at': _isoformat(self.started_at),
+            'caches': caches,
+            'jobs': {j.name: j.metrics() for j in self.jobs},
+        }
+        if self.translation_queue:
+            queue = self.translation_queue
+            caches['translation_memory_cache'] = len(self.translator.memory_cache)
+            metrics['translation_queue'] = {
+                'pending': queue.queue.unfinished_tasks,
+                'queued': queue.total_queued,
+                'translated': queue.total_translated,
+                'failed': queue.total_failed,
+            }
+        return metrics
+
+
+def make_handler(daemon: ETLDaemon):
+    class HealthHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/health':
+                body = daemon.health()
+                status = 200 if body['status'] == 'ok' else 503
+            elif self.path == '/metrics':
+                body = daemon.metrics()
+                status = 200
+            else:
+                body = {'error': 'not found'}
+                status = 404
+
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass  # 요청 로그는 출력하지 않음
+
+    return HealthHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Polymarket ETL 데몬 (전체 ETL / hot 갱신 / 번역 주기 실행)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python daemon.py                                   # 기본 주기 (전체 240분, hot 10분, 번역 안전망 120분)
+  python daemon.py --hot-interval 5 --exclude-sports
+  python daemon.py --translate-interval 0            # 주기 번역만 끄기 (번역 큐는 유지)
+  python daemon.py --no-translate                    # 번역 전체 끄기
+        """)
+
+    parser.add_argument('--full-interval', type=float, default=FULL_INTERVAL,
+                        help=f'전체 ETL 주기 (분, 기본: {FULL_INTERVAL})')
+    parser.add_argument('--hot-interval', type=float, default=HOT_INTERVAL,
+                        help=f'hot 갱신 주기 (분, 0이면 끔, 기본: {HOT_INTERVAL})')
+    parser.add_argument('--translate-interval', type=float, default=TRANSLATE_INTERVAL,
+                        help=f'미번역 안전망 번역 주기 (분, 0이면 끔, 기본: {TRANSLATE_INTERVAL})')
+    parser.add_argument('--no-translate', action='store_true',
+                        help='번역 큐/주기 번역 모두 끄기')
+    parser.add_argument('--top-n', type=int, default=HOT_TOP_N,
+                        help=f'hot 갱신: volume_24hr 상위 시장 수 (기본: {HOT_TOP_N})')
+    parser.add_argument('--ends-within-hours', type=int, default=HOT_ENDS_WITHIN_HOURS,
+                        help=f'hot 갱신: N시간 안에 마감하는 시장 포함 (기본: {HOT_ENDS_WITHIN_HOURS})')
+    parser.add_argument('--prob-epsilon', type=float, default=PROB_EPSILON,
+                        help=f'이력 기록 확률 변화 임계값 (기본: {PROB_EPSILON})')
+    parser.add_argument('--volume-epsilon', type=float, default=VOLUME_EPSILON,
+                        help=f'이력 기록 거래량 상대 변화 임계값 (기본: {VOLUME_EPSILON})')
+    parser.add_argument('--no-history', action='store_true',
+                        help='확률/거래량 이력 기록 생략')
+    parser.add_argument('-m', '--months', type=int, default=2,
+                        help='번역 기간 - 오늘부터 N개월 (기본: 2)')
+    parser.add_argument('-w', '--translate-workers', type=int, default=4,
+                        help='번역 워커 수 (기본: 4)')
+    parser.add_argument('--exclude-sports', action='store_true',
+                        help='번역에서 Sports 카테고리 제외')
+    parser.add_argument('--host', default=HEALTH_HOST,
+                        help=f'상태 확인 서버 주소 (기본: {HEALTH_HOST})')
+    parser.add_argument('--port', type=int, default=HEALTH_PORT,
+                        help=f'상태 확인 서버 포트 (0이면 끔, 기본: {HEALTH_PORT})')
+
+    args = parser.parse_args()
+
+    try:
+        daemon = ETLDaemon(args)
+    except ValueError as e:
+        print(f"✗ 환경 변수 오류: {e}")
+        sys.exit(1)
+
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+
+    server = None
+    if args.port:
+        server = ThreadingHTTPServer((args.host, args.port), make_handler(daemon))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print("=" * 50)
+    print("Polymarket ETL 데몬 시작")
+    for job in daemon.jobs:
+        print(f"  {job.name:<12}: {job.interval / 60:g}분 주기")
+    if server:
+        print(f"  상태 확인   : http://{args.host}:{args.port}/health, /metrics")
+    print("=" * 50, flush=True)
+
+    daemon.run_forever()
+
+    if daemon.translation_queue:
+        daemon.translation_queue.close()
+    if server:
+        server.shutdown()
+    print("Polymarket ETL 데몬 종료")
+
+
+if __name__ == '__main__':
+    main()
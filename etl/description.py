@@ -0,0 +1,155 @@
+"""
+시장 설명(description) 번역용 긴 텍스트 처리 모듈
+
+description은 수백~수천 자의 규칙(Rules) 텍스트라 제목처럼 100개씩 묶어 보낼 수 없다.
+다음 4단계로 처리:
+  [1] 줄 단위 분할 → 긴 줄은 문장 단위 청크로 분할
+  [2] 청크 내용 해시 → 시장 간 공통 문구(boilerplate)는 한 번만 번역
+  [3] 토큰 예산 단위로 청크를 요청에 패킹 (청크마다 <<<n>>> 구분자, 번역이 여러 줄이어도 잘리지 않음)
+  [4] 번역된 청크를 원래 순서/줄바꿈 그대로 재조립
+
+사용법:
+    from description import split_description, pack_chunks, reassemble_description
+    segments = split_description(text)
+    request_text = format_chunk_request(chunks)            # LLM 요청 본문
+    translations = parse_chunk_response(response_text, len(chunks))
+    ...
+    translated = reassemble_description(segments, {content_hash(c): ko, ...})
+"""
+
+import re
+import hashlib
+from typing import List, Dict, Tuple, Optional
+
+
+# 설정값
+CHUNK_MAX_TOKENS = 400         # 청크 하나의 최대 토큰 (넘으면 문장 단위로 분할)
+REQUEST_TOKEN_BUDGET = 2500    # 요청 하나에 담을 원문 토큰 합 (출력 max_tokens 5000 고려)
+
+# 문장 경계: 마침표/물음표/느낌표 뒤 공백 + 대문자/숫자/따옴표로 시작
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"\'(\[])')
+
+# 줄바꿈은 그대로 보존하기 위해 구분자로 함께 분할
+LINE_SEPARATOR = re.compile(r'(\s*\n\s*)')
+
+# 요청/응답 청크 구분자 (<<<1>>>), 번호 목록과 달리 청크 번역이 여러 줄이어도 다음 구분자까지 한 청크
+CHUNK_DELIMITER = '<<<{}>>>'
+CHUNK_MARKER = re.compile(r'^[ \t]*<<<(\d+)>>>[ \t]*$', re.MULTILINE)
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (영문 기준 약 4자 = 1토큰)"""
+    return len(text) // 4 + 1
+
+
+def normalize_chunk(text: str) -> str:
+    """해시 비교용 정규화 (공백 통일)"""
+    return ' '.join(text.split())
+
+
+def content_hash(text: str) -> str:
+    """청크 내용 해시 (공통 문구 캐시 키)"""
+    return hashlib.sha1(normalize_chunk(text).encode('utf-8')).hexdigest()
+
+
+def split_sentences(line: str, max_tokens: int = CHUNK_MAX_TOKENS) -> List[str]:
+    """[1] 긴 줄을 문장 단위 청크로 분할 (청크당 max_tokens 이하로 묶음)"""
+    if estimate_tokens(line) <= max_tokens:
+        return [line]
+
+    chunks = []
+    current = []
+    current_tokens = 0
+    for sentence in SENTENCE_BOUNDARY.split(line):
+        tokens = estimate_tokens(sentence)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(' '.join(current))
+            current = []
+            current_tokens = 0
+        current.append(sentence)
+        current_tokens += tokens
+
+    if current:
+        chunks.append(' '.join(current))
+    return chunks
+
+
+def split_description(text: str, max_tokens: int = CHUNK_MAX_TOKENS) -> List[Tuple[str, List[str]]]:
+    """
+    설명 텍스트를 (앞 구분자, 청크 리스트) 세그먼트로 분할
+
+    줄바꿈 구분자를 그대로 보관하므로 reassemble_description으로 원래 형식 복원 가능.
+    """
+    segments = []
+    separator = ''
+    for part in LINE_SEPARATOR.split(text.strip()):
+        if not part:
+            continue
+        if LINE_SEPARATOR.fullmatch(part):
+            separator += part
+            continue
+        segments.append((separator, split_sentences(normalize_chunk(part), max_tokens)))
+        separator = ''
+    return segments
+
+
+def pack_chunks(chunks: List[str], budget: int = REQUEST_TOKEN_BUDGET) -> List[List[str]]:
+    """[3] 청크를 토큰 예산 단위 요청으로 패킹 (순서 유지, 예산 초과 청크는 단독 요청)"""
+    requests = []
+    current = []
+    current_tokens = 0
+    for chunk in chunks:
+        tokens = estimate_tokens(chunk)
+        if current and current_tokens + tokens > budget:
+            requests.append(current)
+            current = []
+            current_tokens = 0
+        current.append(chunk)
+        current_tokens += tokens
+
+    if current:
+        requests.append(current)
+    return requests
+
+
+def format_chunk_request(chunks: List[str]) -> str:
+    """[3] 요청 본문: 청크마다 구분자 줄 + 청크"""
+    return "\n".join(f"{CHUNK_DELIMITER.format(i + 1)}\n{chunk}" for i, chunk in enumerate(chunks))
+
+
+def parse_chunk_response(text: str, count: int) -> List[Optional[str]]:
+    """
+    [3] 응답 파싱: 구분자 사이 텍스트를 청크 번역으로 (여러 줄이면 공백으로 합침)
+
+    Returns:
+        청크 순서대로 번역, 빠진 청크는 None
+    """
+    results: List[Optional[str]] = [None] * count
+    markers = list(CHUNK_MARKER.finditer(text))
+    for i, marker in enumerate(markers):
+        num = int(marker.group(1))
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+        body = normalize_chunk(text[marker.end():end])
+        if 1 <= num <= count and body:
+            results[num - 1] = body
+    return results
+
+
+def reassemble_description(segments: List[Tuple[str, List[str]]],
+                           translations: Dict[str, str]) -> Optional[str]:
+    """
+    [4] 번역된 청크를 원래 순서대로 재조립
+
+    Returns:
+        완성된 번역, 청크 하나라도 번역이 없으면 None (부분 번역 저장 방지)
+    """
+    parts = []
+    for separator, chunks in segments:
+        translated_chunks = []
+        for chunk in chunks:
+            translated = translations.get(content_hash(chunk))
+            if translated is None:
+                return None
+            translated_chunks.append(translated)
+        parts.append(separator + ' '.join(translated_chunks))
+    return ''.join(parts)
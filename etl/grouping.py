@@ -0,0 +1,220 @@
+"""
+그룹 이벤트(event_slug) 번역 중복 제거 모듈
+
+같은 event_slug의 시장들은 대부분 후보 이름, 가격 구간 등 일부 구절만 다르다:
+    Will Donald Trump win the 2028 US Presidential Election?
+    Will Gavin Newsom win the 2028 US Presidential Election?
+공통 질문을 템플릿(Will {X} win the ...)으로 한 번만 번역하고 달라지는 구절만 따로 번역해
+프롬프트 토큰을 줄인다.
+  [1] event_slug별 그룹화 → 공통 접두/접미 단어로 템플릿 + 구절 분리
+  [2] 숫자/금액 등 번역이 필요 없는 구절은 그대로 사용
+  [3] 번역된 템플릿에 구절을 채우고 받침에 맞게 조사(이/가, 을/를 ...) 결정
+
+사용법:
+    from grouping import group_by_event, fill_template, needs_translation
+    groups, singles = group_by_event(events)
+    chunks = split_group(group, max_items=100)          # 요청 하나에 담을 수 있는 크기로
+    if is_usable_template(group['template'], template_ko): ...
+"""
+
+import re
+from typing import List, Dict, Tuple, Optional
+
+
+# 설정값
+TEMPLATE_SLOT = '{X}'
+MIN_GROUP_TITLES = 2       # 템플릿화할 최소 고유 제목 수
+MIN_SHARED_WORDS = 3       # 템플릿 공통 단어 최소 개수 (너무 짧으면 문맥이 없음)
+MAX_FRAGMENT_WORDS = 6     # 달라지는 구절 최대 단어 수 (길면 사실상 다른 질문)
+
+# 구절 앞뒤로 공통이면 템플릿 쪽으로 옮길 문장 부호
+LEADING_PUNCT = '("\'“'
+TRAILING_PUNCT = '?.!,:;)"\'”'
+
+HANGUL = re.compile(r'[가-힣]')
+
+# 받침 있는 숫자 (영, 일, 삼, 육, 칠, 팔, 십)
+DIGIT_BATCHIM = set('0136789')
+# 받침 있는 영문자 이름 (엘, 엠, 엔, 알)
+LETTER_BATCHIM = set('lmnrLMNR')
+
+# (받침 있을 때, 받침 없을 때) 조사 쌍
+PARTICLE_PAIRS = {
+    '이(가)': ('이', '가'), '가(이)': ('이', '가'),
+    '을(를)': ('을', '를'), '를(을)': ('을', '를'),
+    '은(는)': ('은', '는'), '는(은)': ('은', '는'),
+    '과(와)': ('과', '와'), '와(과)': ('과', '와'),
+    '(으)로': ('으로', '로'),
+}
+# LLM이 괄호 없이 조사 하나만 붙인 경우 쌍 표기로 되돌리기 위한 매핑
+SINGLE_PARTICLES = {
+    '이': '이(가)', '가': '이(가)', '을': '을(를)', '를': '을(를)',
+    '은': '은(는)', '는': '은(는)', '과': '과(와)', '와': '과(와)',
+}
+
+
+def _common_prefix_len(word_lists: List[List[str]]) -> int:
+    shortest = min(len(words) for words in word_lists)
+    for i in range(shortest):
+        if len({words[i] for words in word_lists}) > 1:
+            return i
+    return shortest
+
+
+def _strip_common_punct(fragments: List[str]) -> Tuple[str, str, List[str]]:
+    """모든 구절에 공통인 앞뒤 문장 부호를 분리"""
+    lead = ''
+    while all(len(f) > 1 and f[0] in LEADING_PUNCT for f in fragments) \
+            and len({f[0] for f in fragments}) == 1:
+        lead += fragments[0][0]
+        fragments = [f[1:] for f in fragments]
+
+    trail = ''
+    while all(len(f) > 1 and f[-1] in TRAILING_PUNCT for f in fragments) \
+            and len({f[-1] for f in fragments}) == 1:
+        trail = fragments[0][-1] + trail
+        fragments = [f[:-1] for f in fragments]
+
+    return lead, trail, fragments
+
+
+def split_template(titles: List[str]) -> Optional[Tuple[str, List[str]]]:
+    """
+    [1] 제목 목록을 공통 템플릿과 달라지는 구절로 분리
+
+    Returns:
+        (템플릿, titles와 같은 순서의 구절 리스트), 템플릿화가 부적절하면 None
+    """
+    word_lists = [title.split() for title in titles]
+    prefix_len = _common_prefix_len(word_lists)
+    suffix_len = _common_prefix_len([words[prefix_len:][::-1] for words in word_lists])
+
+    if prefix_len + suffix_len < MIN_SHARED_WORDS:
+        return None
+
+    middles = [words[prefix_len:len(words) - suffix_len] for words in word_lists]
+    if any(not middle or len(middle) > MAX_FRAGMENT_WORDS for middle in middles):
+        return None
+
+    lead, trail, fragments = _strip_common_punct([' '.join(middle) for middle in middles])
+
+    first = word_lists[0]
+    template = ' '.join(first[:prefix_len] + [lead + TEMPLATE_SLOT + trail] + first[len(first) - suffix_len:])
+    return template, fragments
+
+
+def group_by_event(events: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    event_slug 기준으로 템플릿 그룹과 개별 번역 대상을 분리
+
+    Returns:
+        (groups, singles)
+        groups: [{'event_slug', 'template', 'titles', 'fragments', 'events'}, ...]
+        singles: 템플릿화하지 않은 이벤트 (기존 배치 번역 대상)
+    """
+    by_slug: Dict[str, List[Dict]] = {}
+    singles = []
+    for event in events:
+        if event.get('event_slug'):
+            by_slug.setdefault(event['event_slug'], []).append(event)
+        else:
+            singles.append(event)
+
+    groups = []
+    for event_slug, slug_events in by_slug.items():
+        titles = list(dict.fromkeys(e['title'] for e in slug_events))
+        split = split_template(titles) if len(titles) >= MIN_GROUP_TITLES else None
+        if split is None:
+            singles.extend(slug_events)
+            continue
+
+        template, fragments = split
+        groups.append({
+            'event_slug': event_slug,
+            'template': template,
+            'titles': titles,
+            'fragments': fragments,
+            'events': slug_events,
+        })
+
+    return groups, singles
+
+
+def split_group(group: Dict, max_items: int) -> List[Dict]:
+    """
+    구절이 많은 그룹을 요청 하나에 담을 수 있는 크기(템플릿 1 + 구절 max_items - 1)로 분할
+
+    분할된 그룹은 같은 템플릿을 공유하므로 템플릿 번역은 캐시 없이도 그룹마다 1회.
+    """
+    per_chunk = max(max_items - 1, 1)
+    if len(group['titles']) <= per_chunk:
+        return [group]
+
+    chunks = []
+    for i in range(0, len(group['titles']), per_chunk):
+        titles = group['titles'][i:i + per_chunk]
+        title_set = set(titles)
+        chunks.append({
+            **group,
+            'titles': titles,
+            'fragments': group['fragments'][i:i + per_chunk],
+            'events': [e for e in group['events'] if e['title'] in title_set],
+        })
+    return chunks
+
+
+def is_usable_template(template: str, template_ko: Optional[str]) -> bool:
+    """
+    번역된 템플릿을 채워 써도 되는지
+
+    번역이 누락되면 translate_batch_raw가 영어 원문({X} 포함)을 돌려주므로,
+    자리만 확인하면 영어 템플릿에 한글 구절이 채워진 제목이 그룹 전체에 저장된다.
+    """
+    if not template_ko or TEMPLATE_SLOT not in template_ko:
+        return False
+    if template_ko.strip() == template.strip():
+        return False
+    return HANGUL.search(template_ko.replace(TEMPLATE_SLOT, '')) is not None
+
+
+def needs_translation(fragment: str) -> bool:
+    """[2] 숫자/금액/구간 등 영단어가 없는 구절은 번역 불필요"""
+    return re.search(r'[A-Za-z]{2,}', fragment) is not None
+
+
+def has_batchim(text: str) -> bool:
+    """마지막 글자의 받침 유무 (한글, 숫자, 영문자 이름 기준)"""
+    text = text.rstrip(' ' + TRAILING_PUNCT)
+    if not text:
+        return False
+
+    last = text[-1]
+    if '가' <= last <= '힣':
+        return (ord(last) - ord('가')) % 28 != 0
+    if last.isdigit():
+        return last in DIGIT_BATCHIM
+    return last in LETTER_BATCHIM
+
+
+def fill_template(template_ko: str, fragment_ko: str) -> str:
+    """[3] 번역된 템플릿에 구절을 채우고 조사를 받침에 맞게 결정"""
+    # "{X}가 " 처럼 조사 하나만 붙은 경우 쌍 표기로 정규화
+    template_ko = re.sub(
+        re.escape(TEMPLATE_SLOT) + r'(이|가|을|를|은|는|과|와)(?=\s|$)',
+        lambda m: TEMPLATE_SLOT + SINGLE_PARTICLES[m.group(1)],
+        template_ko,
+    )
+
+    batchim = has_batchim(fragment_ko)
+    ends_with_rieul = bool(fragment_ko) and '가' <= fragment_ko[-1] <= '힣' \
+        and (ord(fragment_ko[-1]) - ord('가')) % 28 == 8
+
+    def resolve(match):
+        with_batchim, without_batchim = PARTICLE_PAIRS[match.group(1)]
+        if match.group(1) == '(으)로' and ends_with_rieul:
+            return fragment_ko + '로'
+        return fragment_ko + (with_batchim if batchim else without_batchim)
+
+    pattern = re.escape(TEMPLATE_SLOT) + '(' + '|'.join(re.escape(p) for p in PARTICLE_PAIRS) + ')'
+    result = re.sub(pattern, resolve, template_ko)
+    return result.replace(TEMPLATE_SLOT, fragment_ko)
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+시장 확률/거래량 시계열 (poly_price_history)
+
+transform_data는 매 실행마다 probs/volume/volume_24hr를 덮어쓰기 때문에 이력이 남지 않는다.
+4시간마다 전체 행을 복사하면 테이블이 실행 횟수만큼 커지므로,
+마지막으로 기록한 이력 값 대비 임계값(epsilon) 이상 움직인 시장만 append-only 테이블에 압축 기록한다.
+  - 비교 기준은 poly_events 현재 행이 아니라 시장별 마지막 이력 (poly_price_latest)
+    (현재 행은 매 실행 덮어써지므로, 실행마다 조금씩 움직이는 시장은 영영 기록되지 않음)
+  - 확률: basis point 고정소수점 SMALLINT[] (0.55 → 5500)
+  - 거래량: 달러 단위 BIGINT
+  - (market_id, captured_at) PK 인덱스로 시장 하나의 시계열을 전체 스캔 없이 조회
+
+사용법:
+    from history import fetch_history_baseline, build_history_rows, append_history
+    baseline = fetch_history_baseline(client, ids) # 시장별 마지막 이력 값 (받은 id만)
+    rows = build_history_rows(records, baseline)   # 움직인 시장만
+    append_history(client, rows, baseline)         # 기록 + poly_price_latest/baseline 갱신
+
+    # 시장 하나의 시계열 조회
+    python history.py <market_id> [--since 2026-02-01]
+"""
+
+import sys
+import argparse
+from typing import List, Dict, Optional
+from datetime import datetime, timezone
+from records import MarketState
+
+# 설정값
+PROB_SCALE = 10000       # 확률 고정소수점 배율 (1 = 0.01%p)
+PROB_EPSILON = 0.005     # 확률 변화 임계값 (0.5%p)
+VOLUME_EPSILON = 0.01    # 거래량 상대 변화 임계값 (1%)
+PAGE_SIZE = 1000
+INSERT_BATCH_SIZE = 1000
+LOOKUP_CHUNK = 100       # id 목록 조회(in_) 한 번에 담을 시장 수 (conditionId 66자 → URL 약 7KB)
+
+
+def encode_probs(probs) -> Optional[List[int]]:
+    """확률 리스트 → basis point 정수 리스트 (파싱 불가 시 None)"""
+    if not isinstance(probs, list):
+        return None
+    try:
+        return [round(float(p) * PROB_SCALE) for p in probs]
+    except (ValueError, TypeError):
+        return None
+
+
+def decode_probs(encoded: Optional[List[int]]) -> Optional[List[float]]:
+    """basis point 정수 리스트 → 확률 리스트"""
+    if encoded is None:
+        return None
+    return [p / PROB_SCALE for p in encoded]
+
+
+def fetch_previous_state(client, ids: List[str]) -> Dict[str, MarketState]:
+    """
+    upsert 전 DB의 직전 상태 조회 (이번에 받은 시장 id만, LOOKUP_CHUNK개씩 in_ 조회)
+
+    closed 여부와 관계없이 조회하므로 실행 사이에 마감/재개된 시장도 새 시장으로 보지 않는다.
+
+    Returns:
+        id → MarketState(id, title, probs, volume, volume_24hr) - DB에 없는 시장은 없음 (= 새 시장)
+    """
+    previous = {}
+    for i in range(0, len(ids), LOOKUP_CHUNK):
+        response = client.table('poly_events') \
+            .select('id, title, probs, volume, volume_24hr') \
+            .in_('id', ids[i:i + LOOKUP_CHUNK]) \
+            .execute()
+        for row in response.data:
+            previous[row['id']] = MarketState(**row)
+    return previous
+
+
+def baseline_state(row: Dict) -> MarketState:
+    """이력 행(poly_price_history / poly_price_latest) → 비교 기준 MarketState"""
+    return MarketState(
+        id=row['market_id'],
+        title=None,
+        probs=decode_probs(row['probs_bp']),
+        volume=row['volume'],
+        volume_24hr=row['volume_24hr'],
+    )
+
+
+def fetch_history_baseline(client, ids: List[str]) -> Dict[str, MarketState]:
+    """
+    시장별 마지막 이력 값 조회 (poly_price_latest, 이번에 받은 시장 id만 LOOKUP_CHUNK개씩 in_ 조회)
+
+    Returns:
+        market_id → MarketState(probs, volume, volume_24hr) - 이력이 없는 시장은 없음 (= 새로 기록)
+    """
+    baseline = {}
+    for i in range(0, len(ids), LOOKUP_CHUNK):
+        response = client.table('poly_price_latest') \
+            .select('market_id, probs_bp, volume, volume_24hr') \
+            .in_('market_id', ids[i:i + LOOKUP_CHUNK]) \
+            .execute()
+        for row in response.data:
+            baseline[row['market_id']] = baseline_state(row)
+    return baseline
+
+
+def encode_volume(volume) -> int:
+    """거래량 → 저장 단위(달러 정수, BIGINT)"""
+    return round(float(volume or 0))
+
+
+def _volume_moved(old, new, epsilon: float) -> bool:
+    """저장 단위로 맞춘 뒤 비교 (기준은 반올림된 저장값이므로 소수 거래량이 매번 움직인 것으로 보이지 않게)"""
+    old = encode_volume(old)
+    new = encode_volume(new)
+    return abs(new - old) > epsilon * max(abs(old), 1.0)
+
+
+def has_moved(prev, record,
+              prob_epsilon: float = PROB_EPSILON,
+              volume_epsilon: float = VOLUME_EPSILON) -> bool:
+    """
+    비교 기준(마지막 이력) 대비 확률 또는 거래량이 임계값 이상 움직였는지 (기준이 없으면 True)
+
+    prev/record는 probs, volume, volume_24hr 속성을 가진 MarketState/MarketRecord
+    """
+    if prev is None:
+        return True
+
+    old_probs = encode_probs(prev.probs)
+    new_probs = encode_probs(record.probs)
+    if old_probs is None or new_probs is None or len(old_probs) != len(new_probs):
+        if old_probs != new_probs:
+            return True
+    elif any(abs(o - n) > prob_epsilon * PROB_SCALE for o, n in zip(old_probs, new_probs)):
+        return True
+
+    return _volume_moved(prev.volume, record.volume, volume_epsilon) \
+        or _volume_moved(prev.volume_24hr, record.volume_24hr, volume_epsilon)
+
+
+def build_history_rows(records: List, previous: Dict[str, MarketState],
+                       prob_epsilon: float = PROB_EPSILON,
+                       volume_epsilon: float = VOLUME_EPSILON,
+                       captured_at: str = None) -> List[Dict]:
+    """움직인 시장만 이력 행으로 변환 (previous = 시장별 마지막 이력, 한 실행의 행은 같은 captured_at 공유)"""
+    captured_at = captured_at or datetime.now(timezone.utc).isoformat()
+    rows = []
+    for record in records:
+        if not has_moved(previous.get(record.id), record, prob_epsilon, volume_epsilon):
+            continue
+        rows.append({
+            'market_id': record.id,
+            'captured_at': captured_at,
+            'probs_bp': encode_probs(record.probs),
+            'volume': encode_volume(record.volume),
+            'volume_24hr': encode_volume(record.volume_24hr),
+        })
+    return rows
+
+
+def append_history(client, rows: List[Dict], baseline: Dict[str, MarketState] = None,
+                   batch_size: int = INSERT_BATCH_SIZE) -> dict:
+    """
+    이력 행 배치 insert (append-only) + 시장별 마지막 값(poly_price_latest) 갱신
+
+    baseline(메모리 비교 기준)을 넘기면 저장에 성공한 행으로 함께 갱신한다.
+    """
+    total_success = 0
+    errors = []
+    for i in range(0, len(rows), batch_size):
+        batch = rows[i:i + batch_size]
+        try:
+            client.table('poly_price_history') \
+                .upsert(batch, on_conflict='market_id,captured_at', ignore_duplicates=True) \
+                .execute()
+            client.table('poly_price_latest') \
+                .upsert(batch, on_conflict='market_id') \
+                .execute()
+            total_success += len(batch)
+        except Exception as e:
+            errors.append(f"이력 배치 {i // batch_size + 1} 오류: {str(e)}")
+            continue
+
+        if baseline is not None:
+            for row in batch:
+                baseline[row['market_id']] = baseline_state(row)
+
+    return {"success": total_success, "errors": errors}
+
+
+def fetch_market_series(client, market_id: str, since: str = None, until: str = None) -> List[Dict]:
+    """
+    시장 하나의 확률/거래량 시계열 복원 ((market_id, captured_at) PK 인덱스 범위 조회)
+
+    Returns:
+        [{'captured_at', 'probs', 'volume', 'volume_24hr'}, ...] (시간순)
+    """
+    series = []
+    last_captured = None
+    while True:
+        query = client.table('poly_price_history') \
+            .select('captured_at, probs_bp, volume, volume_24hr') \
+            .eq('market_id', market_id)
+        if since:
+            query = query.gte('captured_at', since)
+        if until:
+            query = query.lt('captured_at', until)
+        if last_captured is not None:
+            query = query.gt('captured_at', last_captured)
+        response = query.order('captured_at').limit(PAGE_SIZE).execute()
+
+        for row in response.data:
+            series.append({
+                'captured_at': row['captured_at'],
+                'probs': decode_probs(row['probs_bp']),
+                'volume': row['volume'],
+                'volume_24hr': row['volume_24hr'],
+            })
+
+        if len(response.data) < PAGE_SIZE:
+            break
+        last_captured = response.data[-1]['captured_at']
+
+    return series
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시장 확률/거래량 시계열 조회')
+    parser.add_argument('market_id', help='시장 ID (conditionId)')
+    parser.add_argument('--since', default=None, help='시작 시각 (YYYY-MM-DD)')
+    parser.add_argument('--until', default=None, help='종료 시각 (YYYY-MM-DD)')
+    args = parser.parse_args()
+
+    from supabase import create_client
+    from main import load_env
+
+    try:
+        supabase_url, supabase_key = load_env()
+    except ValueError as e:
+        print(f"✗ 환경 변수 오류: {e}")
+        sys.exit(1)
+
+    client = create_client(supabase_url, supabase_key)
+    series = fetch_market_series(client, args.market_id, args.since, args.until)
+
+    print(f"  {args.market_id[:16]}... 이력 {len(series)}건")
+    for point in series:
+        probs = ', '.join(f"{p:.2%}" for p in point['probs'] or [])
+        print(f"  {point['captured_at'][:16]} | {probs:<20} | "
+              f"거래량 ${point['volume']:,} | 24h ${point['volume_24hr']:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,22 +3,64 @@ Polymarket ETL Pipeline
 - Polymarket API에서 모든 이벤트 데이터를 가져와 Supabase에 저장
 - 페이지네이션으로 전체 시장 수집
 - 캘린더 기능용 데이터 수집 (필터 없이 전체 아카이빙)
+- 확률/거래량이 움직인 시장은 poly_price_history에 이력 기록
+- hot 모드: 거래량 상위/곧 마감 시장만 ID로 병렬 조회해 확률/거래량만 갱신 (수 초)
+- --translate: 새로 들어왔거나 제목이 바뀐 시장만 바로 번역 큐로 전달 (translate-on-ingest)
+- --record / --replay: API 원본 페이지 기록, 운영 API/DB 없이 N배 규모로 재생 (replay.py)
+
+사용법:
+    python main.py
+    python main.py --hot                                       # hot 시장만 빠르게 갱신
+    python main.py --hot --top-n 300 --ends-within-hours 12
+    python main.py --translate --exclude-sports                 # 수집 직후 새 시장 번역
+    python main.py --prob-epsilon 0.01 --volume-epsilon 0.05   # 이력 기록 임계값 조정
+    python main.py --no-history                                # 이력 기록 생략
+    python main.py --record pages.jsonl.gz                     # API 원본 페이지 기록
+    python main.py --replay pages.jsonl.gz --scale 10 --sink sqlite:/tmp/replay.db
 """
 
+from __future__ import annotations
+
 import os
+import re
 import json
+import hashlib
+import time
+import argparse
 import requests
-from typing import Optional
-from dotenv import load_dotenv
-from supabase import create_client, Client
+from typing import Optional, Callable, Iterable, Iterator, TYPE_CHECKING
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from history import (
+    fetch_previous_state, fetch_history_baseline, build_history_rows, append_history,
+    PROB_EPSILON, VOLUME_EPSILON,
+)
+from records import MarketRecord, MarketState
+from stats import refresh_event_stats, refresh_tag_index
+
+# supabase/dotenv는 import 비용이 커서 실제로 쓰는 시점에 불러옴 (--help, backfill 워커 등)
+if TYPE_CHECKING:
+    from supabase import Client
 
 # 설정값
 BATCH_SIZE = 500  # API 최대 limit
 REQUEST_TIMEOUT = 60
+MARKETS_URL = "https://gamma-api.polymarket.com/markets"
+
+# hot 모드 설정값
+HOT_TOP_N = 200               # volume_24hr 상위 시장 수
+HOT_ENDS_WITHIN_HOURS = 24    # 이 시간 안에 마감하는 시장도 포함
+HOT_FETCH_CHUNK = 50          # ID 조회 요청 하나에 담을 시장 수
+HOT_WORKERS = 8               # ID 조회 병렬 요청 수
+HOT_REQUEST_TIMEOUT = 15
+HOT_FIELDS = ("id", "title", "probs", "volume", "volume_24hr")  # upsert에 필요한 id/title + 갱신 필드
+STALE_TRANSLATION = {"title_ko": None, "title_ko_raw": None, "postprocess_version": None}  # 제목 변경 시 지울 번역
 
 
 def load_env() -> tuple[str, str]:
     """환경 변수 로드"""
+    from dotenv import load_dotenv
     load_dotenv()
 
     supabase_url = os.getenv("SUPABASE_URL")
@@ -30,10 +72,9 @@ def load_env() -> tuple[str, str]:
     return supabase_url, supabase_key
 
 
-def fetch_polymarket_data() -> list[dict]:
-    """Polymarket API에서 모든 진행 중인 이벤트 데이터 가져오기 (페이지네이션)"""
-    url = "https://gamma-api.polymarket.com/markets"
-    all_data = []
+def iter_polymarket_pages() -> Iterator[list[dict]]:
+    """Polymarket API에서 진행 중인 이벤트를 페이지 단위로 가져오기 (원본 dict를 한꺼번에 들고 있지 않음)"""
+    url = MARKETS_URL
     offset = 0
 
     print(f"  데이터 수집 중", end="", flush=True)
@@ -52,7 +93,7 @@ def fetch_polymarket_data() -> list[dict]:
         if not batch:
             break
 
-        all_data.extend(batch)
+        yield batch
         print(".", end="", flush=True)
 
         if len(batch) < BATCH_SIZE:
@@ -61,7 +102,11 @@ def fetch_polymarket_data() -> list[dict]:
         offset += BATCH_SIZE
 
     print()  # 줄바꿈
-    return all_data
+
+
+def fetch_polymarket_data() -> list[dict]:
+    """Polymarket API에서 모든 진행 중인 이벤트 데이터 가져오기 (페이지네이션)"""
+    return [item for page in iter_polymarket_pages() for item in page]
 
 
 def safe_json_parse(value):
@@ -74,6 +119,32 @@ def safe_json_parse(value):
     return value
 
 
+def normalize_tags(value) -> list[str]:
+    """
+    태그 정규화: JSON 문자열/문자열 목록/{label, slug} 객체 목록 → 라벨 문자열 목록
+
+    앞뒤 공백 제거, 빈 값 제거, 대소문자만 다른 중복은 처음 값 하나만 유지.
+    poly_tags 차원 테이블(migration.sql 8번)은 이 라벨 단위로 집계된다.
+    """
+    tags = safe_json_parse(value)
+    if not isinstance(tags, list):
+        return []
+
+    normalized = []
+    seen = set()
+    for tag in tags:
+        if isinstance(tag, dict):
+            tag = tag.get("label") or tag.get("slug")
+        if not isinstance(tag, str):
+            continue
+        tag = " ".join(tag.split())
+        if not tag or tag.lower() in seen:
+            continue
+        seen.add(tag.lower())
+        normalized.append(tag)
+    return normalized
+
+
 def safe_float(value) -> float:
     """안전하게 float으로 변환"""
     if value is None:
@@ -88,6 +159,148 @@ def safe_float(value) -> float:
     return 0.0
 
 
+# Sports 키워드 (대폭 확장)
+SPORTS_KEYWORDS = [
+    # 기존 키워드
+    'nba', 'nfl', 'nhl', 'mlb', 'soccer', 'basketball', 'football', 'baseball',
+    'hockey', 'ncaa', 'fifa', 'champion', 'playoff', 'finals', 'game',
+    'vs', 'vs.', ' v ', ' v. ', 'versus', 'team', 'player', 'score', 'win', 'match', 'tennis',
+    'cricket', 'golf', 'racing', 'boxing', 'ufc', 'mma', 'esports', 'league', 'tournament',
+    'bowl', 'spread', 'finish', 'standings', 'ligue', 'halftime', 'points',
+    # 새로 추가된 키워드
+    'rebounds', 'assists', 'over/under', 'o/u', 'rushing yards', 'receiving yards',
+    'passing yards', 'touchdowns', 'interceptions', 'field goal', 'dvalishvili',
+    'yan', 'fight', 'promoted', 'epl', 'premier league', 'wrestle', 'athletic',
+    # 2차 추가
+    'traded to', 'sign with', 'manager of', 'rookie card', 'advance to', 'qualify to',
+    'manchester united', 'real madrid', 'juventus', 'antetokounmpo', 'jokic', 'cs2',
+    'masters santiago', 'valorant', 'red bull', 'scream 7',
+    # 3차 추가 (F1, e스포츠, 기타 스포츠)
+    'f1', 'grand prix', 'pole position', 'fastest lap', 'verstappen', 'hamilton',
+    'leclerc', 'norris', 'mclaren', 'mercedes', 'ferrari', 'ucl', 'esl', 'lcs'
+]
+
+# Crypto 키워드 (주요 암호화폐 추가)
+CRYPTO_KEYWORDS = [
+    # 기존 키워드
+    'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'blockchain', 'defi',
+    'nft', 'solana', 'xrp', 'ripple', 'cardano', 'ada', 'doge', 'coin',
+    'token', 'wallet', 'mining', 'exchange', 'binance', 'coinbase',
+    'base', 'fdv', 'market cap', 'mcap',
+    # 새로 추가된 암호화폐
+    'hyperliquid', 'pump.fun', 'zcash', 'plasma', 'pyusd', 'gho', 'usr',
+    'bnb', 'doppler', 'lighter', 'usdc', 'usdt', 'stablecoin', 'depeg',
+    'web3', 'dao', 'consensys',
+    # 2차 추가
+    'uni', 'uniswap', 'fabric', 'vitalik buterin', 'sbf', 'arthur hayes',
+    'ansem', 'anatoly yakovenko', 'saylor',
+    # 3차 추가 (암호화폐/블록체인 관련 용어)
+    'cex', 'insolvent', 'rwa', 'satoshi'
+]
+
+# Politics 키워드 (국제 정치, 법률 추가)
+POLITICS_KEYWORDS = [
+    # 기존 키워드
+    'trump', 'biden', 'president', 'election', 'congress', 'senate',
+    'democrat', 'republican', 'vote', 'poll', 'campaign', 'governor',
+    'mayor', 'minister', 'parliament', 'government', 'political',
+    'israel', 'palestine', 'military', 'guilty', 'sentenced', 'trial',
+    'court', 'lawsuit', 'verdict', 'justice',
+    # 새로 추가된 키워드
+    'nuclear', 'strike', 'iran', 'russia', 'trade deal', 'trade agreement',
+    'modi', 'netanyahu', 'erdogan', 'xi jinping', 'macron', 'leader out',
+    'scotus', 'supreme court', 'conviction', 'indictment', 'war', 'peace',
+    'sanctions', 'diplomatic', 'united nations', 'secretary general',
+    'yoon', 'custody', 'venezuela', 'china', 'taiwan',
+    # 2차 추가
+    'zelenskyy', 'putin', 'bernie endorse', 'arrested', 'exiled', 'maduro',
+    'nato', 'abraham accords', 'saudi arabia', 'oman', 'rsf', 'khartoum',
+    'ilhan omar', 'convicted', 'charged with', 'epstein', 'aguiar',
+    # 3차 추가 (국제정치, 정치인 관련 용어)
+    'hamas', 'damascus', 'deport', 'brics', 'starmer', 'trudeau', 'gaza'
+]
+
+# Finance 키워드 (주식, 원자재, 경제지표 추가)
+FINANCE_KEYWORDS = [
+    # 기존 키워드
+    'stock', 'market', 'economy', 'gdp', 'inflation', 'fed', 'federal reserve',
+    'dow', 'nasdaq', 's&p', 'trading', 'price', 'dollar', 'euro', 'bank',
+    'earnings', 'quarterly', 'revenue', 'profit',
+    # 새로 추가된 키워드
+    'silver', 'gold', 'oil', 'crude', 'commodity', 'treasury', 'yield',
+    'debt', 'trillion', 'nvidia', 'nvda', 'amazon', 'amzn', 'meta',
+    'palantir', 'pltr', 'opendoor', 'ipo', 'magnificent 7', 'ecb',
+    'interest rate', 'bps', 'unemployment', 'home value', 'median',
+    'eggs cost', 'tsa passengers', 'kospi', 'nikkei',
+    # 2차 추가
+    'ceo of', 'mortgage rate', 'recession', 'net worth', 'richest person',
+    'doordash', 'lululemon', 'glencore', 'rio tinto', 'merger', 'bezos',
+    'ellison', 'jensen huang', 'larry page', 'elon musk\'s net worth',
+    # 3차 추가 (외환, 경제 지표 관련 용어)
+    'eur/usd', 'fomc', 'mortgage', 'forex'
+]
+
+# Pop Culture 키워드 (소셜미디어, 엔터테인먼트 추가)
+CULTURE_KEYWORDS = [
+    # 기존 키워드
+    'movie', 'film', 'album', 'song', 'artist', 'celebrity', 'award',
+    'oscar', 'grammy', 'emmy', 'netflix', 'spotify', 'box office',
+    'euphoria', 'season', 'episode', 'show', 'series', 'die',
+    # 새로 추가된 키워드
+    'elon musk tweet', 'elon musk post', 'james bond', 'avatar', 'star wars',
+    'taylor swift', 'wedding', 'mrbeast', 'mindshare', 'views',
+    'streaming', 'concert', 'babymonster', 'kpop', 'anime', 'manga',
+    'tom holland', 'jack lowdon', 'marvel', 'disney', 'hbo',
+    # 2차 추가
+    'billboard', 'debut no.1', 'podcast', 'divorce', 'bill clinton',
+    'creative director', 'versace', 'opening weekend', 'domestically',
+    'marty supreme', 'greenland', 'anaconda', 'bully', 'drake maye',
+    'boy names', 'girl names', 'ssa', 'baby names',
+    # 3차 추가 (유명인, 게임, 소셜미디어 관련 용어)
+    'pregnant', 'perform at', 'world tour', 'bts', 'half-life 3', 'kylie jenner', 'beyoncé'
+]
+
+# Science/Tech 키워드 (날씨, 자연재해, AI 추가)
+SCIENCE_KEYWORDS = [
+    # 기존 키워드
+    'ai', 'artificial intelligence', 'robot', 'space', 'nasa', 'spacex',
+    'climate', 'vaccine', 'drug', 'technology', 'apple', 'google',
+    'microsoft', 'tesla', 'research', 'scientific',
+    'artemis', 'rocket', 'launch', 'temperature', 'weather', 'celsius',
+    'fahrenheit', 'forecast',
+    # 새로 추가된 키워드
+    '°c', '°f', 'hottest year', 'tornado', 'earthquake', 'megaquake',
+    'natural disaster', 'magnitude', 'measles', 'epidemic', 'pandemic',
+    'grok', 'gpt', 'released', 'anthropic', 'openai', 'chatbot',
+    'llm', 'machine learning', 'cerebras', 'chipmaker', 'semiconductor',
+    'highest temperature', 'lowest temperature', 'ankara', 'seattle',
+    # 2차 추가
+    'volcanic eruptions', 'vei', 'cloudflare incident', 'waymo', 'autonomous',
+    'self-driving', 'valve', 'cache', 'map pool',
+    # 3차 추가 (기후, 자연재해, 기술 서비스 관련 용어)
+    'hurricane', 'typhoon', 'hottest on record', 'aws', 'disrupted'
+]
+
+# 키워드 매칭 순서 (순서 중요: 더 구체적인 것부터 체크)
+CATEGORY_KEYWORDS = [
+    ('Sports', SPORTS_KEYWORDS),
+    ('Crypto', CRYPTO_KEYWORDS),
+    ('Politics', POLITICS_KEYWORDS),
+    ('Finance', FINANCE_KEYWORDS),
+    ('Pop Culture', CULTURE_KEYWORDS),
+    ('Science', SCIENCE_KEYWORDS),
+]
+
+
+@lru_cache(maxsize=None)
+def get_category_matchers() -> list[tuple[str, re.Pattern]]:
+    """카테고리별 키워드 매처 (프로세스당 한 번만 컴파일, 부분 문자열 매칭은 기존 any(...)와 동일)"""
+    return [
+        (category, re.compile("|".join(re.escape(keyword) for keyword in keywords)))
+        for category, keywords in CATEGORY_KEYWORDS
+    ]
+
+
 def infer_category_from_title(title: str, category: Optional[str], tags: list = None) -> str:
     """제목 + 태그 기반으로 카테고리 추론"""
     if category and category != "Uncategorized":
@@ -104,146 +317,15 @@ def infer_category_from_title(title: str, category: Optional[str], tags: list =
 
     title_lower = search_text
 
-    # Sports 키워드 (대폭 확장)
-    sports_keywords = [
-        # 기존 키워드
-        'nba', 'nfl', 'nhl', 'mlb', 'soccer', 'basketball', 'football', 'baseball',
-        'hockey', 'ncaa', 'fifa', 'champion', 'playoff', 'finals', 'game',
-        'vs', 'vs.', ' v ', ' v. ', 'versus', 'team', 'player', 'score', 'win', 'match', 'tennis',
-        'cricket', 'golf', 'racing', 'boxing', 'ufc', 'mma', 'esports', 'league', 'tournament',
-        'bowl', 'spread', 'finish', 'standings', 'ligue', 'halftime', 'points',
-        # 새로 추가된 키워드
-        'rebounds', 'assists', 'over/under', 'o/u', 'rushing yards', 'receiving yards',
-        'passing yards', 'touchdowns', 'interceptions', 'field goal', 'dvalishvili',
-        'yan', 'fight', 'promoted', 'epl', 'premier league', 'wrestle', 'athletic',
-        # 2차 추가
-        'traded to', 'sign with', 'manager of', 'rookie card', 'advance to', 'qualify to',
-        'manchester united', 'real madrid', 'juventus', 'antetokounmpo', 'jokic', 'cs2',
-        'masters santiago', 'valorant', 'red bull', 'scream 7',
-        # 3차 추가 (F1, e스포츠, 기타 스포츠)
-        'f1', 'grand prix', 'pole position', 'fastest lap', 'verstappen', 'hamilton',
-        'leclerc', 'norris', 'mclaren', 'mercedes', 'ferrari', 'ucl', 'esl', 'lcs'
-    ]
-
-    # Crypto 키워드 (주요 암호화폐 추가)
-    crypto_keywords = [
-        # 기존 키워드
-        'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'blockchain', 'defi',
-        'nft', 'solana', 'xrp', 'ripple', 'cardano', 'ada', 'doge', 'coin',
-        'token', 'wallet', 'mining', 'exchange', 'binance', 'coinbase',
-        'base', 'fdv', 'market cap', 'mcap',
-        # 새로 추가된 암호화폐
-        'hyperliquid', 'pump.fun', 'zcash', 'plasma', 'pyusd', 'gho', 'usr',
-        'bnb', 'doppler', 'lighter', 'usdc', 'usdt', 'stablecoin', 'depeg',
-        'web3', 'dao', 'consensys',
-        # 2차 추가
-        'uni', 'uniswap', 'fabric', 'vitalik buterin', 'sbf', 'arthur hayes',
-        'ansem', 'anatoly yakovenko', 'saylor',
-        # 3차 추가 (암호화폐/블록체인 관련 용어)
-        'cex', 'insolvent', 'rwa', 'satoshi'
-    ]
-
-    # Politics 키워드 (국제 정치, 법률 추가)
-    politics_keywords = [
-        # 기존 키워드
-        'trump', 'biden', 'president', 'election', 'congress', 'senate',
-        'democrat', 'republican', 'vote', 'poll', 'campaign', 'governor',
-        'mayor', 'minister', 'parliament', 'government', 'political',
-        'israel', 'palestine', 'military', 'guilty', 'sentenced', 'trial',
-        'court', 'lawsuit', 'verdict', 'justice',
-        # 새로 추가된 키워드
-        'nuclear', 'strike', 'iran', 'russia', 'trade deal', 'trade agreement',
-        'modi', 'netanyahu', 'erdogan', 'xi jinping', 'macron', 'leader out',
-        'scotus', 'supreme court', 'conviction', 'indictment', 'war', 'peace',
-        'sanctions', 'diplomatic', 'united nations', 'secretary general',
-        'yoon', 'custody', 'venezuela', 'china', 'taiwan',
-        # 2차 추가
-        'zelenskyy', 'putin', 'bernie endorse', 'arrested', 'exiled', 'maduro',
-        'nato', 'abraham accords', 'saudi arabia', 'oman', 'rsf', 'khartoum',
-        'ilhan omar', 'convicted', 'charged with', 'epstein', 'aguiar',
-        # 3차 추가 (국제정치, 정치인 관련 용어)
-        'hamas', 'damascus', 'deport', 'brics', 'starmer', 'trudeau', 'gaza'
-    ]
-
-    # Finance 키워드 (주식, 원자재, 경제지표 추가)
-    finance_keywords = [
-        # 기존 키워드
-        'stock', 'market', 'economy', 'gdp', 'inflation', 'fed', 'federal reserve',
-        'dow', 'nasdaq', 's&p', 'trading', 'price', 'dollar', 'euro', 'bank',
-        'earnings', 'quarterly', 'revenue', 'profit',
-        # 새로 추가된 키워드
-        'silver', 'gold', 'oil', 'crude', 'commodity', 'treasury', 'yield',
-        'debt', 'trillion', 'nvidia', 'nvda', 'amazon', 'amzn', 'meta',
-        'palantir', 'pltr', 'opendoor', 'ipo', 'magnificent 7', 'ecb',
-        'interest rate', 'bps', 'unemployment', 'home value', 'median',
-        'eggs cost', 'tsa passengers', 'kospi', 'nikkei',
-        # 2차 추가
-        'ceo of', 'mortgage rate', 'recession', 'net worth', 'richest person',
-        'doordash', 'lululemon', 'glencore', 'rio tinto', 'merger', 'bezos',
-        'ellison', 'jensen huang', 'larry page', 'elon musk\'s net worth',
-        # 3차 추가 (외환, 경제 지표 관련 용어)
-        'eur/usd', 'fomc', 'mortgage', 'forex'
-    ]
-
-    # Pop Culture 키워드 (소셜미디어, 엔터테인먼트 추가)
-    culture_keywords = [
-        # 기존 키워드
-        'movie', 'film', 'album', 'song', 'artist', 'celebrity', 'award',
-        'oscar', 'grammy', 'emmy', 'netflix', 'spotify', 'box office',
-        'euphoria', 'season', 'episode', 'show', 'series', 'die',
-        # 새로 추가된 키워드
-        'elon musk tweet', 'elon musk post', 'james bond', 'avatar', 'star wars',
-        'taylor swift', 'wedding', 'mrbeast', 'mindshare', 'views',
-        'streaming', 'concert', 'babymonster', 'kpop', 'anime', 'manga',
-        'tom holland', 'jack lowdon', 'marvel', 'disney', 'hbo',
-        # 2차 추가
-        'billboard', 'debut no.1', 'podcast', 'divorce', 'bill clinton',
-        'creative director', 'versace', 'opening weekend', 'domestically',
-        'marty supreme', 'greenland', 'anaconda', 'bully', 'drake maye',
-        'boy names', 'girl names', 'ssa', 'baby names',
-        # 3차 추가 (유명인, 게임, 소셜미디어 관련 용어)
-        'pregnant', 'perform at', 'world tour', 'bts', 'half-life 3', 'kylie jenner', 'beyoncé'
-    ]
-
-    # Science/Tech 키워드 (날씨, 자연재해, AI 추가)
-    science_keywords = [
-        # 기존 키워드
-        'ai', 'artificial intelligence', 'robot', 'space', 'nasa', 'spacex',
-        'climate', 'vaccine', 'drug', 'technology', 'apple', 'google',
-        'microsoft', 'tesla', 'research', 'scientific',
-        'artemis', 'rocket', 'launch', 'temperature', 'weather', 'celsius',
-        'fahrenheit', 'forecast',
-        # 새로 추가된 키워드
-        '°c', '°f', 'hottest year', 'tornado', 'earthquake', 'megaquake',
-        'natural disaster', 'magnitude', 'measles', 'epidemic', 'pandemic',
-        'grok', 'gpt', 'released', 'anthropic', 'openai', 'chatbot',
-        'llm', 'machine learning', 'cerebras', 'chipmaker', 'semiconductor',
-        'highest temperature', 'lowest temperature', 'ankara', 'seattle',
-        # 2차 추가
-        'volcanic eruptions', 'vei', 'cloudflare incident', 'waymo', 'autonomous',
-        'self-driving', 'valve', 'cache', 'map pool',
-        # 3차 추가 (기후, 자연재해, 기술 서비스 관련 용어)
-        'hurricane', 'typhoon', 'hottest on record', 'aws', 'disrupted'
-    ]
-
     # 키워드 매칭 (순서 중요: 더 구체적인 것부터 체크)
-    if any(keyword in title_lower for keyword in sports_keywords):
-        return 'Sports'
-    if any(keyword in title_lower for keyword in crypto_keywords):
-        return 'Crypto'
-    if any(keyword in title_lower for keyword in politics_keywords):
-        return 'Politics'
-    if any(keyword in title_lower for keyword in finance_keywords):
-        return 'Finance'
-    if any(keyword in title_lower for keyword in culture_keywords):
-        return 'Pop Culture'
-    if any(keyword in title_lower for keyword in science_keywords):
-        return 'Science'
+    for name, matcher in get_category_matchers():
+        if matcher.search(title_lower):
+            return name
 
     return 'Uncategorized'
 
 
-def transform_data(raw_data: list[dict]) -> list[dict]:
+def transform_data(raw_data: list[dict]) -> list[MarketRecord]:
     """API 응답 데이터를 DB 스키마에 맞게 변환 (필터 없이 전체)"""
     transformed = []
 
@@ -254,12 +336,8 @@ def transform_data(raw_data: list[dict]) -> list[dict]:
         # outcomes 처리
         outcomes = safe_json_parse(item.get("outcomes"))
 
-        # tags 처리: None이면 빈 배열
-        tags = item.get("tags")
-        if tags is None:
-            tags = []
-        elif isinstance(tags, str):
-            tags = safe_json_parse(tags) or []
+        # tags 처리: 라벨 문자열 목록으로 정규화 (없으면 빈 배열)
+        tags = normalize_tags(item.get("tags"))
 
         # 카테고리 추론 (API category 우선, 없으면 제목 + 태그에서 추론)
         inferred_cat = infer_category_from_title(
@@ -275,33 +353,40 @@ def transform_data(raw_data: list[dict]) -> list[dict]:
         if events and isinstance(events, list) and len(events) > 0:
             event_slug = events[0].get("slug")
 
-        record = {
-            "id": item.get("conditionId"),
-            "title": item.get("question"),
-            "slug": item.get("slug"),
-            "event_slug": event_slug,
-            "end_date": item.get("endDate"),
-            "api_created_at": item.get("createdAt"),
-            "volume": safe_float(item.get("volume")),
-            "volume_24hr": safe_float(item.get("volume24hr")),
-            "probs": outcome_prices,
-            "outcomes": outcomes,
-            "category": inferred_cat,
-            "tags": tags,
-            "image_url": item.get("image"),
-            "closed": item.get("closed", False),  # 정산 여부
-            "description": item.get("description"),  # Rules/설명 텍스트
-        }
-
         # id가 없는 레코드는 건너뛰기
-        if record["id"]:
-            transformed.append(record)
+        market_id = item.get("conditionId")
+        if not market_id:
+            continue
+
+        transformed.append(MarketRecord(
+            id=market_id,
+            title=item.get("question"),
+            slug=item.get("slug"),
+            event_slug=event_slug,
+            end_date=item.get("endDate"),
+            api_created_at=item.get("createdAt"),
+            volume=safe_float(item.get("volume")),
+            volume_24hr=safe_float(item.get("volume24hr")),
+            probs=outcome_prices,
+            outcomes=outcomes,
+            category=inferred_cat,
+            tags=tags,
+            image_url=item.get("image"),
+            closed=item.get("closed", False),  # 정산 여부
+            description=item.get("description"),  # Rules/설명 텍스트
+        ))
 
     return transformed
 
 
-def upsert_to_supabase(client: Client, data: list[dict], batch_size: int = 500) -> dict:
-    """Supabase에 데이터 Upsert (Insert or Update) - 배치 처리"""
+def upsert_to_supabase(client: Client, data: list[MarketRecord], batch_size: int = 500,
+                       columns: tuple[str, ...] = None) -> dict:
+    """
+    Supabase에 데이터 Upsert (Insert or Update) - 배치 처리
+
+    payload dict는 배치 단위로만 만들어 전체 레코드 수만큼 dict를 쌓지 않음.
+    columns를 주면 해당 컬럼만 갱신 (hot 모드).
+    """
     if not data:
         return {"success": 0, "errors": ["저장할 데이터가 없습니다."]}
 
@@ -313,7 +398,7 @@ def upsert_to_supabase(client: Client, data: list[dict], batch_size: int = 500)
     print(f"  저장 중 ({total_batches}개 배치)", end="", flush=True)
 
     for i in range(0, len(data), batch_size):
-        batch = data[i:i + batch_size]
+        batch = [record.to_payload(columns) for record in data[i:i + batch_size]]
         try:
             result = client.table("poly_events").upsert(
                 batch,
@@ -333,10 +418,357 @@ def upsert_to_supabase(client: Client, data: list[dict], batch_size: int = 500)
     }
 
 
+def select_hot_markets(client: Client, top_n: int = HOT_TOP_N,
+                       ends_within_hours: int = HOT_ENDS_WITHIN_HOURS,
+                       snapshot: list[MarketRecord] = None) -> list[MarketState | MarketRecord]:
+    """
+    hot 시장 선정: volume_24hr 상위 N개 + 곧 마감하는 시장
+
+    snapshot(직전 전체 실행의 변환 결과)이 있으면 DB 조회 없이 메모리에서 선정.
+    반환 항목에는 직전 probs/volume이 들어 있어 이력 비교에 그대로 사용.
+    """
+    now = datetime.now(timezone.utc)
+    deadline = now + timedelta(hours=ends_within_hours)
+
+    if snapshot is not None:
+        def ends_at(record):
+            try:
+                return datetime.fromisoformat(record.end_date.replace("Z", "+00:00"))
+            except (AttributeError, ValueError):
+                return None
+
+        live = [r for r in snapshot if not r.closed and (ends_at(r) or deadline) >= now]
+        top = sorted(live, key=lambda r: r.volume_24hr, reverse=True)[:top_n]
+        ending = [r for r in live if (ends_at(r) or deadline) < deadline]
+        candidates = top + ending
+    else:
+        columns = "id, title, probs, volume, volume_24hr"
+        top = client.table("poly_events").select(columns) \
+            .eq("closed", False) \
+            .gte("end_date", now.isoformat()) \
+            .order("volume_24hr", desc=True) \
+            .limit(top_n).execute()
+        ending = client.table("poly_events").select(columns) \
+            .eq("closed", False) \
+            .gte("end_date", now.isoformat()) \
+            .lt("end_date", deadline.isoformat()) \
+            .order("volume_24hr", desc=True) \
+            .limit(top_n).execute()
+        candidates = [MarketState(**row) for row in top.data + ending.data]
+
+    # 중복 제거 (순서 유지)
+    hot = {}
+    for market in candidates:
+        hot.setdefault(market.id, market)
+    return list(hot.values())
+
+
+def fetch_markets_by_ids(ids: list[str], chunk_size: int = HOT_FETCH_CHUNK,
+                         workers: int = HOT_WORKERS) -> list[dict]:
+    """conditionId 목록으로 시장만 병렬 조회 (정산된 시장도 최종 가격 반영을 위해 포함)"""
+    def fetch_chunk(chunk):
+        response = requests.get(
+            MARKETS_URL,
+            params={"condition_ids": chunk, "limit": len(chunk)},
+            timeout=HOT_REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(fetch_chunk, chunks)
+        return [market for batch in results for market in batch]
+
+
+def record_fingerprint(record: MarketRecord) -> bytes:
+    """레코드 내용 지문 (직전 실행 대비 변경 감지용, 8바이트)"""
+    payload = json.dumps(record.to_payload(), sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+def detect_ingested(records: list[MarketRecord], previous: dict) -> list[dict]:
+    """직전 상태 대비 새로 들어왔거나 제목이 바뀐 시장 (수집 직후 번역 대상)"""
+    ingested = []
+    for record in records:
+        prev = previous.get(record.id)
+        if prev is None or prev.title != record.title:
+            ingested.append({
+                "id": record.id,
+                "title": record.title,
+                "event_slug": record.event_slug,
+                "category": record.category,
+            })
+    return ingested
+
+
+def clear_stale_translations(client: Client, ids: list[str], chunk_size: int = HOT_FETCH_CHUNK) -> list[str]:
+    """제목이 바뀐 시장의 기존 번역 제거 (재번역 전까지 옛 제목 번역이 노출되지 않도록) → 오류 목록"""
+    errors = []
+    for i in range(0, len(ids), chunk_size):
+        try:
+            client.table("poly_events").update(STALE_TRANSLATION).in_("id", ids[i:i + chunk_size]).execute()
+        except Exception as e:
+            errors.append(f"번역 초기화 {i // chunk_size + 1} 오류: {str(e)}")
+    return errors
+
+
+def _report_ingested(client: Client, records: list[MarketRecord], previous: Optional[dict],
+                     on_ingest: Optional[Callable[[list[dict]], None]], result: dict):
+    """새 시장/제목 변경 시장을 result에 기록하고 on_ingest(번역 큐)로 전달 (제목 변경 시장은 번역 초기화)"""
+    if previous is None:
+        return
+    ingested = detect_ingested(records, previous)
+    result["ingested"] = ingested
+
+    retitled = [e["id"] for e in ingested if e["id"] in previous]
+    if retitled:
+        errors = clear_stale_translations(client, retitled)
+        print(f"✓ 제목 변경: {len(retitled)}건 번역 초기화" + (f" (오류 {len(errors)}건)" if errors else ""))
+        result["errors"].extend(errors)
+    if on_ingest and ingested:
+        print(f"✓ 새 시장/제목 변경: {len(ingested)}건 → 번역 큐")
+        on_ingest(ingested)
+
+
+def run_full_etl(client: Client, prob_epsilon: float = PROB_EPSILON,
+                 volume_epsilon: float = VOLUME_EPSILON, history: bool = True,
+                 previous_state: dict = None, fingerprints: dict = None,
+                 on_ingest: Callable[[list[dict]], None] = None,
+                 pages: Iterable[list[dict]] = None,
+                 history_baseline: dict = None) -> Optional[dict]:
+    """
+    전체 ETL: 전체 시장 수집 → 변환 → 직전 상태 조회 → Upsert → 이력 기록
+
+    데몬 모드에서는 메모리에 유지한 상태를 넘겨 DB 조회/쓰기를 줄임:
+        previous_state: id → 직전 레코드 (있으면 DB 직전 상태 조회 생략)
+        fingerprints: id → 직전 실행 레코드 지문 (내용이 같은 레코드는 Upsert 생략, 성공 시 갱신)
+        history_baseline: id → 마지막 이력 값 (있으면 DB 조회 생략, 이력 기록 후 갱신)
+    on_ingest: 새로 들어왔거나 제목이 바뀐 시장 목록을 받는 콜백 (예: TranslationQueue.put)
+    pages: 원본 페이지 소스 (기본: Polymarket API, --record/--replay는 replay.py 래퍼)
+    """
+    # 1~2. Polymarket API 페이지 단위 조회 + 변환 (원본 dict는 페이지 변환 후 바로 해제)
+    transformed_data = []
+    raw_count = 0
+    try:
+        for page in pages if pages is not None else iter_polymarket_pages():
+            raw_count += len(page)
+            transformed_data.extend(transform_data(page))
+        print(f"✓ API 데이터 조회 완료: {raw_count}건")
+    except requests.RequestException as e:
+        print(f"✗ API 요청 실패: {e}")
+        return None
+
+    print(f"✓ 데이터 변환 완료: {len(transformed_data)}건")
+
+    # 3. 새 시장 감지용 직전 상태 조회 (upsert로 덮어쓰기 전, 이번에 받은 id만 - 전체 테이블 스캔 없음)
+    need_previous = on_ingest is not None
+    previous = previous_state if need_previous else None
+    if need_previous and previous is None:
+        try:
+            previous = fetch_previous_state(client, [r.id for r in transformed_data])
+            print(f"✓ 직전 상태 조회 완료: {len(previous)}건")
+        except Exception as e:
+            print(f"⚠ 직전 상태 조회 실패 (새 시장 감지 생략): {e}")
+
+    # 이력 비교 기준: 시장별 마지막 이력 값 (poly_events 현재 행은 매 실행 덮어써지므로 쓰지 않음)
+    baseline = history_baseline if history else None
+    if history and baseline is None:
+        try:
+            baseline = fetch_history_baseline(client, [r.id for r in transformed_data])
+            print(f"✓ 이력 기준 조회 완료: {len(baseline)}건")
+        except Exception as e:
+            print(f"⚠ 이력 기준 조회 실패 (이력 기록 생략): {e}")
+
+    # 4. Supabase에 Upsert (지문이 있으면 바뀐 레코드만)
+    to_upsert = transformed_data
+    current_fingerprints = None
+    if fingerprints is not None:
+        current_fingerprints = {r.id: record_fingerprint(r) for r in transformed_data}
+        to_upsert = [r for r in transformed_data if fingerprints.get(r.id) != current_fingerprints[r.id]]
+        print(f"✓ 변경 감지: {len(to_upsert)}건 (직전 실행 대비)")
+
+    if to_upsert:
+        result = upsert_to_supabase(client, to_upsert)
+    else:
+        result = {"success": 0, "errors": []}
+
+    if current_fingerprints is not None and not result["errors"]:
+        fingerprints.clear()
+        fingerprints.update(current_fingerprints)
+
+    # 5. 움직인 시장만 이력 기록
+    if baseline is not None:
+        _record_history(client, transformed_data, baseline, prob_epsilon, volume_epsilon, result)
+
+    # 6. 새 시장/제목 변경 시장 → 번역 큐
+    _report_ingested(client, transformed_data, previous, on_ingest, result)
+
+    result["records"] = transformed_data
+    result["history_baseline"] = baseline
+    return result
+
+
+def run_hot_refresh(client: Client, top_n: int = HOT_TOP_N,
+                    ends_within_hours: int = HOT_ENDS_WITHIN_HOURS,
+                    snapshot: list[MarketRecord] = None,
+                    prob_epsilon: float = PROB_EPSILON,
+                    volume_epsilon: float = VOLUME_EPSILON,
+                    history: bool = True,
+                    on_ingest: Callable[[list[dict]], None] = None,
+                    history_baseline: dict = None) -> Optional[dict]:
+    """
+    hot 모드: hot 시장만 ID로 병렬 조회 → probs/volume/volume_24hr만 Upsert
+
+    history_baseline: id → 마지막 이력 값 (데몬이 유지, 없으면 hot 시장만 DB에서 조회)
+    """
+    # 1. hot 시장 선정 (직전 상태 포함)
+    hot_markets = select_hot_markets(client, top_n, ends_within_hours, snapshot)
+    print(f"✓ hot 시장 선정: {len(hot_markets)}건")
+    if not hot_markets:
+        return {"success": 0, "errors": [], "records": []}
+
+    # 2. ID로 병렬 조회
+    try:
+        raw_data = fetch_markets_by_ids([m.id for m in hot_markets])
+        print(f"✓ API 데이터 조회 완료: {len(raw_data)}건")
+    except requests.RequestException as e:
+        print(f"✗ API 요청 실패: {e}")
+        return None
+
+    # 3. 변환 (hot 시장만)
+    hot_ids = {m.id for m in hot_markets}
+    records = [r for r in transform_data(raw_data) if r.id in hot_ids]
+
+    # 4. Supabase에 Upsert (갱신 필드만)
+    result = upsert_to_supabase(client, records, columns=HOT_FIELDS)
+
+    # 5. 움직인 시장만 이력 기록 (기준: 마지막 이력 값, 10분마다 덮어써지는 현재 행이 아님)
+    if history:
+        baseline = history_baseline
+        if baseline is None:
+            try:
+                baseline = fetch_history_baseline(client, ids=[r.id for r in records])
+            except Exception as e:
+                print(f"⚠ 이력 기준 조회 실패 (이력 기록 생략): {e}")
+        if baseline is not None:
+            _record_history(client, records, baseline, prob_epsilon, volume_epsilon, result)
+
+    # 제목 변경 감지 기준은 직전 상태 (선정 단계에서 이미 조회됨)
+    previous = {m.id: m for m in hot_markets}
+
+    # 6. 제목이 바뀐 시장 → 번역 큐
+    _report_ingested(client, records, previous, on_ingest, result)
+
+    result["records"] = records
+    return result
+
+
+def _record_history(client: Client, records: list[MarketRecord], baseline: dict,
+                    prob_epsilon: float, volume_epsilon: float, result: dict):
+    """마지막 이력 대비 움직인 시장만 poly_price_history에 기록 (baseline 갱신), 오류는 result에 합침"""
+    history_rows = build_history_rows(records, baseline, prob_epsilon, volume_epsilon)
+    history_result = append_history(client, history_rows, baseline)
+    print(f"✓ 이력 기록: {history_result['success']}건 "
+          f"(전체 {len(records)}건 중 변화 있는 시장)")
+    result["errors"].extend(history_result["errors"])
+
+
+def run_replay(args):
+    """--replay: 기록한 페이지로 전체 ETL 실행 (운영 API/DB 대신 replay.py 싱크, 통계/태그 갱신 생략)"""
+    from replay import iter_recorded_pages, open_sink
+
+    print("=" * 50)
+    print(f"Polymarket ETL Pipeline (replay x{args.scale}) 시작")
+    print("=" * 50)
+
+    try:
+        sink = open_sink(args.sink)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return
+    print(f"✓ 싱크: {args.sink}")
+
+    start = time.perf_counter()
+    try:
+        result = run_full_etl(
+            sink,
+            prob_epsilon=args.prob_epsilon,
+            volume_epsilon=args.volume_epsilon,
+            history=not args.no_history,
+            pages=iter_recorded_pages(args.replay, scale=args.scale),
+        )
+    except (OSError, EOFError, json.JSONDecodeError) as e:
+        # 잘린 아카이브: gzip은 EOFError, 마지막 줄이 잘리면 JSONDecodeError
+        print(f"\n✗ 기록 파일 읽기 실패: {e}")
+        return
+    finally:
+        sink.close()
+    elapsed = time.perf_counter() - start
+
+    if result is None:
+        print("\n✗ 재생 실패: 기록 파일에서 시장을 읽지 못했습니다")
+        return
+    if not result["records"]:
+        print(f"⚠ 재생할 시장이 없습니다 (빈 기록 파일): {args.replay}")
+        return
+
+    print("-" * 50)
+    records = len(result["records"])
+    print(f"✓ 재생 완료: {records:,}건, {elapsed:.2f}초 ({records / elapsed if elapsed else 0:,.0f}건/초)")
+    print(f"✓ 싱크 쓰기: {sink.summary()}")
+    if result["errors"]:
+        print(f"⚠ 일부 오류 발생: {len(result['errors'])}건")
+        for err in result["errors"][:3]:
+            print(f"  - {err}")
+    print("=" * 50)
+
+
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='Polymarket ETL Pipeline')
+    parser.add_argument('--hot', action='store_true',
+                        help='hot 시장(거래량 상위/곧 마감)만 확률/거래량 갱신')
+    parser.add_argument('--top-n', type=int, default=HOT_TOP_N,
+                        help=f'hot 모드: volume_24hr 상위 시장 수 (기본: {HOT_TOP_N})')
+    parser.add_argument('--ends-within-hours', type=int, default=HOT_ENDS_WITHIN_HOURS,
+                        help=f'hot 모드: N시간 안에 마감하는 시장 포함 (기본: {HOT_ENDS_WITHIN_HOURS})')
+    parser.add_argument('--prob-epsilon', type=float, default=PROB_EPSILON,
+                        help=f'이력 기록 확률 변화 임계값 (기본: {PROB_EPSILON})')
+    parser.add_argument('--volume-epsilon', type=float, default=VOLUME_EPSILON,
+                        help=f'이력 기록 거래량 상대 변화 임계값 (기본: {VOLUME_EPSILON})')
+    parser.add_argument('--no-history', action='store_true',
+                        help='확률/거래량 이력 기록 생략')
+    parser.add_argument('--translate', action='store_true',
+                        help='새로 들어왔거나 제목이 바뀐 시장을 바로 번역 (OPENAI_API_KEY 필요)')
+    parser.add_argument('--exclude-sports', action='store_true',
+                        help='--translate: Sports 카테고리 제외')
+    parser.add_argument('--record', metavar='PATH', default=None,
+                        help='API 원본 페이지를 gzip JSONL로 기록 (전체 모드)')
+    parser.add_argument('--replay', metavar='PATH', default=None,
+                        help='API 대신 기록한 페이지로 실행 (운영 API/DB 사용 안 함)')
+    parser.add_argument('--scale', type=int, default=1,
+                        help='--replay: 복제 시장으로 N배 규모 재생 (기본: 1)')
+    parser.add_argument('--sink', default='null',
+                        help='--replay: 저장 대상 null | sqlite:PATH (기본: null)')
+    args = parser.parse_args()
+
+    if (args.record or args.replay) and args.hot:
+        parser.error('--record/--replay는 전체 모드에서만 사용할 수 있습니다')
+    if args.record and args.replay:
+        parser.error('--record와 --replay는 함께 사용할 수 없습니다')
+    if args.replay and args.translate:
+        parser.error('--replay는 --translate와 함께 사용할 수 없습니다')
+    if args.scale < 1:
+        parser.error('--scale은 1 이상이어야 합니다')
+
+    if args.replay:
+        run_replay(args)
+        return
+
+    mode = " (hot)" if args.hot else ""
     print("=" * 50)
-    print("Polymarket ETL Pipeline 시작")
+    print(f"Polymarket ETL Pipeline{mode} 시작")
     print("=" * 50)
 
     # 1. 환경 변수 로드
@@ -349,28 +781,79 @@ def main():
 
     # 2. Supabase 클라이언트 생성
     try:
+        from supabase import create_client
         client = create_client(supabase_url, supabase_key)
         print("✓ Supabase 클라이언트 연결 완료")
     except Exception as e:
         print(f"✗ Supabase 연결 실패: {e}")
         return
 
-    # 3. Polymarket API에서 데이터 가져오기
-    try:
-        raw_data = fetch_polymarket_data()
-        print(f"✓ API 데이터 조회 완료: {len(raw_data)}건")
-    except requests.RequestException as e:
-        print(f"✗ API 요청 실패: {e}")
-        return
+    # 3. 수집 직후 번역 큐 (--translate)
+    translation_queue = None
+    on_ingest = None
+    if args.translate:
+        from translate import Translator, TranslationQueue
+
+        translator = Translator(
+            workers=4,
+            overwrite=False,
+            exclude_sports=args.exclude_sports,
+            start_date='',
+            end_date='',
+        )
+        translation_queue = TranslationQueue(translator)
+
+        def on_ingest(events):
+            if args.exclude_sports:
+                events = [e for e in events if e.get("category") != "Sports"]
+            translation_queue.put(events)
+
+        print("✓ 번역 큐 시작")
+
+    # 4. 전체 ETL 또는 hot 갱신
+    if args.hot:
+        result = run_hot_refresh(
+            client,
+            top_n=args.top_n,
+            ends_within_hours=args.ends_within_hours,
+            prob_epsilon=args.prob_epsilon,
+            volume_epsilon=args.volume_epsilon,
+            history=not args.no_history,
+            on_ingest=on_ingest,
+        )
+    else:
+        pages = None
+        if args.record:
+            from replay import record_pages
+            pages = record_pages(iter_polymarket_pages(), args.record)
+        result = run_full_etl(
+            client,
+            prob_epsilon=args.prob_epsilon,
+            volume_epsilon=args.volume_epsilon,
+            history=not args.no_history,
+            on_ingest=on_ingest,
+            pages=pages,
+        )
 
-    # 4. 데이터 변환 (Cleaning)
-    transformed_data = transform_data(raw_data)
-    print(f"✓ 데이터 변환 완료: {len(transformed_data)}건")
+    # 5. 번역 큐 비우기
+    if translation_queue is not None:
+        translation_queue.close()
+        print(f"✓ 수집 직후 번역: {translation_queue.total_translated}건 "
+              f"(대기열 {translation_queue.total_queued}건)")
+
+    if result is None:
+        return
 
-    # 5. Supabase에 Upsert
-    result = upsert_to_supabase(client, transformed_data)
+    # 6. 대시보드 통계 + 태그 인덱스 갱신
+    # 통계는 hot 모드에서도 갱신 (마감 시각이 지난 시장이 10분 안에 빠지도록), 태그는 전체 모드만
+    if refresh_event_stats(client) is not None:
+        print("✓ 대시보드 통계 갱신 완료")
+    if not args.hot:
+        tag_count = refresh_tag_index(client)
+        if tag_count is not None:
+            print(f"✓ 태그 인덱스 갱신 완료: {tag_count:,}개 태그")
 
-    # 6. 결과 출력
+    # 7. 결과 출력
     print("-" * 50)
     if result["errors"]:
         print(f"⚠ 일부 오류 발생: {len(result['errors'])}건")
@@ -380,7 +863,7 @@ def main():
     print(f"✓ 저장 완료: {result['success']}건 Upsert 성공")
 
     print("=" * 50)
-    print("ETL Pipeline 완료")
+    print(f"ETL Pipeline{mode} 완료")
     print("=" * 50)
 
 
@@ -6,6 +6,10 @@ ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS volume_24hr NUMERIC;
 ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS category TEXT;
 ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS outcomes JSONB;
 ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS api_created_at TIMESTAMPTZ;
+ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS description TEXT;       -- 시장 규칙/설명 (Rules 텍스트)
+ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS description_ko TEXT;    -- 설명 한글 번역 (translate.py --descriptions)
+ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS title_ko_raw TEXT;      -- 후처리 전 LLM 번역 원본
+ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS postprocess_version TEXT; -- title_ko에 적용된 후처리 규칙 버전 (postprocess.RULES_VERSION)
 
 -- 2. 새 인덱스 추가
 CREATE INDEX IF NOT EXISTS idx_poly_events_volume_24hr ON poly_events(volume_24hr DESC);
@@ -21,3 +25,285 @@ CREATE POLICY "Allow public read access"
 ON poly_events FOR SELECT
 TO anon
 USING (true);
+
+-- 4. 번역 조회 경로 전용 부분/커버링 인덱스
+-- explain_check.py로 플래너가 아래 인덱스를 쓰는지 확인할 수 있음
+
+-- translate.py fetch_all_target_ids: end_date 범위 + title_ko IS NULL, ORDER BY end_date
+-- 미번역 행만 담기 때문에 번역이 진행될수록 인덱스가 작아짐
+CREATE INDEX IF NOT EXISTS idx_poly_events_untranslated_end_date
+    ON poly_events(end_date) INCLUDE (id, title, event_slug)
+    WHERE title_ko IS NULL;
+
+-- 같은 조회 + --exclude-sports (category <> 'Sports')
+CREATE INDEX IF NOT EXISTS idx_poly_events_untranslated_nonsports_end_date
+    ON poly_events(end_date) INCLUDE (id, title, event_slug)
+    WHERE title_ko IS NULL AND category <> 'Sports';
+
+-- translate.py _lookup_cache: title IN (...) AND title_ko IS NOT NULL ORDER BY end_date DESC
+-- (title, end_date DESC) 순서라 제목별 최신 번역을 정렬 없이 index-only scan으로 읽음
+CREATE INDEX IF NOT EXISTS idx_poly_events_translated_title
+    ON poly_events(title, end_date DESC) INCLUDE (title_ko, title_ko_raw)
+    WHERE title_ko IS NOT NULL;
+
+-- translate.py --descriptions: description_ko IS NULL인 설명, ORDER BY end_date
+CREATE INDEX IF NOT EXISTS idx_poly_events_untranslated_description_end_date
+    ON poly_events(end_date)
+    WHERE description_ko IS NULL AND description IS NOT NULL;
+
+ANALYZE poly_events;
+
+-- 5. 확률/거래량 이력 (append-only, main.py가 변화 있는 시장만 기록)
+CREATE TABLE IF NOT EXISTS poly_price_history (
+    market_id TEXT NOT NULL,                      -- poly_events.id
+    captured_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    probs_bp SMALLINT[],                          -- 확률 고정소수점 (basis point, 5500 = 55.00%)
+    volume BIGINT,                                -- 총 거래량 (USD, 정수)
+    volume_24hr BIGINT,                           -- 24시간 거래량 (USD, 정수)
+    PRIMARY KEY (market_id, captured_at)          -- 시장별 시계열 범위 조회용
+);
+
+ALTER TABLE poly_price_history ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow public read access" ON poly_price_history;
+CREATE POLICY "Allow public read access"
+ON poly_price_history FOR SELECT
+TO anon
+USING (true);
+
+-- 시장별 마지막 이력 값 (이력 비교 기준, append_history가 기록과 함께 갱신)
+-- poly_events 현재 행은 매 실행 덮어써지므로 기준으로 쓰면 조금씩 움직이는 시장이 기록되지 않음
+CREATE TABLE IF NOT EXISTS poly_price_latest (
+    market_id TEXT PRIMARY KEY,                   -- poly_events.id
+    captured_at TIMESTAMPTZ NOT NULL,             -- 마지막 이력 시각
+    probs_bp SMALLINT[],
+    volume BIGINT,
+    volume_24hr BIGINT
+);
+
+-- 기존 이력에서 시장별 마지막 값으로 채움 (PK 인덱스 역순 조회)
+INSERT INTO poly_price_latest (market_id, captured_at, probs_bp, volume, volume_24hr)
+SELECT DISTINCT ON (market_id) market_id, captured_at, probs_bp, volume, volume_24hr
+FROM poly_price_history
+ORDER BY market_id, captured_at DESC
+ON CONFLICT (market_id) DO NOTHING;
+
+-- 내부 비교 기준: anon 읽기 정책 없음 (service_role만 접근)
+ALTER TABLE poly_price_latest ENABLE ROW LEVEL SECURITY;
+
+-- 6. 번역 검증 결과 (translate.py가 실행마다 1행 기록, validate.py 규칙)
+-- 위반 항목만 재번역하므로 --overwrite 전체 재실행 없이 어떤 규칙이 얼마나 깨지는지 추적
+CREATE TABLE IF NOT EXISTS poly_translation_checks (
+    id BIGSERIAL PRIMARY KEY,
+    run_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    source TEXT NOT NULL,                         -- translate (translate.py 실행) / ingest (번역 큐)
+    rules_version TEXT,                           -- postprocess.RULES_VERSION
+    checked INTEGER NOT NULL,                     -- 검증한 새 번역 수
+    violations INTEGER NOT NULL,                  -- 1차 번역 위반 수 (재번역 대상)
+    fixed INTEGER NOT NULL,                       -- 재번역 후 통과
+    flagged INTEGER NOT NULL,                     -- 재번역 후에도 위반
+    rule_counts JSONB,                            -- 규칙별 1차 위반 수 {"honorific": 3, ...}
+    flagged_items JSONB                           -- [{"title", "title_ko", "rules"}, ...] (최대 200개)
+);
+
+CREATE INDEX IF NOT EXISTS idx_poly_translation_checks_run_at ON poly_translation_checks(run_at DESC);
+
+-- 내부 기록용: anon 읽기 정책 없음 (service_role만 접근)
+ALTER TABLE poly_translation_checks ENABLE ROW LEVEL SECURITY;
+
+-- 7. 관리자 대시보드 통계 (exact count 3회 → 통계 행 1개 조회)
+-- refresh_poly_events_stats()가 진행 중 시장을 한 번만 훑어 FILTER 집계로 모든 수치를 계산
+-- 호출: ETL(service_role)만 - main.py 실행 끝(hot 모드 포함, 마감 지난 시장이 10분 안에 빠지도록),
+--       translate.py 실행 끝, 번역 큐 drain/close 시 / 대시보드(admin.js, app.js)는 저장된 행만 읽음
+CREATE TABLE IF NOT EXISTS poly_events_stats (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),  -- 항상 1행
+    total INTEGER NOT NULL DEFAULT 0,             -- 진행 중 시장 (end_date >= now, closed = false)
+    translated INTEGER NOT NULL DEFAULT 0,        -- 그중 title_ko 있음
+    untranslated INTEGER NOT NULL DEFAULT 0,      -- 그중 title_ko 없음
+    hidden INTEGER NOT NULL DEFAULT 0,            -- end_date >= now, hidden = true
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION refresh_poly_events_stats()
+RETURNS poly_events_stats
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    INSERT INTO poly_events_stats (id, total, translated, untranslated, hidden, refreshed_at)
+    SELECT 1,
+           COUNT(*) FILTER (WHERE closed = false),
+           COUNT(*) FILTER (WHERE closed = false AND title_ko IS NOT NULL),
+           COUNT(*) FILTER (WHERE closed = false AND title_ko IS NULL),
+           COUNT(*) FILTER (WHERE hidden = true),
+           NOW()
+    FROM poly_events
+    WHERE end_date >= NOW()
+    ON CONFLICT (id) DO UPDATE SET
+        total = EXCLUDED.total,
+        translated = EXCLUDED.translated,
+        untranslated = EXCLUDED.untranslated,
+        hidden = EXCLUDED.hidden,
+        refreshed_at = EXCLUDED.refreshed_at
+    RETURNING *;
+$$;
+
+-- 갱신(전체 집계)은 ETL(service_role)만 - 브라우저에서 반복 호출해 전체 스캔을 일으키지 못하도록, 읽기는 누구나
+REVOKE EXECUTE ON FUNCTION refresh_poly_events_stats() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION refresh_poly_events_stats() TO service_role;
+
+INSERT INTO poly_events_stats (id) VALUES (1) ON CONFLICT (id) DO NOTHING;
+SELECT refresh_poly_events_stats();
+
+ALTER TABLE poly_events_stats ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow public read access" ON poly_events_stats;
+CREATE POLICY "Allow public read access"
+ON poly_events_stats FOR SELECT
+TO anon, authenticated
+USING (true);
+
+-- 8. 태그 차원 테이블 + 검색 토큰 인덱스 (키워드 검색/태그 필터를 클라이언트 전체 스캔 대신 인덱스 조회로)
+-- main.py normalize_tags가 tags를 라벨 문자열 목록으로 정규화해 저장하고,
+-- refresh_poly_tags()가 진행 중 시장의 태그별 시장 수를 집계한다 (main.py 전체 실행 끝, 데몬 full 실행 후)
+CREATE TABLE IF NOT EXISTS poly_tags (
+    id SERIAL PRIMARY KEY,                        -- 태그 정수 id (한 번 부여되면 유지)
+    name TEXT NOT NULL UNIQUE,                    -- 정규화된 라벨 (poly_events.tags 원소)
+    slug TEXT NOT NULL,                           -- URL용 (소문자, 영문/숫자/한글 외 '-')
+    market_count INTEGER NOT NULL DEFAULT 0,      -- 진행 중 시장 수 (end_date >= now, closed = false)
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_poly_tags_market_count ON poly_tags(market_count DESC) WHERE market_count > 0;
+
+-- 태그 필터 (tags && ARRAY[...]) - schema.sql과 같은 인덱스, 이전 스키마로 만든 테이블용
+CREATE INDEX IF NOT EXISTS idx_poly_events_tags ON poly_events USING GIN (tags);
+
+-- 키워드 검색: 제목 + 한글 제목 토큰 ('simple' 사전: 형태소 분석 없이 공백 단위, 한글/영문 공통)
+-- 조사가 붙은 한글("트럼프가")도 찾도록 검색어는 접두사 매칭(:*)으로 조회
+-- generated 식은 ALTER로 바꿀 수 없으므로, 이전 버전(카테고리 포함)으로 만든 컬럼은 지우고 다시 생성
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM pg_attrdef d
+        JOIN pg_attribute a ON a.attrelid = d.adrelid AND a.attnum = d.adnum
+        WHERE d.adrelid = 'poly_events'::regclass
+          AND a.attname = 'search_tsv'
+          AND pg_get_expr(d.adbin, d.adrelid) LIKE '%category%'
+    ) THEN
+        ALTER TABLE poly_events DROP COLUMN search_tsv;   -- idx_poly_events_search_tsv도 함께 삭제됨
+    END IF;
+END;
+$$;
+
+ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(title_ko, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_poly_events_search_tsv ON poly_events USING GIN (search_tsv);
+
+-- 관리자 페이지 부분 문자열 검색 (title/title_ko ilike '%검색어%') - 단어 중간/특수문자 검색어도 인덱스로 조회
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_poly_events_title_trgm ON poly_events USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_poly_events_title_ko_trgm ON poly_events USING GIN (title_ko gin_trgm_ops);
+
+CREATE OR REPLACE FUNCTION refresh_poly_tags()
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    active_tags INTEGER;
+BEGIN
+    WITH counts AS (
+        SELECT tag AS name, COUNT(*) AS market_count
+        FROM poly_events, unnest(tags) AS tag
+        WHERE end_date >= NOW() AND closed = false AND tag <> ''
+        GROUP BY tag
+    )
+    INSERT INTO poly_tags (name, slug, market_count, updated_at)
+    SELECT name,
+           trim(BOTH '-' FROM regexp_replace(lower(name), '[^a-z0-9가-힣]+', '-', 'g')),
+           market_count,
+           NOW()
+    FROM counts
+    ON CONFLICT (name) DO UPDATE SET
+        market_count = EXCLUDED.market_count,
+        updated_at = EXCLUDED.updated_at;
+    GET DIAGNOSTICS active_tags = ROW_COUNT;
+
+    -- 이번 집계에 없는 태그는 0으로 (id는 유지)
+    UPDATE poly_tags SET market_count = 0, updated_at = NOW()
+    WHERE market_count > 0 AND updated_at < NOW();
+
+    RETURN active_tags;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION refresh_poly_tags() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION refresh_poly_tags() TO service_role;
+
+-- 검색어(+ 태그) → 일치하는 진행 중 시장 id 배열 (app.js가 부분 문자열 비교 결과에 더함)
+-- q: 영문/숫자/한글 외 문자는 공백으로 바꾸고, 나눈 각 단어를 접두사 AND 조회
+-- tag_ids: poly_tags.id — 이름으로 바꿔 tags GIN 인덱스 조회, 하나라도 포함 (기존 클라이언트 필터와 동일)
+-- max_end: 클라이언트가 로드한 기간까지만 / 행 대신 배열 1개로 반환해 PostgREST max-rows(1000)에 잘리지 않음
+DROP FUNCTION IF EXISTS search_poly_events(TEXT, TEXT[], TIMESTAMPTZ);   -- 이전 버전 (tag_names)
+
+CREATE OR REPLACE FUNCTION search_poly_events(
+    q TEXT DEFAULT NULL,
+    tag_ids INTEGER[] DEFAULT NULL,
+    max_end TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS TEXT[]
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    WITH terms AS (
+        SELECT string_agg(term || ':*', ' & ') AS query
+        FROM regexp_split_to_table(
+            lower(regexp_replace(coalesce(q, ''), '[^[:alnum:]가-힣]+', ' ', 'g')), '\s+'
+        ) AS term
+        WHERE term <> ''
+    ),
+    tag_filter AS (
+        SELECT array_agg(name) AS names
+        FROM poly_tags
+        WHERE id = ANY(tag_ids)
+    )
+    SELECT coalesce(array_agg(e.id), '{}')
+    FROM poly_events e, terms, tag_filter
+    WHERE e.closed = false
+      AND e.end_date >= NOW()
+      AND (max_end IS NULL OR e.end_date <= max_end)
+      AND (terms.query IS NULL OR e.search_tsv @@ to_tsquery('simple', terms.query))
+      AND (coalesce(cardinality(tag_ids), 0) = 0 OR e.tags && coalesce(tag_filter.names, '{}'));
+$$;
+
+GRANT EXECUTE ON FUNCTION search_poly_events(TEXT, INTEGER[], TIMESTAMPTZ) TO anon, authenticated;
+
+SELECT refresh_poly_tags();
+ANALYZE poly_events;
+
+ALTER TABLE poly_tags ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow public read access" ON poly_tags;
+CREATE POLICY "Allow public read access"
+ON poly_tags FOR SELECT
+TO anon, authenticated
+USING (true);
+
+-- 9. 설명 청크 번역 저장소 (translate.py --descriptions)
+-- 시장 간 공통 문구(boilerplate) 청크를 내용 해시로 한 번만 번역하고, 다음 실행에서도 API 호출 없이 재사용
+CREATE TABLE IF NOT EXISTS poly_description_chunks (
+    content_hash TEXT PRIMARY KEY,                -- description.content_hash (공백 정규화 후 sha1)
+    source TEXT NOT NULL,                         -- 원문 청크
+    translated TEXT NOT NULL,                     -- 번역 (제목용 후처리 미적용)
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 내부 캐시: anon 읽기 정책 없음 (service_role만 접근)
+ALTER TABLE poly_description_chunks ENABLE ROW LEVEL SECURITY;
@@ -12,9 +12,16 @@
 사용법:
     from postprocess import postprocess_translation
     result = postprocess_translation(original_title, translated_title)
+
+규칙 버전:
+    RULES_VERSION은 아래 규칙 테이블 + PIPELINE_REVISION의 해시.
+    translate.py는 LLM 원본(title_ko_raw)과 함께 이 버전을 저장하고,
+    규칙이 바뀌면 backfill.py --postprocess가 이전 버전 행만 API 호출 없이 다시 후처리한다.
 """
 
 import re
+import json
+import hashlib
 
 
 # ============================================================
@@ -48,6 +55,15 @@ GLOSSARY_CORRECTIONS = {
 }
 
 
+# ============================================================
+# [2] 시간대 패턴 (원문의 "4AM ET", "11:59 PM ET" 등)
+# ============================================================
+
+TIMEZONE_PATTERN = re.compile(
+    r'\b([0-9]{1,2}(?::[0-9]{2})?(?:AM|PM)?)\s+(ET|PT|EST|PST|UTC|GMT)\b', re.IGNORECASE
+)
+
+
 # ============================================================
 # [3] "가질까" 문맥 교정 규칙
 # "have"를 문맥에 따라 적절한 동사로 교정
@@ -114,6 +130,31 @@ MONTH_MAP = {
 }
 
 
+# ============================================================
+# 규칙 버전
+# 규칙 테이블은 내용이 바뀌면 해시가 자동으로 바뀜.
+# 처리 함수 로직(정규식 패턴, 순서 등)을 바꿨을 때는 PIPELINE_REVISION을 올릴 것.
+# ============================================================
+
+PIPELINE_REVISION = 1
+
+
+def compute_rules_version() -> str:
+    """후처리 규칙 세트의 버전 해시 (테이블 순서도 결과에 영향을 주므로 정렬하지 않음)"""
+    rules = [
+        PIPELINE_REVISION,
+        GLOSSARY_CORRECTIONS,
+        HAVE_CORRECTIONS,
+        CULTURAL_CONTEXT,
+        MONTH_MAP,
+    ]
+    payload = json.dumps(rules, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+
+RULES_VERSION = compute_rules_version()
+
+
 # ============================================================
 # 개별 처리 함수들
 # ============================================================
@@ -128,8 +169,7 @@ def apply_glossary_corrections(text: str) -> str:
 
 def fix_timezone_consistency(original: str, translated: str) -> str:
     """[2] 시간대(ET, PT 등) 누락 시 자동 추가"""
-    timezone_pattern = r'\b([0-9]{1,2}(?::[0-9]{2})?(?:AM|PM)?)\s+(ET|PT|EST|PST|UTC|GMT)\b'
-    original_match = re.search(timezone_pattern, original, re.IGNORECASE)
+    original_match = TIMEZONE_PATTERN.search(original)
 
     if not original_match:
         return translated
@@ -0,0 +1,75 @@
+"""
+ETL 시장 레코드 모델
+
+전체 실행은 5만 건 이상의 시장을 메모리에 들고 있다 (변환 결과, 데몬 스냅샷, 직전 상태).
+시장마다 15키 dict를 만들면 키 해시 테이블과 중복 문자열 비용이 레코드 수만큼 쌓이므로:
+  - __slots__ dataclass로 필드만 저장 (인스턴스 __dict__ 없음)
+  - category / tags / outcomes처럼 반복되는 짧은 문자열은 sys.intern으로 공유
+  - Supabase upsert payload(dict)는 쓰기 직전 배치 단위로만 만든다 (to_payload)
+
+사용법:
+    from records import MarketRecord, MarketState
+    record = MarketRecord(id=..., title=..., ...)
+    record.to_payload()                 # 전체 컬럼 dict
+    record.to_payload(HOT_FIELDS)       # 일부 컬럼만 (hot 갱신)
+"""
+
+import sys
+from dataclasses import dataclass, fields
+from typing import Optional, Tuple
+
+
+def intern_strings(values) -> tuple:
+    """문자열 항목은 intern해 같은 값끼리 객체를 공유하는 tuple로 변환"""
+    if not values:
+        return ()
+    return tuple(sys.intern(v) if isinstance(v, str) else v for v in values)
+
+
+@dataclass(slots=True)
+class MarketRecord:
+    """poly_events 한 행 (transform_data 결과)"""
+    id: str
+    title: Optional[str]
+    slug: Optional[str]
+    event_slug: Optional[str]
+    end_date: Optional[str]
+    api_created_at: Optional[str]
+    volume: float
+    volume_24hr: float
+    probs: Optional[list]
+    outcomes: Optional[Tuple[str, ...]]
+    category: str
+    tags: Tuple[str, ...]
+    image_url: Optional[str]
+    closed: bool
+    description: Optional[str]
+
+    def __post_init__(self):
+        if isinstance(self.category, str):
+            self.category = sys.intern(self.category)
+        if isinstance(self.tags, (list, tuple)):
+            self.tags = intern_strings(self.tags)
+        if isinstance(self.outcomes, list):
+            self.outcomes = intern_strings(self.outcomes)
+
+    def to_payload(self, columns: Tuple[str, ...] = None) -> dict:
+        """Supabase upsert payload (columns 미지정 시 전체 컬럼)"""
+        payload = {name: getattr(self, name) for name in columns or MARKET_COLUMNS}
+        for name in ('outcomes', 'tags'):
+            if isinstance(payload.get(name), tuple):
+                payload[name] = list(payload[name])
+        return payload
+
+
+@dataclass(slots=True)
+class MarketState:
+    """이력 비교/hot 갱신용 직전 상태 (DB 조회 결과, MarketRecord와 같은 속성명)"""
+    id: str
+    title: Optional[str]
+    probs: Optional[list]
+    volume: float
+    volume_24hr: float
+
+
+MARKET_COLUMNS = tuple(f.name for f in fields(MarketRecord))
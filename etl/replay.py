@@ -0,0 +1,238 @@
+"""
+API 페이지 기록/재생 (오프라인 벤치마크/프로파일링)
+
+fetch → transform → upsert 전체 경로를 측정하려면 매번 Polymarket API와 운영 Supabase를 거쳐야 했다.
+  - 기록: main.py --record PATH 가 API 원본 페이지를 gzip JSONL(한 줄 = 한 페이지)로 저장
+  - 재생: main.py --replay PATH 가 아카이브를 한 줄씩 스트리밍 디코딩 (전체를 메모리에 올리지 않음)
+  - 확대: --scale N 이면 페이지마다 id/slug만 바꾼 복제 시장을 N-1개씩 더 만들어 N배 규모로 재생
+  - 저장소: --sink null (쓰기 버림) / sqlite:PATH (로컬 SQLite) — 운영 DB에는 쓰지 않음
+
+싱크는 파이프라인이 쓰는 Supabase 클라이언트 호출만 같은 모양으로 구현한다
+(table().select/eq/gt/in_/order/limit/upsert().execute() → .data). 그래서 run_full_etl,
+fetch_previous_state, append_history를 고치지 않고 그대로 재생할 수 있다.
+
+사용법:
+    python main.py --record pages.jsonl.gz                        # 평소처럼 실행 + 원본 기록
+    python main.py --replay pages.jsonl.gz                        # null 싱크로 재생
+    python main.py --replay pages.jsonl.gz --scale 10 --sink sqlite:/tmp/replay.db
+    python -m cProfile -s cumtime main.py --replay pages.jsonl.gz --scale 10
+"""
+
+import gzip
+import json
+from typing import Iterable, Iterator, List, Dict
+from records import MARKET_COLUMNS
+
+# 싱크 테이블 컬럼
+SINK_TABLES = {
+    'poly_events': MARKET_COLUMNS,
+    'poly_price_history': ('market_id', 'captured_at', 'probs_bp', 'volume', 'volume_24hr'),
+    'poly_price_latest': ('market_id', 'captured_at', 'probs_bp', 'volume', 'volume_24hr'),
+}
+SINK_PRIMARY_KEYS = {
+    'poly_events': ('id',),
+    'poly_price_history': ('market_id', 'captured_at'),
+    'poly_price_latest': ('market_id',),
+}
+JSON_COLUMNS = {'probs', 'outcomes', 'tags', 'probs_bp'}
+
+
+# =============================================================================
+# [1] 기록 / 재생
+# =============================================================================
+
+def record_pages(pages: Iterable[List[Dict]], path: str) -> Iterator[List[Dict]]:
+    """페이지를 그대로 흘려보내면서 gzip JSONL로 기록 (API 오류로 중단되면 받은 페이지까지만 남음)"""
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        for page in pages:
+            f.write(json.dumps(page, ensure_ascii=False, separators=(',', ':')))
+            f.write('\n')
+            yield page
+
+
+def scale_market(item: Dict, copy: int) -> Dict:
+    """복제 시장: id/conditionId/slug/event slug에 접미사를 붙여 별도 시장으로 저장되게 함"""
+    suffix = f"-x{copy}"
+    scaled = dict(item)
+    for key in ('id', 'conditionId', 'slug'):
+        if scaled.get(key):
+            scaled[key] = f"{scaled[key]}{suffix}"
+    events = item.get('events')
+    if events and isinstance(events, list) and isinstance(events[0], dict) and events[0].get('slug'):
+        scaled['events'] = [{**events[0], 'slug': f"{events[0]['slug']}{suffix}"}] + events[1:]
+    return scaled
+
+
+def iter_recorded_pages(path: str, scale: int = 1) -> Iterator[List[Dict]]:
+    """아카이브를 한 줄(페이지)씩 디코딩해 반환, scale > 1이면 페이지마다 복제 페이지를 이어서 반환"""
+    print(f"  기록 재생 중", end="", flush=True)
+
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            page = json.loads(line)
+            yield page
+            for copy in range(1, scale):
+                yield [scale_market(item, copy) for item in page]
+            print(".", end="", flush=True)
+
+    print()  # 줄바꿈
+
+
+# =============================================================================
+# [2] 싱크 (Supabase 클라이언트와 같은 호출 모양)
+# =============================================================================
+
+class SinkResponse:
+    def __init__(self, data: List[Dict]):
+        self.data = data
+
+
+class SinkQuery:
+    """table(name) 이후 체인 (select/eq/gt/in_/order/limit 또는 upsert → execute)"""
+
+    def __init__(self, sink, table: str):
+        self.sink = sink
+        self.table = table
+        self.columns = None
+        self.filters = []          # (column, op, value)
+        self.order_by = None
+        self.limit_count = None
+        self.rows = None
+        self.on_conflict = None
+        self.ignore_duplicates = False
+
+    def select(self, columns: str):
+        self.columns = [c.strip() for c in columns.split(',')]
+        return self
+
+    def eq(self, column: str, value):
+        self.filters.append((column, '=', value))
+        return self
+
+    def gt(self, column: str, value):
+        self.filters.append((column, '>', value))
+        return self
+
+    def in_(self, column: str, values: List):
+        self.filters.append((column, 'IN', list(values)))
+        return self
+
+    def order(self, column: str):
+        self.order_by = column
+        return self
+
+    def limit(self, count: int):
+        self.limit_count = count
+        return self
+
+    def upsert(self, rows: List[Dict], on_conflict: str = None, ignore_duplicates: bool = False):
+        self.rows = rows
+        self.on_conflict = on_conflict
+        self.ignore_duplicates = ignore_duplicates
+        return self
+
+    def execute(self) -> SinkResponse:
+        if self.rows is not None:
+            return SinkResponse(self.sink.write(self))
+        return SinkResponse(self.sink.read(self))
+
+
+class NullSink:
+    """쓰기는 버리고 조회는 빈 결과 (변환/직렬화 비용만 측정, 모든 시장이 새 시장으로 처리됨)"""
+
+    def __init__(self):
+        self.written = {}
+
+    def table(self, name: str) -> SinkQuery:
+        return SinkQuery(self, name)
+
+    def write(self, query: SinkQuery) -> List[Dict]:
+        self.written[query.table] = self.written.get(query.table, 0) + len(query.rows)
+        return query.rows
+
+    def read(self, query: SinkQuery) -> List[Dict]:
+        return []
+
+    def summary(self) -> str:
+        return ', '.join(f"{name} {count:,}건" for name, count in self.written.items()) or '쓰기 없음'
+
+    def close(self):
+        pass
+
+
+class SQLiteSink(NullSink):
+    """로컬 SQLite 파일에 실제로 upsert (재실행하면 직전 상태 조회/이력 비교까지 재현)"""
+
+    def __init__(self, path: str):
+        import sqlite3
+
+        super().__init__()
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        for name, columns in SINK_TABLES.items():
+            keys = ', '.join(SINK_PRIMARY_KEYS[name])
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {name} ({', '.join(columns)}, PRIMARY KEY ({keys}))")
+        self.conn.commit()
+
+    def write(self, query: SinkQuery) -> List[Dict]:
+        columns = [c for c in SINK_TABLES[query.table] if c in query.rows[0]]
+        keys = query.on_conflict.split(',') if query.on_conflict else list(SINK_PRIMARY_KEYS[query.table])
+        updates = [c for c in columns if c not in keys]
+        if query.ignore_duplicates or not updates:
+            conflict = "DO NOTHING"
+        else:
+            conflict = "DO UPDATE SET " + ', '.join(f"{c} = excluded.{c}" for c in updates)
+
+        sql = (f"INSERT INTO {query.table} ({', '.join(columns)}) "
+               f"VALUES ({', '.join('?' for _ in columns)}) "
+               f"ON CONFLICT ({', '.join(keys)}) {conflict}")
+        self.conn.executemany(sql, [
+            [json.dumps(row.get(c)) if c in JSON_COLUMNS else row.get(c) for c in columns]
+            for row in query.rows
+        ])
+        self.conn.commit()
+        return super().write(query)
+
+    def read(self, query: SinkQuery) -> List[Dict]:
+        columns = query.columns or list(SINK_TABLES[query.table])
+        sql = f"SELECT {', '.join(columns)} FROM {query.table}"
+        params = []
+        conditions = []
+        for column, op, value in query.filters:
+            if op == 'IN':
+                conditions.append(f"{column} IN ({', '.join('?' for _ in value) or 'NULL'})")
+                params.extend(value)
+            else:
+                conditions.append(f"{column} {op} ?")
+                params.append(value)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if query.order_by:
+            sql += f" ORDER BY {query.order_by}"
+        if query.limit_count:
+            sql += f" LIMIT {int(query.limit_count)}"
+
+        rows = []
+        for values in self.conn.execute(sql, params):
+            row = dict(zip(columns, values))
+            for c in JSON_COLUMNS.intersection(row):
+                row[c] = json.loads(row[c]) if row[c] is not None else None
+            rows.append(row)
+        return rows
+
+    def summary(self) -> str:
+        return f"{super().summary()} → {self.path}"
+
+    def close(self):
+        self.conn.close()
+
+
+def open_sink(spec: str) -> NullSink:
+    """--sink 값 → 싱크 (null / sqlite:PATH)"""
+    if spec == 'null':
+        return NullSink()
+    if spec.startswith('sqlite:') and spec[len('sqlite:'):]:
+        return SQLiteSink(spec[len('sqlite:'):])
+    raise ValueError(f"알 수 없는 싱크: {spec} (null 또는 sqlite:PATH)")
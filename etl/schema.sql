@@ -8,7 +8,13 @@ CREATE TABLE IF NOT EXISTS poly_events (
     -- 기본 정보
     id TEXT PRIMARY KEY,                          -- conditionId (고유 식별자)
     title TEXT NOT NULL,                          -- question (이벤트 제목)
+    title_ko TEXT,                                -- 한글 번역 제목 (translate.py, 후처리 적용)
+    title_ko_raw TEXT,                            -- 후처리 전 LLM 번역 원본
+    postprocess_version TEXT,                     -- title_ko에 적용된 후처리 규칙 버전 (postprocess.RULES_VERSION)
     slug TEXT,                                    -- slug (URL용 슬러그)
+    event_slug TEXT,                              -- 상위 이벤트 slug (같은 이벤트 시장 묶음/링크용)
+    description TEXT,                             -- 시장 규칙/설명 (Rules 텍스트)
+    description_ko TEXT,                          -- 설명 한글 번역 (translate.py --descriptions)
 
     -- 시간 정보
     end_date TIMESTAMPTZ,                         -- endDate (마감 일시)
@@ -21,6 +27,7 @@ CREATE TABLE IF NOT EXISTS poly_events (
     -- 결과/확률 정보
     probs JSONB,                                  -- outcomePrices (결과 확률 JSON)
     outcomes JSONB,                               -- outcomes (결과 옵션명: ["Yes", "No"])
+    closed BOOLEAN DEFAULT false,                 -- closed (정산 완료 여부)
 
     -- 분류 정보
     category TEXT,                                -- 카테고리 (Sports, Crypto, Politics 등)
@@ -29,6 +36,9 @@ CREATE TABLE IF NOT EXISTS poly_events (
     -- 미디어
     image_url TEXT,                               -- image (이미지 URL)
 
+    -- 관리
+    hidden BOOLEAN DEFAULT false,                 -- 관리자 숨김 (캘린더에서 제외)
+
     -- 메타 정보
     created_at TIMESTAMPTZ DEFAULT NOW(),         -- 레코드 생성 시간
     updated_at TIMESTAMPTZ DEFAULT NOW()          -- 레코드 수정 시간
@@ -58,3 +68,251 @@ CREATE INDEX IF NOT EXISTS idx_poly_events_volume_24hr ON poly_events(volume_24h
 CREATE INDEX IF NOT EXISTS idx_poly_events_category ON poly_events(category);
 CREATE INDEX IF NOT EXISTS idx_poly_events_api_created_at ON poly_events(api_created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_poly_events_tags ON poly_events USING GIN(tags);
+
+-- RLS (Row Level Security) 설정 - 웹에서 데이터 읽기 허용 (migration.sql 3번과 동일)
+ALTER TABLE poly_events ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow public read access" ON poly_events;
+CREATE POLICY "Allow public read access"
+ON poly_events FOR SELECT
+TO anon
+USING (true);
+
+-- 번역 조회 경로 전용 부분/커버링 인덱스 (migration.sql 4번과 동일, explain_check.py로 확인)
+-- translate.py fetch_all_target_ids: end_date 범위 + title_ko IS NULL, ORDER BY end_date
+CREATE INDEX IF NOT EXISTS idx_poly_events_untranslated_end_date
+    ON poly_events(end_date) INCLUDE (id, title, event_slug)
+    WHERE title_ko IS NULL;
+
+-- 같은 조회 + --exclude-sports (category <> 'Sports')
+CREATE INDEX IF NOT EXISTS idx_poly_events_untranslated_nonsports_end_date
+    ON poly_events(end_date) INCLUDE (id, title, event_slug)
+    WHERE title_ko IS NULL AND category <> 'Sports';
+
+-- translate.py _lookup_cache: title IN (...) AND title_ko IS NOT NULL ORDER BY end_date DESC
+CREATE INDEX IF NOT EXISTS idx_poly_events_translated_title
+    ON poly_events(title, end_date DESC) INCLUDE (title_ko, title_ko_raw)
+    WHERE title_ko IS NOT NULL;
+
+-- translate.py --descriptions: description_ko IS NULL인 설명, ORDER BY end_date
+CREATE INDEX IF NOT EXISTS idx_poly_events_untranslated_description_end_date
+    ON poly_events(end_date)
+    WHERE description_ko IS NULL AND description IS NOT NULL;
+
+-- 확률/거래량 이력 (append-only, main.py가 변화 있는 시장만 기록, migration.sql 5번과 동일)
+CREATE TABLE IF NOT EXISTS poly_price_history (
+    market_id TEXT NOT NULL,                      -- poly_events.id
+    captured_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    probs_bp SMALLINT[],                          -- 확률 고정소수점 (basis point, 5500 = 55.00%)
+    volume BIGINT,                                -- 총 거래량 (USD, 정수)
+    volume_24hr BIGINT,                           -- 24시간 거래량 (USD, 정수)
+    PRIMARY KEY (market_id, captured_at)          -- 시장별 시계열 범위 조회용
+);
+
+ALTER TABLE poly_price_history ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow public read access" ON poly_price_history;
+CREATE POLICY "Allow public read access"
+ON poly_price_history FOR SELECT
+TO anon
+USING (true);
+
+-- 시장별 마지막 이력 값 (이력 비교 기준, append_history가 기록과 함께 갱신)
+CREATE TABLE IF NOT EXISTS poly_price_latest (
+    market_id TEXT PRIMARY KEY,                   -- poly_events.id
+    captured_at TIMESTAMPTZ NOT NULL,             -- 마지막 이력 시각
+    probs_bp SMALLINT[],
+    volume BIGINT,
+    volume_24hr BIGINT
+);
+
+-- 내부 비교 기준: anon 읽기 정책 없음 (service_role만 접근)
+ALTER TABLE poly_price_latest ENABLE ROW LEVEL SECURITY;
+
+-- 번역 검증 결과 (translate.py가 실행마다 1행 기록, validate.py 규칙, migration.sql 6번과 동일)
+CREATE TABLE IF NOT EXISTS poly_translation_checks (
+    id BIGSERIAL PRIMARY KEY,
+    run_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    source TEXT NOT NULL,                         -- translate (translate.py 실행) / ingest (번역 큐)
+    rules_version TEXT,                           -- postprocess.RULES_VERSION
+    checked INTEGER NOT NULL,                     -- 검증한 새 번역 수
+    violations INTEGER NOT NULL,                  -- 1차 번역 위반 수 (재번역 대상)
+    fixed INTEGER NOT NULL,                       -- 재번역 후 통과
+    flagged INTEGER NOT NULL,                     -- 재번역 후에도 위반
+    rule_counts JSONB,                            -- 규칙별 1차 위반 수 {"honorific": 3, ...}
+    flagged_items JSONB                           -- [{"title", "title_ko", "rules"}, ...] (최대 200개)
+);
+
+CREATE INDEX IF NOT EXISTS idx_poly_translation_checks_run_at ON poly_translation_checks(run_at DESC);
+
+-- 내부 기록용: anon 읽기 정책 없음 (service_role만 접근)
+ALTER TABLE poly_translation_checks ENABLE ROW LEVEL SECURITY;
+
+-- 관리자 대시보드 통계 (migration.sql 7번과 동일)
+-- refresh_poly_events_stats()는 ETL(service_role)만 실행, 대시보드(admin.js, app.js)는 저장된 행만 읽음
+CREATE TABLE IF NOT EXISTS poly_events_stats (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),  -- 항상 1행
+    total INTEGER NOT NULL DEFAULT 0,             -- 진행 중 시장 (end_date >= now, closed = false)
+    translated INTEGER NOT NULL DEFAULT 0,        -- 그중 title_ko 있음
+    untranslated INTEGER NOT NULL DEFAULT 0,      -- 그중 title_ko 없음
+    hidden INTEGER NOT NULL DEFAULT 0,            -- end_date >= now, hidden = true
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION refresh_poly_events_stats()
+RETURNS poly_events_stats
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    INSERT INTO poly_events_stats (id, total, translated, untranslated, hidden, refreshed_at)
+    SELECT 1,
+           COUNT(*) FILTER (WHERE closed = false),
+           COUNT(*) FILTER (WHERE closed = false AND title_ko IS NOT NULL),
+           COUNT(*) FILTER (WHERE closed = false AND title_ko IS NULL),
+           COUNT(*) FILTER (WHERE hidden = true),
+           NOW()
+    FROM poly_events
+    WHERE end_date >= NOW()
+    ON CONFLICT (id) DO UPDATE SET
+        total = EXCLUDED.total,
+        translated = EXCLUDED.translated,
+        untranslated = EXCLUDED.untranslated,
+        hidden = EXCLUDED.hidden,
+        refreshed_at = EXCLUDED.refreshed_at
+    RETURNING *;
+$$;
+
+REVOKE EXECUTE ON FUNCTION refresh_poly_events_stats() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION refresh_poly_events_stats() TO service_role;
+
+INSERT INTO poly_events_stats (id) VALUES (1) ON CONFLICT (id) DO NOTHING;
+
+ALTER TABLE poly_events_stats ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow public read access" ON poly_events_stats;
+CREATE POLICY "Allow public read access"
+ON poly_events_stats FOR SELECT
+TO anon, authenticated
+USING (true);
+
+-- 태그 차원 테이블 + 검색 인덱스 (migration.sql 8번과 동일)
+-- main.py normalize_tags가 tags를 라벨 문자열 목록으로 정규화해 저장하고,
+-- refresh_poly_tags()가 진행 중 시장의 태그별 시장 수를 집계한다 (main.py 전체 실행 끝, 데몬 full 실행 후)
+CREATE TABLE IF NOT EXISTS poly_tags (
+    id SERIAL PRIMARY KEY,                        -- 태그 정수 id (한 번 부여되면 유지)
+    name TEXT NOT NULL UNIQUE,                    -- 정규화된 라벨 (poly_events.tags 원소)
+    slug TEXT NOT NULL,                           -- URL용 (소문자, 영문/숫자/한글 외 '-')
+    market_count INTEGER NOT NULL DEFAULT 0,      -- 진행 중 시장 수 (end_date >= now, closed = false)
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_poly_tags_market_count ON poly_tags(market_count DESC) WHERE market_count > 0;
+
+-- 키워드 검색: 제목 + 한글 제목 토큰 ('simple' 사전: 형태소 분석 없이 공백 단위, 한글/영문 공통)
+-- 조사가 붙은 한글("트럼프가")도 찾도록 검색어는 접두사 매칭(:*)으로 조회
+ALTER TABLE poly_events ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(title_ko, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_poly_events_search_tsv ON poly_events USING GIN (search_tsv);
+
+-- 관리자 페이지 부분 문자열 검색 (title/title_ko ilike '%검색어%') - 단어 중간/특수문자 검색어도 인덱스로 조회
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_poly_events_title_trgm ON poly_events USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_poly_events_title_ko_trgm ON poly_events USING GIN (title_ko gin_trgm_ops);
+
+CREATE OR REPLACE FUNCTION refresh_poly_tags()
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    active_tags INTEGER;
+BEGIN
+    WITH counts AS (
+        SELECT tag AS name, COUNT(*) AS market_count
+        FROM poly_events, unnest(tags) AS tag
+        WHERE end_date >= NOW() AND closed = false AND tag <> ''
+        GROUP BY tag
+    )
+    INSERT INTO poly_tags (name, slug, market_count, updated_at)
+    SELECT name,
+           trim(BOTH '-' FROM regexp_replace(lower(name), '[^a-z0-9가-힣]+', '-', 'g')),
+           market_count,
+           NOW()
+    FROM counts
+    ON CONFLICT (name) DO UPDATE SET
+        market_count = EXCLUDED.market_count,
+        updated_at = EXCLUDED.updated_at;
+    GET DIAGNOSTICS active_tags = ROW_COUNT;
+
+    -- 이번 집계에 없는 태그는 0으로 (id는 유지)
+    UPDATE poly_tags SET market_count = 0, updated_at = NOW()
+    WHERE market_count > 0 AND updated_at < NOW();
+
+    RETURN active_tags;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION refresh_poly_tags() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION refresh_poly_tags() TO service_role;
+
+-- 검색어(+ 태그) → 일치하는 진행 중 시장 id 배열 (app.js가 부분 문자열 비교 결과에 더함)
+-- q: 영문/숫자/한글 외 문자는 공백으로 바꾸고, 나눈 각 단어를 접두사 AND 조회
+-- tag_ids: poly_tags.id — 이름으로 바꿔 tags GIN 인덱스 조회, 하나라도 포함 (기존 클라이언트 필터와 동일)
+-- max_end: 클라이언트가 로드한 기간까지만 / 행 대신 배열 1개로 반환해 PostgREST max-rows(1000)에 잘리지 않음
+CREATE OR REPLACE FUNCTION search_poly_events(
+    q TEXT DEFAULT NULL,
+    tag_ids INTEGER[] DEFAULT NULL,
+    max_end TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS TEXT[]
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    WITH terms AS (
+        SELECT string_agg(term || ':*', ' & ') AS query
+        FROM regexp_split_to_table(
+            lower(regexp_replace(coalesce(q, ''), '[^[:alnum:]가-힣]+', ' ', 'g')), '\s+'
+        ) AS term
+        WHERE term <> ''
+    ),
+    tag_filter AS (
+        SELECT array_agg(name) AS names
+        FROM poly_tags
+        WHERE id = ANY(tag_ids)
+    )
+    SELECT coalesce(array_agg(e.id), '{}')
+    FROM poly_events e, terms, tag_filter
+    WHERE e.closed = false
+      AND e.end_date >= NOW()
+      AND (max_end IS NULL OR e.end_date <= max_end)
+      AND (terms.query IS NULL OR e.search_tsv @@ to_tsquery('simple', terms.query))
+      AND (coalesce(cardinality(tag_ids), 0) = 0 OR e.tags && coalesce(tag_filter.names, '{}'));
+$$;
+
+GRANT EXECUTE ON FUNCTION search_poly_events(TEXT, INTEGER[], TIMESTAMPTZ) TO anon, authenticated;
+
+ALTER TABLE poly_tags ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow public read access" ON poly_tags;
+CREATE POLICY "Allow public read access"
+ON poly_tags FOR SELECT
+TO anon, authenticated
+USING (true);
+
+-- 설명 청크 번역 저장소 (translate.py --descriptions, migration.sql 9번과 동일)
+-- 시장 간 공통 문구(boilerplate) 청크를 내용 해시로 한 번만 번역하고, 다음 실행에서도 API 호출 없이 재사용
+CREATE TABLE IF NOT EXISTS poly_description_chunks (
+    content_hash TEXT PRIMARY KEY,                -- description.content_hash (공백 정규화 후 sha1)
+    source TEXT NOT NULL,                         -- 원문 청크
+    translated TEXT NOT NULL,                     -- 번역 (제목용 후처리 미적용)
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 내부 캐시: anon 읽기 정책 없음 (service_role만 접근)
+ALTER TABLE poly_description_chunks ENABLE ROW LEVEL SECURITY;
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+관리자 대시보드 통계 (poly_events_stats) + 태그 인덱스 (poly_tags)
+
+대시보드가 열릴 때마다 poly_events 전체에 exact count를 3번씩 돌리던 것을,
+migration.sql 7번 섹션의 refresh_poly_events_stats()가 한 번의 집계로 계산해
+통계 행 1개(poly_events_stats)에 저장하고 대시보드는 그 행만 읽는다.
+갱신 시점: main.py 실행 끝(hot 모드 포함), translate.py 실행 끝, 번역 큐 drain/close, 데몬 전체/hot 실행 후
+갱신 함수는 service_role(ETL)만 실행할 수 있다 (브라우저에서 전체 집계를 반복 호출하지 못하도록).
+
+태그 필터 목록도 같은 방식: migration.sql 8번 섹션의 refresh_poly_tags()가 진행 중 시장의 tags를
+태그 차원 테이블(poly_tags: 정수 id + 시장 수)로 집계한다. 갱신 시점: main.py 전체 실행 끝, 데몬 full 실행 후
+
+사용법:
+    from stats import refresh_event_stats
+    refresh_event_stats(client)
+    refresh_tag_index(client)
+
+    # 현재 통계 + 태그 인덱스 갱신 + 출력
+    python stats.py
+"""
+
+import sys
+from typing import Optional, Dict
+
+
+def refresh_event_stats(client) -> Optional[Dict]:
+    """통계 행 재계산 (실패해도 ETL/번역 결과에는 영향 없음)"""
+    try:
+        response = client.rpc('refresh_poly_events_stats').execute()
+    except Exception as e:
+        print(f"⚠ 통계 갱신 실패: {e}")
+        return None
+
+    data = response.data
+    if isinstance(data, list):
+        data = data[0] if data else None
+    return data
+
+
+def refresh_tag_index(client) -> Optional[int]:
+    """태그 차원 테이블 재집계 → 시장이 1개 이상인 태그 수 (실패 시 None)"""
+    try:
+        response = client.rpc('refresh_poly_tags').execute()
+    except Exception as e:
+        print(f"⚠ 태그 인덱스 갱신 실패: {e}")
+        return None
+
+    data = response.data
+    if isinstance(data, list):
+        data = data[0] if data else None
+    return data
+
+
+def main():
+    from supabase import create_client
+    from main import load_env
+
+    try:
+        supabase_url, supabase_key = load_env()
+    except ValueError as e:
+        print(f"✗ 환경 변수 오류: {e}")
+        sys.exit(1)
+
+    client = create_client(supabase_url, supabase_key)
+    stats = refresh_event_stats(client)
+    if stats is None:
+        sys.exit(1)
+
+    print(f"  전체 {stats['total']:,} | 번역 {stats['translated']:,} | "
+          f"미번역 {stats['untranslated']:,} | 숨김 {stats['hidden']:,} "
+          f"({stats['refreshed_at'][:16]})")
+
+    tag_count = refresh_tag_index(client)
+    if tag_count is not None:
+        print(f"  태그 {tag_count:,}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+"""etl 모듈은 etl 디렉토리 기준 import (from records import ...)를 사용하므로 경로 추가"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
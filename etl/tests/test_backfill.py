@@ -0,0 +1,63 @@
+from backfill import compute_changes
+from postprocess import RULES_VERSION
+
+
+def test_hand_edited_title_is_left_untouched():
+    # 관리자 수기 수정: title_ko_raw / postprocess_version이 NULL
+    row = {
+        'id': 'm1',
+        'title': 'Will Bitcoin reach $100k by February 11?',
+        'title_ko': '비트코인 2월 11일까지 10만 달러 도달할까요?',
+        'title_ko_raw': None,
+        'postprocess_version': None,
+    }
+    assert compute_changes([row], recategorize=False, force_infer=False, postprocess=True) == []
+
+
+def test_raw_translation_is_reprocessed_and_stamped():
+    row = {
+        'id': 'm2',
+        'title': 'Will Bitcoin reach $100k by February 11?',
+        'title_ko': 'old',
+        'title_ko_raw': '비트코인이 February 11까지 10만 달러에 도달할까요?',
+        'postprocess_version': 'previous',
+    }
+    [change] = compute_changes([row], recategorize=False, force_infer=False, postprocess=True)
+    assert change['postprocess_version'] == RULES_VERSION
+    assert change['title_ko'] != 'old'
+
+    # 다시 돌리면 변경 없음
+    row.update(title_ko=change['title_ko'], postprocess_version=RULES_VERSION)
+    assert compute_changes([row], recategorize=False, force_infer=False, postprocess=True) == []
+
+
+def category_rows():
+    return [
+        {'id': 'a', 'title': 'Bitcoin above $100k on March 1?', 'category': 'Uncategorized', 'tags': []},
+        {'id': 'b', 'title': 'Bitcoin above $120k on March 1?', 'category': 'Finance', 'tags': []},  # API 카테고리
+        {'id': 'c', 'title': 'Ethereum above $5k on March 1?', 'category': 'Crypto', 'tags': []},
+    ]
+
+
+def run_recategorize(force_infer):
+    from backfill import run_backfill
+    from replay import SQLiteSink
+
+    sink = SQLiteSink(':memory:')
+    sink.table('poly_events').upsert(category_rows()).execute()
+    stats = run_backfill(sink, recategorize=True, force_infer=force_infer, postprocess=False,
+                         processes=2, dry_run=False)
+    categories = {r['id']: r['category'] for r in sink.table('poly_events').select('id, category').execute().data}
+    return stats, categories
+
+
+def test_recategorize_in_process_pool_only_fills_uncategorized():
+    stats, categories = run_recategorize(force_infer=False)
+    assert categories == {'a': 'Crypto', 'b': 'Finance', 'c': 'Crypto'}
+    assert stats == {'scanned': 3, 'changed': 1, 'written': 1}
+
+
+def test_force_infer_overwrites_api_category():
+    stats, categories = run_recategorize(force_infer=True)
+    assert categories == {'a': 'Crypto', 'b': 'Crypto', 'c': 'Crypto'}
+    assert stats['changed'] == 2
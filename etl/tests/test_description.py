@@ -0,0 +1,26 @@
+from description import (
+    split_description, reassemble_description, content_hash,
+    format_chunk_request, parse_chunk_response,
+)
+
+
+def test_chunk_request_round_trip_keeps_multiline_translations():
+    chunks = ['This market resolves to "Yes" if X happens.', 'Otherwise "No".']
+    request = format_chunk_request(chunks)
+    assert request.startswith('<<<1>>>\n')
+
+    response = '<<<1>>>\nX가 일어나면\n"Yes"로 정산된다.\n<<<2>>>\n그렇지 않으면 "No".'
+    assert parse_chunk_response(response, 2) == ['X가 일어나면 "Yes"로 정산된다.', '그렇지 않으면 "No".']
+
+
+def test_parse_chunk_response_marks_missing_chunks():
+    assert parse_chunk_response('<<<2>>>\n두 번째', 3) == [None, '두 번째', None]
+    assert parse_chunk_response('', 1) == [None]
+
+
+def test_reassemble_uses_chunk_hashes():
+    text = 'First line.\n\nSecond line.'
+    segments = split_description(text)
+    translations = {content_hash('First line.'): '첫 줄.', content_hash('Second line.'): '둘째 줄.'}
+    assert reassemble_description(segments, translations) == '첫 줄.\n\n둘째 줄.'
+    assert reassemble_description(segments, {}) is None
@@ -0,0 +1,53 @@
+from grouping import group_by_event, split_group, is_usable_template, TEMPLATE_SLOT
+from translate import Translator
+
+
+def make_events(count, slug='pres-2028'):
+    return [
+        {'id': str(i), 'title': f"Will Candidate{i} win the 2028 US Presidential Election?", 'event_slug': slug}
+        for i in range(count)
+    ]
+
+
+def test_is_usable_template_rejects_untranslated_templates():
+    template = f"Will {TEMPLATE_SLOT} win the 2028 US Presidential Election?"
+    assert not is_usable_template(template, template)          # 누락 시 돌아오는 영어 원문
+    assert not is_usable_template(template, f"{TEMPLATE_SLOT} wins the 2028 election?")
+    assert not is_usable_template(template, '2028 미국 대선 승자는?')  # 자리 없음
+    assert is_usable_template(template, f"{TEMPLATE_SLOT}이(가) 2028 미국 대선에서 승리할까?")
+
+
+def test_split_group_keeps_template_and_partitions_events():
+    groups, singles = group_by_event(make_events(250))
+    assert not singles and len(groups) == 1
+
+    chunks = split_group(groups[0], max_items=100)
+    assert [len(c['titles']) for c in chunks] == [99, 99, 52]
+    assert all(c['template'] == groups[0]['template'] for c in chunks)
+    assert all(len(c['fragments']) == len(c['titles']) == len(c['events']) for c in chunks)
+    assert sum(len(c['events']) for c in chunks) == 250
+
+
+class FakeTranslator(Translator):
+    """API 대신 정해진 응답을 돌려주는 번역기 (템플릿은 번역 누락 → 원문 반환)"""
+
+    def __init__(self):
+        self.requests = []
+
+    def translate_batch_raw(self, titles, prompt=None, header='번역할 제목들', system=None):
+        self.requests.append(list(titles))
+        if any(TEMPLATE_SLOT in t for t in titles):
+            return list(titles)
+        return [f"한글 {t}" for t in titles]
+
+
+def test_translate_groups_falls_back_when_template_comes_back_in_english():
+    groups, _ = group_by_event(make_events(3))
+    translator = FakeTranslator()
+
+    results = translator.translate_groups(groups)
+
+    assert set(results) == set(groups[0]['titles'])
+    # 영어 템플릿을 채우지 않고 제목 전체를 개별 번역
+    assert translator.requests[-1] == groups[0]['titles']
+    assert all(ko == f"한글 {title}" for title, ko in results.items())
@@ -0,0 +1,62 @@
+from history import build_history_rows, append_history, fetch_history_baseline, PROB_EPSILON
+from records import MarketState
+from replay import SQLiteSink
+
+
+def step(prob: float) -> MarketState:
+    return MarketState(id='m1', title=None, probs=[prob, 1 - prob], volume=1000.0, volume_24hr=100.0)
+
+
+def test_sub_epsilon_steps_accumulate_into_a_point():
+    sink = SQLiteSink(':memory:')
+    increment = PROB_EPSILON * 0.6          # 한 번에는 임계값 미만
+    recorded = []
+    for i in range(5):
+        # 실행마다 DB에서 기준을 다시 읽음 (poly_events 현재 값이 아니라 마지막 이력)
+        baseline = fetch_history_baseline(sink, ['m1'])
+        rows = build_history_rows([step(0.5 + increment * i)], baseline, captured_at=f"2026-01-01T00:0{i}:00")
+        append_history(sink, rows, baseline)
+        recorded.append(bool(rows))
+
+    # 첫 실행(기준 없음) + 누적 변화가 임계값을 넘는 2번째 스텝마다 기록
+    assert recorded == [True, False, True, False, True]
+    assert sink.written['poly_price_history'] == 3
+    assert fetch_history_baseline(sink, ids=['m1'])['m1'].probs[0] == round(0.5 + increment * 4, 4)
+
+
+def test_in_memory_baseline_is_updated_on_append():
+    sink = SQLiteSink(':memory:')
+    baseline = {}
+    increment = PROB_EPSILON * 0.6
+    points = 0
+    for i in range(4):
+        rows = build_history_rows([step(0.5 + increment * i)], baseline, captured_at=f"2026-01-01T00:0{i}:00")
+        append_history(sink, rows, baseline)
+        points += len(rows)
+    assert points == 2
+
+
+def test_fractional_volume_matches_rounded_baseline():
+    # 저장값은 달러 정수 → 같은 값(0.4, 14.757)을 다시 받아도 움직인 것이 아님
+    stored = MarketState(id='m1', title=None, probs=[0.5, 0.5], volume=0, volume_24hr=15)
+    live = MarketState(id='m1', title=None, probs=[0.5, 0.5], volume=0.4, volume_24hr=14.757)
+    assert build_history_rows([live], {'m1': stored}) == []
+
+
+def test_replaying_same_pages_twice_appends_no_duplicate_history():
+    import random
+    from bench_memory import synthetic_market
+    from main import run_full_etl
+
+    rng = random.Random(1)
+    page = [synthetic_market(i, rng) for i in range(6)]
+    for i, item in enumerate(page):
+        item['volume'] = f"{0.4 + i:.6f}"
+        item['volume24hr'] = 14.757 + i
+
+    sink = SQLiteSink(':memory:')
+    run_full_etl(sink, history=True, pages=iter([page]))
+    run_full_etl(sink, history=True, pages=iter([page]))
+
+    [(count,)] = sink.conn.execute("SELECT COUNT(*) FROM poly_price_history").fetchall()
+    assert count == 6
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone
+
+from main import select_hot_markets
+from records import MarketRecord
+
+
+def record(id, volume_24hr, ends_in_hours, closed=False):
+    end = datetime.now(timezone.utc) + timedelta(hours=ends_in_hours)
+    return MarketRecord(
+        id=id, title=f"Market {id}?", slug=id, event_slug=None,
+        end_date=end.isoformat().replace('+00:00', 'Z'), api_created_at=None,
+        volume=0.0, volume_24hr=volume_24hr, probs=['0.5', '0.5'], outcomes=('Yes', 'No'),
+        category='Politics', tags=(), image_url=None, closed=closed, description=None,
+    )
+
+
+def test_snapshot_selects_top_n_plus_ending_soon_without_db():
+    snapshot = [
+        record('top1', 900, ends_in_hours=24 * 30),
+        record('top2', 800, ends_in_hours=2),          # 상위 + 곧 마감 → 한 번만
+        record('mid', 500, ends_in_hours=24 * 30),     # 상위 N 밖
+        record('soon', 1, ends_in_hours=5),            # 거래량은 낮지만 곧 마감
+        record('closed', 10_000, ends_in_hours=24 * 30, closed=True),
+        record('ended', 10_000, ends_in_hours=-1),
+    ]
+    hot = select_hot_markets(client=None, top_n=2, ends_within_hours=24, snapshot=snapshot)
+    assert [m.id for m in hot] == ['top1', 'top2', 'soon']
+    # 반환 항목은 직전 값(이력 비교용)을 그대로 가짐
+    assert hot[0] is snapshot[0]
+
+
+def test_snapshot_tolerates_missing_end_date():
+    no_end = record('no-end', 100, ends_in_hours=1)
+    no_end.end_date = None
+    hot = select_hot_markets(client=None, top_n=5, ends_within_hours=24, snapshot=[no_end])
+    assert [m.id for m in hot] == ['no-end']
@@ -0,0 +1,98 @@
+from main import _report_ingested, STALE_TRANSLATION
+from records import MarketState
+from translate import TranslationQueue
+
+
+class RecordingClient:
+    """update().in_().execute() 호출과 rpc 호출만 기록하는 클라이언트"""
+
+    def __init__(self):
+        self.updates = []
+        self.rpcs = []
+        self.pending = None
+        self.data = []
+
+    def table(self, name):
+        return self
+
+    def update(self, values):
+        self.pending = values
+        return self
+
+    def in_(self, column, values):
+        self.updates.append((self.pending, list(values)))
+        return self
+
+    def rpc(self, name):
+        self.rpcs.append(name)
+        return self
+
+    def execute(self):
+        return self
+
+
+class Record:
+    def __init__(self, id, title):
+        self.id = id
+        self.title = title
+        self.event_slug = None
+        self.category = 'Politics'
+
+
+def state(id, title):
+    return MarketState(id=id, title=title, probs=None, volume=0, volume_24hr=0)
+
+
+def test_retitled_market_translation_is_cleared_before_enqueue():
+    client = RecordingClient()
+    enqueued = []
+    previous = {'m1': state('m1', 'Old title?'), 'm2': state('m2', 'Same?')}
+    records = [Record('m1', 'New title?'), Record('m2', 'Same?'), Record('m3', 'Brand new?')]
+    result = {'errors': []}
+
+    _report_ingested(client, records, previous, enqueued.extend, result)
+
+    # 새 시장(m3)은 지울 번역이 없고, 제목이 바뀐 m1만 초기화
+    assert client.updates == [(STALE_TRANSLATION, ['m1'])]
+    assert [e['id'] for e in enqueued] == ['m1', 'm3']
+
+
+class CountingTranslator:
+    def __init__(self):
+        self.supabase = RecordingClient()
+
+    def reset_stats(self):
+        pass
+
+    def translate_events(self, events):
+        return len(events)
+
+
+def test_queue_refreshes_stats_once_per_drain():
+    translator = CountingTranslator()
+    queue = TranslationQueue(translator, batch_size=10, flush_seconds=0.01)
+    queue.put([{'id': str(i), 'title': f"t{i}", 'event_slug': None} for i in range(35)])
+    queue.drain()
+    assert queue.total_translated == 35
+    assert translator.supabase.rpcs == ['refresh_poly_events_stats']
+
+    queue.drain()   # 새 번역 없음 → 갱신 안 함
+    queue.close()
+    assert translator.supabase.rpcs == ['refresh_poly_events_stats']
+
+
+def test_previous_state_is_looked_up_by_batch_ids_only():
+    from history import fetch_previous_state
+    from replay import SQLiteSink
+
+    sink = SQLiteSink(':memory:')
+    sink.table('poly_events').upsert([
+        {'id': 'm1', 'title': 'Open?', 'closed': False, 'volume': 1, 'volume_24hr': 1},
+        {'id': 'm2', 'title': 'Closed since last run?', 'closed': True, 'volume': 1, 'volume_24hr': 1},
+        {'id': 'm3', 'title': 'Not in this batch', 'closed': False, 'volume': 1, 'volume_24hr': 1},
+    ]).execute()
+
+    previous = fetch_previous_state(sink, ['m1', 'm2', 'new'])
+    # 마감된 시장도 직전 상태가 있으므로 새 시장이 아님, 배치 밖 시장은 조회하지 않음
+    assert set(previous) == {'m1', 'm2'}
+    assert previous['m2'].title == 'Closed since last run?'
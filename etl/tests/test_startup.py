@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+import pytest
+
+from bench_startup import ENTRY_POINTS, LAZY_MODULES, ETL_DIR
+
+
+@pytest.mark.parametrize('script', [script for script, _ in ENTRY_POINTS])
+def test_entry_module_import_does_not_load_lazy_modules(script):
+    # 이미 import된 모듈이 섞이지 않도록 새 인터프리터에서 확인
+    module = script[:-len('.py')]
+    code = (
+        f"import sys, {module}\n"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ETL_DIR, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == ''
@@ -0,0 +1,35 @@
+from stats import refresh_event_stats, refresh_tag_index
+
+
+class RpcClient:
+    """rpc(name).execute() → 정해진 data 또는 예외"""
+
+    def __init__(self, data=None, error=None):
+        self.data = data
+        self.error = error
+        self.calls = []
+
+    def rpc(self, name):
+        self.calls.append(name)
+        return self
+
+    def execute(self):
+        if self.error:
+            raise self.error
+        return self
+
+
+def test_refresh_failure_returns_none_without_raising(capsys):
+    client = RpcClient(error=RuntimeError('permission denied for function refresh_poly_events_stats'))
+    assert refresh_event_stats(client) is None
+    assert refresh_tag_index(client) is None
+    out = capsys.readouterr().out
+    assert '통계 갱신 실패' in out and '태그 인덱스 갱신 실패' in out
+
+
+def test_refresh_unwraps_single_row_responses():
+    row = {'total': 10, 'translated': 7, 'untranslated': 3, 'hidden': 1, 'refreshed_at': '2026-01-01T00:00:00'}
+    assert refresh_event_stats(RpcClient(data=[row])) == row
+    assert refresh_event_stats(RpcClient(data=row)) == row
+    assert refresh_event_stats(RpcClient(data=[])) is None
+    assert refresh_tag_index(RpcClient(data=42)) == 42
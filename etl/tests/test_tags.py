@@ -0,0 +1,26 @@
+import json
+
+from main import normalize_tags
+
+
+def test_json_string_of_labels():
+    assert normalize_tags(json.dumps(["Politics", "Elections"])) == ["Politics", "Elections"]
+
+
+def test_label_slug_objects_use_label_then_slug():
+    tags = [{"label": "Trump", "slug": "trump"}, {"slug": "us-election"}, {"id": 3}]
+    assert normalize_tags(tags) == ["Trump", "us-election"]
+
+
+def test_whitespace_and_empty_values_are_cleaned():
+    assert normalize_tags(["  Fed  Rates ", "", "   ", None, 42]) == ["Fed Rates"]
+
+
+def test_case_insensitive_duplicates_keep_first_spelling():
+    assert normalize_tags(["Crypto", "crypto", " CRYPTO", "Bitcoin"]) == ["Crypto", "Bitcoin"]
+
+
+def test_non_list_values_become_empty():
+    assert normalize_tags(None) == []
+    assert normalize_tags("not json") == []
+    assert normalize_tags(json.dumps({"label": "Sports"})) == []
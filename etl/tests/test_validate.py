@@ -0,0 +1,30 @@
+from validate import validate_translation, is_blocking
+
+
+def test_untranslated_and_template_slot_are_blocking():
+    title = 'Will Bitcoin reach $100k by February 11?'
+    assert validate_translation(title, title) == ['untranslated', 'english_month']
+    assert is_blocking(validate_translation('Will {X} win?', '{X}이(가) 이길까?'))
+    assert validate_translation(title, '비트코인 2월 11일까지 10만 달러 도달할까?') == []
+
+
+def test_honorific_endings():
+    title = 'Will Bitcoin reach $100k?'
+    for translated in ['비트코인 10만 달러 도달할까요?', '비트코인 10만 달러 도달하나요?',
+                       '비트코인이 최고가인가요?', '비트코인 10만 달러 도달합니까?', '비트코인 오르겠죠?']:
+        assert validate_translation(title, translated) == ['honorific'], translated
+
+
+def test_nouns_and_names_ending_in_gayo_or_jyo_are_not_honorific():
+    assert validate_translation('Who wins the K-pop Gayo Daejeon?', '2026 SBS 가요') == []
+    assert validate_translation('Will Seijo win?', '세이죠') == []
+    assert validate_translation('Top song on Gayo chart?', '가요 차트 1위는 누구일까?') == []
+
+
+def test_english_month_only_flags_dates():
+    assert validate_translation('By March 11?', 'March 11까지 발표할까?') == ['english_month']
+    assert validate_translation('By Feb 11?', 'Feb 11까지 발표할까?') == ['english_month']
+    # 이름·일반 단어로 쓰인 May/March
+    assert validate_translation('Will Theresa May return?', '테리사 May 복귀할까?') == []
+    assert validate_translation('Who wins March Madness?', 'March Madness 우승팀은?') == []
+    assert validate_translation('Will Brian May tour in 2026?', 'Brian May 2026년 투어할까?') == []
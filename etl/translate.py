@@ -17,32 +17,58 @@ Polymarket 시장 제목 한글 번역 (통합 스크립트)
 
     # 테스트 (1배치만)
     python translate.py --test
+
+    # 설명(description) 번역 (긴 텍스트 청크 분할 + 공통 문구 중복 제거)
+    python translate.py --descriptions --exclude-sports
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import time
+import queue
 import threading
 import argparse
-from typing import List, Dict
+from typing import List, Dict, Optional, TYPE_CHECKING
 from pathlib import Path
+from functools import lru_cache
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dotenv import load_dotenv
-from openai import OpenAI
-from supabase import create_client, Client
-from postprocess import postprocess_translation
+from postprocess import postprocess_translation, RULES_VERSION
+from description import (
+    split_description, pack_chunks, reassemble_description, content_hash,
+    format_chunk_request, parse_chunk_response,
+)
+from grouping import group_by_event, split_group, fill_template, needs_translation, is_usable_template
+from validate import validate_translation, is_blocking, RULE_LABELS
+from stats import refresh_event_stats
+
+# supabase/openai/dotenv는 import만 수백 ms라 실제로 쓰는 시점에 불러옴 (--help, 캐시 전용 경로 등)
+if TYPE_CHECKING:
+    from supabase import Client
 
-# .env 로드
 env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
 
 # 설정값
 BATCH_SIZE = 100
+DESCRIPTION_BATCH_SIZE = 50  # 설명 번역 DB 업데이트 배치 (시장 수)
+CHUNK_LOOKUP_SIZE = 200      # 청크 번역 저장소(poly_description_chunks) 조회 배치 (해시 수)
+QUEUE_FLUSH_SECONDS = 5      # 번역 큐: 배치가 덜 찼을 때 최대 대기 시간
+MAX_FLAGGED_RECORDED = 200   # 실행 기록(poly_translation_checks)에 남길 위반 항목 최대 수
 MAX_RETRIES = 3
 
 
-def load_translation_prompt() -> str:
+@lru_cache(maxsize=None)
+def load_env_file():
+    """.env 로드 (프로세스당 1회)"""
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=env_path)
+
+
+@lru_cache(maxsize=None)
+def get_translation_prompt() -> str:
     """translation_prompt.md에서 프롬프트 로드"""
     prompt_file = Path(__file__).parent / 'translation_prompt.md'
     try:
@@ -59,8 +85,6 @@ def load_translation_prompt() -> str:
 시간대는 반드시 유지 (4AM ET → 오전 4시 ET). 번호와 함께 출력하세요."""
 
 
-TRANSLATION_PROMPT = load_translation_prompt()
-
 SYSTEM_MESSAGE = """당신은 전문 번역가입니다.
 
 중요 규칙:
@@ -70,6 +94,50 @@ SYSTEM_MESSAGE = """당신은 전문 번역가입니다.
 4. "have"를 "가지다"로 직역 금지. 문맥에 맞게 "차지할까/선보일까/기록할까" 사용
 5. 모든 제목에서 일관성 유지"""
 
+DESCRIPTION_PROMPT = """당신은 Polymarket 예측 시장의 규칙(Rules) 설명을 한국어로 번역하는 전문가입니다.
+
+## 핵심 원칙
+
+1. **평서문 사용**: 규칙 설명은 "~한다", "~된다" 형태의 평서문으로 번역 (질문형 ❌, 존댓말 ❌)
+2. **정산 용어 통일**: resolve to "Yes" → "Yes"로 정산된다, resolution source → 정산 기준 출처
+3. **날짜/시간**: 월은 한글로 (February 11 → 2월 11일), 시간대는 원문 그대로 유지 (11:59 PM ET → 오후 11시 59분 ET)
+4. **고유명사/URL/숫자**: 원문 그대로 유지
+5. **구분자 유지**: 각 문단 앞의 <<<번호>>> 줄을 그대로 출력하고 그 아래에 번역을 쓰세요. 문단을 합치거나 나누지 마세요"""
+
+DESCRIPTION_SYSTEM_MESSAGE = """당신은 전문 번역가입니다.
+
+중요 규칙:
+1. 규칙 설명은 평서문(~한다, ~된다)으로 번역
+2. 절대 존댓말 사용 금지 (~합니다, ~됩니다 ❌)
+3. 시간대 표기 필수: ET, PT 등은 반드시 유지
+4. 입력의 <<<번호>>> 구분자 줄을 그대로 두고 그 아래에 번역 출력"""
+
+# 그룹 이벤트 템플릿 번역 규칙 (제목 번역 프롬프트 뒤에 추가)
+TEMPLATE_INSTRUCTION = """
+
+## 템플릿 번역 규칙
+
+- {X}는 시장마다 달라지는 자리(후보 이름, 가격 구간 등)입니다. {X}는 번역하지 말고 그대로 남기세요.
+- {X} 바로 뒤 조사는 받침에 따라 달라지므로 "이(가)", "을(를)", "은(는)", "와(과)", "(으)로" 형태로 쓰세요.
+  예: Will {X} win the 2028 US Presidential Election? → {X}이(가) 2028 미국 대선에서 승리할까?"""
+
+# 검증(validate.py)에 걸린 항목 재번역 시 제목 번역 프롬프트 뒤에 추가
+RETRY_INSTRUCTION = """
+
+## 재번역 규칙 (이전 번역이 아래 규칙을 어김)
+
+- 반드시 한국어로 번역하세요 (영어 원문 그대로 출력 ❌)
+- 반말 어미만 사용 (~할까?, ~될까?), 존댓말(~할까요?, ~될까요?) ❌
+- 원문의 시간대(ET, PT 등)는 그대로 유지 (4AM ET → 오전 4시 ET)
+- 월은 한글로 (February 11 → 2월 11일, Feb 11 → 2월 11일)"""
+
+FRAGMENT_PROMPT = """당신은 Polymarket 예측 시장 제목에 들어가는 고유명사/구절을 한국어로 번역하는 전문가입니다.
+
+1. 인물/팀/국가명은 한국에서 통용되는 표기로 (Donald Trump → 트럼프, Elon Musk → 일론 머스크)
+2. 숫자, 금액, 티커, 약어는 원문 그대로 유지
+3. 조사나 문장 부호를 덧붙이지 말고 항목 자체만 번역
+4. 번호와 함께 출력하세요"""
+
 
 def calculate_date_range(months: int, from_date: str = None, to_date: str = None):
     """날짜 범위 계산 (KST 기준)"""
@@ -87,10 +155,25 @@ def calculate_date_range(months: int, from_date: str = None, to_date: str = None
     return start, end
 
 
+def title_update(title: str, raw: str) -> Dict:
+    """
+    title_ko 업데이트 payload
+
+    LLM 원본(title_ko_raw)과 후처리 규칙 버전을 함께 저장해, 규칙이 바뀌면
+    backfill.py --postprocess로 API 호출 없이 다시 후처리할 수 있게 한다.
+    """
+    return {
+        'title_ko': postprocess_translation(title, raw),
+        'title_ko_raw': raw,
+        'postprocess_version': RULES_VERSION,
+    }
+
+
 class Translator:
     def __init__(self, workers: int, overwrite: bool, exclude_sports: bool,
                  start_date: str, end_date: str):
         # 환경 변수
+        load_env_file()
         self.openai_key = os.getenv('OPENAI_API_KEY')
         self.supabase_url = os.getenv('SUPABASE_URL')
         self.supabase_key = os.getenv('SUPABASE_KEY')
@@ -101,6 +184,8 @@ class Translator:
             sys.exit(1)
 
         # 클라이언트
+        from openai import OpenAI
+        from supabase import create_client
         self.openai_client = OpenAI(api_key=self.openai_key)
         self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
 
@@ -111,21 +196,96 @@ class Translator:
         self.start_date = start_date
         self.end_date = end_date
 
+        # 워커 스레드별 Supabase 클라이언트 (배치마다 새로 만들지 않고 재사용)
+        self._local = threading.local()
+
+        # 제목 → title_ko 업데이트 payload 메모리 캐시 (데몬 모드에서는 실행 간에도 유지)
+        self.memory_cache: Dict[str, Dict] = {}
+
         # 통계 (Thread-safe)
         self.lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """실행 단위 통계 초기화 (같은 인스턴스로 여러 번 run할 때)"""
         self.total_translated = 0
         self.total_batches = 0
         self.failed_batches = 0
         self.cache_hits = 0
 
-    def translate_batch(self, titles: List[str]) -> List[str]:
-        """OpenAI API로 배치 번역"""
+        # 번역 검증 (validate.py)
+        self.checked = 0
+        self.violations = 0
+        self.fixed = 0
+        self.rule_counts: Counter = Counter()
+        self.flagged_items: List[Dict] = []
+
+    def worker_client(self) -> Client:
+        """현재 워커 스레드의 Supabase 클라이언트 (스레드당 1개)"""
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            from supabase import create_client
+            client = create_client(self.supabase_url, self.supabase_key)
+            self._local.client = client
+        return client
+
+    def _remember(self, titles: List[str], payloads: List[Dict]):
+        """번역 결과를 메모리 캐시에 저장"""
+        with self.lock:
+            for title, payload in zip(titles, payloads):
+                if payload:
+                    self.memory_cache[title] = payload
+
+    def prune_memory_cache(self, titles) -> int:
+        """메모리 캐시를 주어진 제목만 남기고 정리 → 제거한 항목 수 (데몬: 직전 전체 ETL에 없는 시장 제거)"""
+        with self.lock:
+            stale = [t for t in self.memory_cache if t not in titles]
+            for title in stale:
+                del self.memory_cache[title]
+        return len(stale)
+
+    def translate_batch(self, titles: List[str], prompt: str = None,
+                        header: str = '번역할 제목들', system: str = None) -> List[str]:
+        """OpenAI API로 배치 번역 + 후처리 (prompt 미지정 시 제목 번역 프롬프트)"""
+        raw_results = self.translate_batch_raw(titles, prompt=prompt, header=header, system=system)
+        return [postprocess_translation(t, raw) for t, raw in zip(titles, raw_results)]
+
+    def translate_batch_raw(self, titles: List[str], prompt: str = None,
+                            header: str = '번역할 제목들', system: str = None) -> List[str]:
+        """OpenAI API로 배치 번역 (후처리 전 LLM 원본 출력, 누락 항목은 원문)"""
         if not titles:
             return []
 
         titles_text = "\n".join([f"{i+1}. {t}" for i, t in enumerate(titles)])
-        request_text = f"{TRANSLATION_PROMPT}\n\n번역할 제목들:\n{titles_text}"
+        request_text = f"{prompt or get_translation_prompt()}\n\n{header}:\n{titles_text}"
+
+        response_text = self.complete(request_text, system=system)
+        if response_text is None:
+            return []
+
+        # 번호 기반 파싱
+        translations_dict = {}
+        for line in response_text.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            if '. ' in line and line[0].isdigit():
+                parts = line.split('. ', 1)
+                try:
+                    num = int(parts[0])
+                    translations_dict[num] = parts[1]
+                except (ValueError, IndexError):
+                    continue
+
+        results = [translations_dict.get(i + 1, titles[i]) for i in range(len(titles))]
+
+        if len(results) != len(titles):
+            print(f"  ⚠️  번역 개수 불일치: {len(results)} != {len(titles)}")
 
+        return results
+
+    def complete(self, request_text: str, system: str = None) -> Optional[str]:
+        """OpenAI API 호출 (재시도 포함) → 응답 텍스트, 모두 실패하면 None"""
         for attempt in range(MAX_RETRIES):
             try:
                 completion = self.openai_client.chat.completions.create(
@@ -133,38 +293,11 @@ class Translator:
                     max_tokens=5000,
                     temperature=0.3,
                     messages=[
-                        {"role": "system", "content": SYSTEM_MESSAGE},
+                        {"role": "system", "content": system or SYSTEM_MESSAGE},
                         {"role": "user", "content": request_text}
                     ]
                 )
-
-                response_text = completion.choices[0].message.content.strip()
-
-                # 번호 기반 파싱
-                translations_dict = {}
-                for line in response_text.split('\n'):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if '. ' in line and line[0].isdigit():
-                        parts = line.split('. ', 1)
-                        try:
-                            num = int(parts[0])
-                            translations_dict[num] = parts[1]
-                        except (ValueError, IndexError):
-                            continue
-
-                # 후처리 파이프라인 적용
-                results = []
-                for i in range(len(titles)):
-                    translation = translations_dict.get(i + 1, titles[i])
-                    translation = postprocess_translation(titles[i], translation)
-                    results.append(translation)
-
-                if len(results) != len(titles):
-                    print(f"  ⚠️  번역 개수 불일치: {len(results)} != {len(titles)}")
-
-                return results
+                return completion.choices[0].message.content.strip()
 
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
@@ -172,37 +305,119 @@ class Translator:
                     time.sleep(2 ** attempt)
                 else:
                     print(f"  ❌ API 호출 실패: {e}")
-                    return []
-
-        return []
+                    return None
+
+        return None
+
+    def verify_translations(self, titles: List[str], payloads: List[Dict]) -> List[Optional[Dict]]:
+        """
+        새 번역 결과 규칙 검증 → 위반 항목만 한 번 재번역
+
+        재번역 후에도 위반이면 실행 기록(flagged_items)에 남기고,
+        쓸 수 없는 번역(BLOCKING_RULES)은 None으로 돌려줘 저장하지 않는다 (title_ko가 NULL로 남아 다음 실행 대상).
+        """
+        results = list(payloads)
+        failing = {}
+        for i, (title, payload) in enumerate(zip(titles, payloads)):
+            violations = validate_translation(title, payload['title_ko'])
+            if violations:
+                failing[i] = violations
+
+        fixed = 0
+        flagged = []
+        if failing:
+            retry_titles = [titles[i] for i in failing]
+            retry_results = self.translate_batch_raw(
+                retry_titles, prompt=get_translation_prompt() + RETRY_INSTRUCTION
+            )
+            retry_map = dict(zip(retry_titles, retry_results))
+
+            for i in failing:
+                title = titles[i]
+                payload = results[i]
+                if title in retry_map:
+                    payload = title_update(title, retry_map[title])
+                violations = validate_translation(title, payload['title_ko'])
+                if not violations:
+                    fixed += 1
+                else:
+                    flagged.append({'title': title, 'title_ko': payload['title_ko'], 'rules': violations})
+                results[i] = None if is_blocking(violations) else payload
+
+        with self.lock:
+            self.checked += len(titles)
+            self.violations += len(failing)
+            self.fixed += fixed
+            for violations in failing.values():
+                self.rule_counts.update(violations)
+            self.flagged_items.extend(flagged)
+
+        return results
+
+    def check_summary(self) -> Dict:
+        """실행 단위 검증 결과"""
+        return {
+            'checked': self.checked,
+            'violations': self.violations,
+            'fixed': self.fixed,
+            'flagged': len(self.flagged_items),
+            'rule_counts': dict(self.rule_counts),
+        }
+
+    def record_checks(self, source: str):
+        """검증 결과를 poly_translation_checks에 실행 단위로 기록 (실패해도 번역 결과에는 영향 없음)"""
+        if not self.checked:
+            return
+        row = {
+            **self.check_summary(),
+            'source': source,
+            'rules_version': RULES_VERSION,
+            'flagged_items': self.flagged_items[:MAX_FLAGGED_RECORDED],
+        }
+        try:
+            self.supabase.table('poly_translation_checks').insert(row).execute()
+        except Exception as e:
+            print(f"  ⚠️  검증 결과 기록 실패: {e}")
 
-    def _lookup_cache(self, client: Client, titles: List[str]) -> Dict[str, str]:
-        """DB에서 기존 번역 캐시 조회"""
+    def _lookup_cache(self, client: Client, titles: List[str]) -> Dict[str, Dict]:
+        """메모리 → DB 순서로 기존 번역 캐시 조회 → 제목별 title_ko 업데이트 payload"""
         cache = {}
-        unique_titles = list(set(titles))
+        with self.lock:
+            for title in set(titles):
+                if title in self.memory_cache:
+                    cache[title] = self.memory_cache[title]
+        unique_titles = [t for t in set(titles) if t not in cache]
 
         for i in range(0, len(unique_titles), 50):
             chunk = unique_titles[i:i + 50]
             response = client.table('poly_events') \
-                .select('title, title_ko') \
+                .select('title, title_ko, title_ko_raw') \
                 .in_('title', chunk) \
                 .not_.is_('title_ko', 'null') \
                 .order('end_date', desc=True) \
                 .execute()
             for row in response.data:
                 if row['title'] not in cache:
-                    cache[row['title']] = row['title_ko']
+                    if row.get('title_ko_raw'):
+                        # 원본이 있으면 현재 규칙 버전으로 다시 후처리
+                        cache[row['title']] = title_update(row['title'], row['title_ko_raw'])
+                    else:
+                        cache[row['title']] = {'title_ko': row['title_ko']}
 
+        with self.lock:
+            self.memory_cache.update(cache)
         return cache
 
-    def _update_with_retry(self, client: Client, ids: List[str], translations: List[str]) -> int:
-        """DB 업데이트 (재시도 포함)"""
+    def _update_with_retry(self, client: Client, ids: List[str], updates: List[Dict]) -> int:
+        """DB 업데이트 (재시도 포함, payload가 None인 항목은 건너뜀)"""
         success = 0
-        for eid, trans in zip(ids, translations):
+        for eid, payload in zip(ids, updates):
+            if not payload:
+                continue
             for attempt in range(MAX_RETRIES):
                 try:
                     client.table('poly_events') \
-                        .update({'title_ko': trans}) \
+                        .update(payload) \
                         .eq('id', eid) \
                         .execute()
                     success += 1
@@ -222,7 +437,7 @@ class Translator:
 
         while True:
             query = self.supabase.table('poly_events') \
-                .select('id, title') \
+                .select('id, title, event_slug') \
                 .gte('end_date', self.start_date) \
                 .lt('end_date', self.end_date)
 
@@ -247,7 +462,7 @@ class Translator:
 
     def process_batch(self, batch_num: int, batch_events: List[Dict], total_batches: int) -> Dict:
         """단일 배치 처리 (워커 스레드) - ID 기반"""
-        worker_supabase = create_client(self.supabase_url, self.supabase_key)
+        worker_supabase = self.worker_client()
 
         try:
             if not batch_events:
@@ -263,7 +478,7 @@ class Translator:
 
                 titles_to_translate = []
                 indices_to_translate = []
-                translations = [''] * len(batch_titles)
+                translations = [None] * len(batch_titles)
 
                 for i, title in enumerate(batch_titles):
                     if title in cache:
@@ -274,26 +489,117 @@ class Translator:
                         indices_to_translate.append(i)
 
                 if titles_to_translate:
-                    api_results = self.translate_batch(titles_to_translate)
-                    for idx, trans in zip(indices_to_translate, api_results):
-                        translations[idx] = trans
+                    api_results = self.translate_batch_raw(titles_to_translate)
+                    fresh = self.verify_translations(
+                        titles_to_translate[:len(api_results)],
+                        [title_update(t, raw) for t, raw in zip(titles_to_translate, api_results)],
+                    )
+                    for idx, payload in zip(indices_to_translate, fresh):
+                        translations[idx] = payload
             else:
-                translations = self.translate_batch(batch_titles)
-                if len(translations) != len(batch_titles):
-                    translations = translations[:len(batch_titles)]
+                api_results = self.translate_batch_raw(batch_titles)
+                translations = self.verify_translations(
+                    batch_titles[:len(api_results)],
+                    [title_update(t, raw) for t, raw in zip(batch_titles, api_results)],
+                )
 
+            self._remember(batch_titles, translations)
             success = self._update_with_retry(worker_supabase, batch_ids, translations)
+            self._record_batch(batch_num, total_batches, success, batch_cache_hits)
 
+            return {'success': True, 'count': success}
+
+        except Exception as e:
             with self.lock:
-                self.total_translated += success
-                self.total_batches += 1
-                self.cache_hits += batch_cache_hits
+                self.failed_batches += 1
+            print(f"  ❌ 배치 {batch_num} 실패: {e}")
+            return {'success': False, 'error': str(e)}
 
-            progress = (self.total_batches / total_batches) * 100
-            cache_info = f" (캐시: {batch_cache_hits})" if batch_cache_hits > 0 else ""
-            print(f"  ✅ 배치 {batch_num:3d}/{total_batches} | "
-                  f"{success:3d}개 번역{cache_info} | "
-                  f"누적: {self.total_translated:,}개 ({progress:.1f}%)")
+    def _record_batch(self, batch_num: int, total_batches: int, success: int,
+                      batch_cache_hits: int, extra_info: str = ''):
+        """배치 통계 누적 + 진행 상황 출력"""
+        with self.lock:
+            self.total_translated += success
+            self.total_batches += 1
+            self.cache_hits += batch_cache_hits
+
+        progress = (self.total_batches / total_batches) * 100
+        cache_info = f" (캐시: {batch_cache_hits})" if batch_cache_hits > 0 else ""
+        print(f"  ✅ 배치 {batch_num:3d}/{total_batches} | "
+              f"{success:3d}개 번역{cache_info}{extra_info} | "
+              f"누적: {self.total_translated:,}개 ({progress:.1f}%)")
+
+    def translate_groups(self, groups: List[Dict]) -> Dict[str, str]:
+        """
+        그룹 이벤트 번역: 공통 템플릿 1회 + 달라지는 구절만 번역
+
+        Returns:
+            원문 제목 → 후처리 전 번역 (템플릿 번역이 실패한 그룹은 제목 전체를 개별 번역)
+        """
+        if not groups:
+            return {}
+
+        templates = list(dict.fromkeys(g['template'] for g in groups))
+        fragments = list(dict.fromkeys(
+            f for g in groups for f in g['fragments'] if needs_translation(f)
+        ))
+
+        template_results = self.translate_batch_raw(templates, prompt=get_translation_prompt() + TEMPLATE_INSTRUCTION)
+        template_map = dict(zip(templates, template_results))
+        fragment_map = {}
+        if fragments:
+            fragment_results = self.translate_batch_raw(fragments, prompt=FRAGMENT_PROMPT, header='번역할 항목들')
+            fragment_map = dict(zip(fragments, fragment_results))
+
+        results = {}
+        fallback_titles = []
+        for group in groups:
+            template_ko = template_map.get(group['template'])
+            if not is_usable_template(group['template'], template_ko):
+                fallback_titles.extend(group['titles'])
+                continue
+
+            for title, fragment in zip(group['titles'], group['fragments']):
+                fragment_ko = fragment_map.get(fragment, fragment)
+                results[title] = fill_template(template_ko, fragment_ko)
+
+        if fallback_titles:
+            results.update(zip(fallback_titles, self.translate_batch_raw(fallback_titles)))
+
+        return results
+
+    def process_group_batch(self, batch_num: int, batch_groups: List[Dict], total_batches: int) -> Dict:
+        """그룹 이벤트 배치 처리 (워커 스레드) - 템플릿 + 구절 번역"""
+        worker_supabase = self.worker_client()
+
+        try:
+            batch_events = [e for g in batch_groups for e in g['events']]
+
+            # 캐시 조회 (덮어쓰기 모드가 아닐 때만)
+            translations = {}
+            batch_cache_hits = 0
+            if not self.overwrite:
+                translations = self._lookup_cache(worker_supabase, [e['title'] for e in batch_events])
+                batch_cache_hits = sum(1 for e in batch_events if e['title'] in translations)
+
+            # 캐시로 모두 채워지지 않은 그룹만 번역
+            pending = [g for g in batch_groups if any(t not in translations for t in g['titles'])]
+            fresh = {t: raw for t, raw in self.translate_groups(pending).items() if t not in translations}
+            fresh_titles = list(fresh)
+            payloads = self.verify_translations(fresh_titles, [title_update(t, fresh[t]) for t in fresh_titles])
+            for title, payload in zip(fresh_titles, payloads):
+                if payload:
+                    translations[title] = payload
+            self._remember(list(translations), list(translations.values()))
+
+            targets = [e for e in batch_events if e['title'] in translations]
+            success = self._update_with_retry(
+                worker_supabase,
+                [e['id'] for e in targets],
+                [translations[e['title']] for e in targets],
+            )
+            self._record_batch(batch_num, total_batches, success, batch_cache_hits,
+                               extra_info=f" [그룹 {len(batch_groups)}개]")
 
             return {'success': True, 'count': success}
 
@@ -303,8 +609,68 @@ class Translator:
             print(f"  ❌ 배치 {batch_num} 실패: {e}")
             return {'success': False, 'error': str(e)}
 
+    def plan_tasks(self, events: List[Dict]):
+        """
+        이벤트 목록 → 배치 작업 목록
+
+        event_slug 그룹은 템플릿 + 구절만 번역하는 그룹 배치로,
+        나머지는 BATCH_SIZE 단위 일반 배치로 분할.
+
+        Returns:
+            ([(처리 함수, 배치), ...], groups)
+        """
+        groups, singles = group_by_event(events)
+        # 구절이 BATCH_SIZE를 넘는 그룹은 요청 하나에 담기도록 분할 (같은 템플릿 공유)
+        groups = [chunk for group in groups for chunk in split_group(group, BATCH_SIZE)]
+
+        # 그룹 배치는 번역 항목 수 = 템플릿 1 + 구절 수 기준
+        tasks = []
+        group_batch, group_items = [], 0
+        for group in groups:
+            items = 1 + len(group['fragments'])
+            if group_batch and group_items + items > BATCH_SIZE:
+                tasks.append((self.process_group_batch, group_batch))
+                group_batch, group_items = [], 0
+            group_batch.append(group)
+            group_items += items
+        if group_batch:
+            tasks.append((self.process_group_batch, group_batch))
+
+        tasks.extend(
+            (self.process_batch, singles[i:i + BATCH_SIZE])
+            for i in range(0, len(singles), BATCH_SIZE)
+        )
+        return tasks, groups
+
+    def execute_tasks(self, tasks: List):
+        """배치 작업 병렬 처리 (ID 기반 배치)"""
+        total_batches = len(tasks)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(process, i + 1, batch, total_batches): i + 1
+                for i, (process, batch) in enumerate(tasks)
+            }
+            for future in as_completed(futures):
+                future.result()
+
+    def translate_events(self, events: List[Dict]) -> int:
+        """
+        조회 없이 주어진 이벤트({'id', 'title', 'event_slug'})만 번역 → 저장 성공 건수
+
+        TranslationQueue(수집 직후 번역)에서 사용.
+        """
+        if not events:
+            return 0
+        before = self.total_translated
+        tasks, _ = self.plan_tasks(events)
+        self.execute_tasks(tasks)
+        self.record_checks('ingest')
+        return self.total_translated - before
+
     def run(self, max_batches: int = None):
         """번역 실행"""
+        self.reset_stats()
+
         # 설정 출력
         print(f"\n{'='*55}")
         print(f"  Polymarket 제목 번역")
@@ -321,15 +687,17 @@ class Translator:
         all_events = self.fetch_all_target_ids()
         total_count = len(all_events)
 
-        # 배치 분할
-        batches = [all_events[i:i + BATCH_SIZE] for i in range(0, total_count, BATCH_SIZE)]
-        total_batches = len(batches)
+        tasks, groups = self.plan_tasks(all_events)
 
         if max_batches:
-            batches = batches[:max_batches]
-            total_batches = len(batches)
+            tasks = tasks[:max_batches]
+        total_batches = len(tasks)
 
+        grouped_count = sum(len(g['events']) for g in groups)
         print(f"  대상       : {total_count:,}개")
+        if groups:
+            group_events = len({g['event_slug'] for g in groups})
+            print(f"  그룹       : {group_events:,}개 이벤트 ({grouped_count:,}개 시장, 템플릿 번역)")
         print(f"  배치       : {total_batches}개")
         print(f"  예상 시간  : ~{(total_batches * 1.5 / self.workers / 60):.1f}분")
         print(f"{'='*55}\n")
@@ -339,15 +707,7 @@ class Translator:
             return
 
         start_time = time.time()
-
-        # 병렬 처리 (ID 기반 배치)
-        with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            futures = {
-                executor.submit(self.process_batch, i + 1, batch, total_batches): i + 1
-                for i, batch in enumerate(batches)
-            }
-            for future in as_completed(futures):
-                future.result()
+        self.execute_tasks(tasks)
 
         # 결과
         elapsed = time.time() - start_time
@@ -360,6 +720,326 @@ class Translator:
         print(f"  시간 : {elapsed/60:.1f}분")
         if self.total_translated > 0:
             print(f"  속도 : {self.total_translated/(elapsed/60):.0f}개/분")
+        self.print_checks()
+        print(f"{'='*55}\n")
+
+        self.record_checks('translate')
+        refresh_event_stats(self.supabase)
+
+    def print_checks(self):
+        """검증 결과 요약 출력"""
+        if not self.checked:
+            return
+        print(f"  검증 : {self.checked:,}개 중 위반 {self.violations}개 "
+              f"→ 재번역 통과 {self.fixed}개, 플래그 {len(self.flagged_items)}개")
+        for rule, count in self.rule_counts.most_common():
+            print(f"         - {RULE_LABELS[rule]}: {count}개")
+        for item in self.flagged_items[:5]:
+            rules = ', '.join(RULE_LABELS[r] for r in item['rules'])
+            print(f"         ⚠️  {item['title'][:40]} → {item['title_ko'][:30]} ({rules})")
+
+
+class TranslationQueue:
+    """
+    수집 직후 번역 큐 (translate-on-ingest)
+
+    main.py가 upsert하면서 새로 들어왔거나 제목이 바뀐 시장만 넣으면,
+    백그라운드 스레드가 BATCH_SIZE 단위(또는 QUEUE_FLUSH_SECONDS 대기 후)로 묶어
+    Translator.translate_events(캐시 → 그룹 템플릿 → 배치 번역)로 번역한다.
+    날짜 범위 title_ko IS NULL 전체 스캔 없이 새 시장이 수 분 안에 번역됨.
+
+    사용법:
+        queue = TranslationQueue(translator)
+        queue.put([{'id': ..., 'title': ..., 'event_slug': ...}, ...])
+        queue.drain()   # 넣은 항목이 모두 처리될 때까지 대기 (+ 통계 1회 갱신)
+        queue.close()
+    """
+
+    def __init__(self, translator: 'Translator', batch_size: int = BATCH_SIZE,
+                 flush_seconds: float = QUEUE_FLUSH_SECONDS):
+        self.translator = translator
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.queue: queue.Queue = queue.Queue()
+
+        # 통계 (total_queued는 put 호출 측, 나머지는 워커 스레드에서 갱신)
+        self.total_queued = 0
+        self.total_translated = 0
+        self.total_failed = 0
+        self.refreshed_translated = 0   # 마지막 통계 갱신 시점의 total_translated
+
+        self._thread = threading.Thread(target=self._worker, name='translation-queue', daemon=True)
+        self._thread.start()
+
+    def put(self, events: List[Dict]):
+        """번역 대상 추가 (중복 id는 워커에서 배치 단위로 제거)"""
+        for event in events:
+            self.queue.put(event)
+        self.total_queued += len(events)
+
+    def _next_batch(self) -> Optional[List[Dict]]:
+        """첫 항목이 오면 batch_size가 차거나 flush_seconds가 지날 때까지 모음 (None = 종료)"""
+        first = self.queue.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        deadline = time.time() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                event = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if event is None:
+                # 종료 신호는 현재 배치를 처리한 뒤 다시 받도록 되돌림
+                self.queue.task_done()
+                self.queue.put(None)
+                break
+            batch.append(event)
+        return batch
+
+    def _worker(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                self.queue.task_done()
+                return
+
+            # 같은 배치 안에서 id 중복 제거 (마지막 제목 우선)
+            events = list({e['id']: e for e in batch}.values())
+            try:
+                self.translator.reset_stats()
+                self.total_translated += self.translator.translate_events(events)
+            except Exception as e:
+                self.total_failed += len(events)
+                print(f"  ❌ 번역 큐 배치 실패 ({len(events)}건): {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def refresh_stats(self):
+        """마지막 갱신 이후 저장한 번역이 있으면 대시보드 통계 1회 갱신 (배치마다 갱신하지 않음)"""
+        translated = self.total_translated
+        if translated == self.refreshed_translated:
+            return
+        refresh_event_stats(self.translator.supabase)
+        self.refreshed_translated = translated
+
+    def drain(self):
+        """지금까지 넣은 항목이 모두 처리될 때까지 대기 후 통계 갱신"""
+        self.queue.join()
+        self.refresh_stats()
+
+    def close(self):
+        """남은 항목을 처리한 뒤 워커 종료 + 통계 갱신"""
+        self.queue.put(None)
+        self._thread.join()
+        self.refresh_stats()
+
+
+class DescriptionTranslator(Translator):
+    """
+    시장 설명(description) 번역
+
+    제목과 달리 긴 규칙 텍스트라 시장 단위가 아닌 청크 단위로 번역:
+      1. 대상 설명을 모두 청크로 분할하고 내용 해시로 중복 제거 (공통 문구 1회 번역)
+      2. 고유 청크를 토큰 예산 단위 요청으로 패킹해 병렬 번역
+      3. 시장별로 청크를 재조립해 description_ko 업데이트
+    청크 번역은 poly_description_chunks(content_hash → 번역)에 저장해 다음 실행에서도 재사용하고,
+    제목용 후처리(질문형/존댓말 교정)는 적용하지 않는다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 청크 번역 캐시: content_hash → 번역 (모든 시장이 공유, DB 저장소의 메모리 사본)
+        self.chunk_cache: Dict[str, str] = {}
+
+    def reset_stats(self):
+        super().reset_stats()
+        self.total_chunks = 0
+        self.unique_chunks = 0
+        self.stored_chunks = 0   # 저장소에서 불러온 청크 수
+
+    def fetch_all_target_ids(self) -> List[Dict]:
+        """번역 대상 이벤트의 id, description을 한번에 모두 조회"""
+        all_events = []
+        offset = 0
+        page_size = 1000
+
+        while True:
+            query = self.supabase.table('poly_events') \
+                .select('id, description') \
+                .gte('end_date', self.start_date) \
+                .lt('end_date', self.end_date) \
+                .not_.is_('description', 'null')
+
+            if not self.overwrite:
+                query = query.is_('description_ko', 'null')
+
+            if self.exclude_sports:
+                query = query.neq('category', 'Sports')
+
+            response = query.order('end_date').limit(page_size).offset(offset).execute()
+
+            if not response.data:
+                break
+
+            all_events.extend(e for e in response.data if e['description'].strip())
+            offset += page_size
+
+            if len(response.data) < page_size:
+                break
+
+        return all_events
+
+    def load_chunk_translations(self, hashes: List[str]) -> int:
+        """저장소에서 청크 번역 조회 → chunk_cache에 추가한 수 (실패 시 해당 청크는 새로 번역)"""
+        missing = [h for h in hashes if h not in self.chunk_cache]
+        loaded = 0
+        for i in range(0, len(missing), CHUNK_LOOKUP_SIZE):
+            try:
+                response = self.supabase.table('poly_description_chunks') \
+                    .select('content_hash, translated') \
+                    .in_('content_hash', missing[i:i + CHUNK_LOOKUP_SIZE]) \
+                    .execute()
+            except Exception as e:
+                print(f"  ⚠️  청크 저장소 조회 실패: {e}")
+                break
+            for row in response.data:
+                self.chunk_cache[row['content_hash']] = row['translated']
+                loaded += 1
+        return loaded
+
+    def save_chunk_translations(self, rows: List[Dict]):
+        """새로 번역한 청크를 저장소에 기록 (실패해도 이번 실행 결과에는 영향 없음)"""
+        if not rows:
+            return
+        try:
+            self.worker_client().table('poly_description_chunks') \
+                .upsert(rows, on_conflict='content_hash') \
+                .execute()
+        except Exception as e:
+            print(f"  ⚠️  청크 저장 실패: {e}")
+
+    def translate_chunk_request(self, request_num: int, chunks: List[str], total_requests: int) -> int:
+        """패킹된 청크 요청 하나 번역 (워커 스레드) → 캐시에 저장된 청크 수"""
+        request_text = f"{DESCRIPTION_PROMPT}\n\n번역할 문단들:\n{format_chunk_request(chunks)}"
+        response_text = self.complete(request_text, system=DESCRIPTION_SYSTEM_MESSAGE)
+        translations = parse_chunk_response(response_text or '', len(chunks))
+
+        rows = []
+        with self.lock:
+            for chunk, trans in zip(chunks, translations):
+                # 빠졌거나 원문 그대로 돌아온 청크는 번역 실패로 보고 캐시하지 않음
+                if trans and trans != chunk:
+                    self.chunk_cache[content_hash(chunk)] = trans
+                    rows.append({'content_hash': content_hash(chunk), 'source': chunk, 'translated': trans})
+            self.total_batches += 1
+            if len(rows) < len(chunks):
+                self.failed_batches += 1
+
+        self.save_chunk_translations(rows)
+        print(f"  ✅ 요청 {request_num:3d}/{total_requests} | "
+              f"{len(rows):3d}/{len(chunks)}개 청크 번역")
+        return len(rows)
+
+    def update_batch(self, batch_events: List[Dict], segments_list: List) -> int:
+        """재조립한 설명을 description_ko에 저장 (워커 스레드)"""
+        worker_supabase = self.worker_client()
+
+        ids = []
+        translations = []
+        for event, segments in zip(batch_events, segments_list):
+            translated = reassemble_description(segments, self.chunk_cache)
+            if translated is not None:
+                ids.append(event['id'])
+                translations.append(translated)
+
+        success = self._update_with_retry(
+            worker_supabase, ids, [{'description_ko': t} for t in translations]
+        )
+        with self.lock:
+            self.total_translated += success
+        return success
+
+    def run(self, max_batches: int = None):
+        """설명 번역 실행"""
+        self.reset_stats()
+
+        print(f"\n{'='*55}")
+        print(f"  Polymarket 설명 번역")
+        print(f"{'='*55}")
+        print(f"  기간       : {self.start_date[:10]} ~ {self.end_date[:10]}")
+        print(f"  워커       : {self.workers}개")
+        print(f"  모드       : {'덮어쓰기' if self.overwrite else '미번역만'}")
+        if self.exclude_sports:
+            print(f"  제외       : Sports")
+        print()
+
+        print("  ID 조회 중...")
+        all_events = self.fetch_all_target_ids()
+        if max_batches:
+            all_events = all_events[:max_batches * DESCRIPTION_BATCH_SIZE]
+        total_count = len(all_events)
+
+        # 1. 청크 분할 + 내용 해시 중복 제거 (순서 유지)
+        segments_list = [split_description(e['description']) for e in all_events]
+        unique = {}
+        for segments in segments_list:
+            for _, chunks in segments:
+                for chunk in chunks:
+                    self.total_chunks += 1
+                    unique.setdefault(content_hash(chunk), chunk)
+        self.unique_chunks = len(unique)
+
+        # 2. 저장소에 있는 청크 번역 불러오기 → 남은 청크만 토큰 예산 단위 패킹
+        self.stored_chunks = self.load_chunk_translations(list(unique))
+        requests = pack_chunks([c for h, c in unique.items() if h not in self.chunk_cache])
+
+        print(f"  대상       : {total_count:,}개")
+        print(f"  청크       : {self.total_chunks:,}개 (고유 {self.unique_chunks:,}개, 저장소 {self.stored_chunks:,}개)")
+        print(f"  요청       : {len(requests)}개")
+        print(f"{'='*55}\n")
+
+        if total_count == 0:
+            print("  ✅ 번역할 설명이 없습니다.\n")
+            return
+
+        start_time = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(self.translate_chunk_request, i + 1, chunk_request, len(requests))
+                for i, chunk_request in enumerate(requests)
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        # 3. 재조립 + DB 업데이트
+        print("\n  설명 저장 중...")
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(
+                    self.update_batch,
+                    all_events[i:i + DESCRIPTION_BATCH_SIZE],
+                    segments_list[i:i + DESCRIPTION_BATCH_SIZE],
+                )
+                for i in range(0, total_count, DESCRIPTION_BATCH_SIZE)
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        elapsed = time.time() - start_time
+        saved_pct = (1 - self.unique_chunks / self.total_chunks) * 100 if self.total_chunks else 0
+        print(f"\n{'='*55}")
+        print(f"  설명 번역 완료!")
+        print(f"  번역 : {self.total_translated:,}개")
+        print(f"  중복 : 청크 {saved_pct:.1f}% 재사용")
+        print(f"  실패 : {self.failed_batches}개 요청 (일부 청크 누락 시 해당 시장은 미저장)")
+        print(f"  시간 : {elapsed/60:.1f}분")
         print(f"{'='*55}\n")
 
 
@@ -374,6 +1054,7 @@ def main():
   python translate.py --overwrite -m 2             # 2개월 전체 재번역
   python translate.py --from 2026-02-11 --to 2026-04-11  # 날짜 지정
   python translate.py --test                       # 테스트 (1배치)
+  python translate.py --descriptions --exclude-sports  # 설명(description) 번역
         """)
 
     parser.add_argument('-w', '--workers', type=int, default=4,
@@ -392,6 +1073,8 @@ def main():
                         help='최대 배치 수 (테스트용)')
     parser.add_argument('--test', action='store_true',
                         help='테스트 모드 (1배치만)')
+    parser.add_argument('--descriptions', action='store_true',
+                        help='제목 대신 설명(description_ko) 번역')
 
     args = parser.parse_args()
 
@@ -407,7 +1090,8 @@ def main():
         args.months, args.from_date, args.to_date
     )
 
-    translator = Translator(
+    translator_class = DescriptionTranslator if args.descriptions else Translator
+    translator = translator_class(
         workers=args.workers,
         overwrite=args.overwrite,
         exclude_sports=args.exclude_sports,
@@ -0,0 +1,82 @@
+"""
+번역 결과 규칙 검증 모듈 (두 번째 LLM 호출 없이)
+
+translate_batch는 번역이 누락되면 영어 원문을 그대로 돌려주기 때문에,
+실패한 항목을 찾으려면 결과를 다시 읽어 보거나 --overwrite로 전체를 재번역해야 했다.
+SYSTEM_MESSAGE와 postprocess.py가 정한 규칙을 정규식으로 검사해 위반 항목만 골라낸다:
+  [1] untranslated  : 한글이 하나도 없음 (원문 그대로 반환 등)
+  [2] honorific     : 존댓말 어미 (~까요, ~나요, ~인가요, ~ㅂ니까, ~겠죠?)
+  [3] timezone      : 원문의 시간대(ET, PT ...)가 번역에서 빠짐
+  [4] english_month : 날짜로 쓰인 영어 월명이 남아 있음 (February 11, Feb 11)
+  [5] template_slot : 그룹 템플릿 자리({X})가 채워지지 않고 남음
+
+사용법:
+    from validate import validate_translation, BLOCKING_RULES
+    violations = validate_translation(original_title, title_ko)   # [] 이면 통과
+"""
+
+import re
+from typing import List
+from postprocess import MONTH_MAP, TIMEZONE_PATTERN
+from grouping import TEMPLATE_SLOT
+
+
+HANGUL = re.compile(r'[가-힣]')
+ENGLISH_WORD = re.compile(r'[A-Za-z]{3,}')
+
+# 문장 끝 존댓말 어미 (반말: ~할까?, ~될까?, ~인가?)
+# 가요/죠로 끝나는 명사·이름(가요대전, 세이죠)은 제외: ~가요는 ~인가요만, ~죠는 어간 + 물음표일 때만
+HONORIFIC_ENDING = re.compile(
+    r'(?:(까요|나요|인가요|니까)\s*[?？]?|(?:겠|이|하|었|았|였)죠\s*[?？])\s*$'
+)
+
+# 영어 월명: 뒤에 일(day) 숫자가 올 때만 (May/March가 이름·일반 단어로 쓰인 경우 제외)
+# postprocess는 전체 이름만 바꾸므로 약어도 검사
+MONTH_ABBREVIATIONS = ['Jan', 'Feb', 'Mar', 'Apr', 'Jun', 'Jul', 'Aug', 'Sep', 'Sept', 'Oct', 'Nov', 'Dec']
+# 한글 조사가 바로 붙어도 잡히도록 \b 대신 영문자 경계 사용 (February 11에, Feb 11까지)
+ENGLISH_MONTH = re.compile(
+    r'(?<![A-Za-z])(' + '|'.join(list(MONTH_MAP) + MONTH_ABBREVIATIONS) + r')\.?\s*\d{1,2}(?!\d)'
+)
+
+RULE_LABELS = {
+    'untranslated': '번역 안 됨',
+    'honorific': '존댓말 어미',
+    'timezone': '시간대 누락',
+    'english_month': '영어 월명',
+    'template_slot': '템플릿 자리 남음',
+}
+
+# 재번역 후에도 위반이면 저장하지 않는 규칙 (사용할 수 없는 번역)
+# 나머지 규칙은 표기 문제라 저장하고 실행 기록에만 남김
+BLOCKING_RULES = {'untranslated', 'template_slot'}
+
+
+def validate_translation(original: str, translated: str) -> List[str]:
+    """번역 결과 규칙 검사 → 위반 규칙 목록 (RULE_LABELS 키, 통과 시 빈 리스트)"""
+    if not translated:
+        return ['untranslated']
+
+    violations = []
+
+    if ENGLISH_WORD.search(original or '') and not HANGUL.search(translated):
+        violations.append('untranslated')
+
+    if HONORIFIC_ENDING.search(translated):
+        violations.append('honorific')
+
+    timezone_match = TIMEZONE_PATTERN.search(original or '')
+    if timezone_match and timezone_match.group(2).upper() not in translated.upper():
+        violations.append('timezone')
+
+    if ENGLISH_MONTH.search(translated):
+        violations.append('english_month')
+
+    if TEMPLATE_SLOT in translated:
+        violations.append('template_slot')
+
+    return violations
+
+
+def is_blocking(violations: List[str]) -> bool:
+    """저장하면 안 되는 위반인지"""
+    return any(v in BLOCKING_RULES for v in violations)